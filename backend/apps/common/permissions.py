@@ -282,8 +282,13 @@ def _get_purok_id(obj) -> int | None:
     Extract the purok_id from a profiling model instance.
     Supports Household, HouseholdSurvey, Family, Person, ProgramAvailed.
     Returns None if the purok cannot be determined.
+
+    Household has its own purok FK; Family, Person, and ProgramAvailed carry
+    a denormalized copy, so the common case needs no extra query. The
+    relation walks below only run for HouseholdSurvey and for rows created
+    before the copy was backfilled.
     """
-    # Direct purok FK (Household)
+    # Direct / denormalized purok FK (Household, Family, Person, ProgramAvailed)
     if hasattr(obj, 'purok_id') and obj.purok_id:
         return obj.purok_id
     # Via household (HouseholdSurvey)
@@ -321,8 +326,8 @@ def _resident_owns_object(user, obj) -> bool:
         household_id = household_survey.household_id
 
         # Check the object
-        if hasattr(obj, 'id') and hasattr(obj, 'purok_id'):
-            # obj is a Household
+        if hasattr(obj, 'household_number'):
+            # obj is a Household (Family/Person/Program also carry purok_id)
             return str(obj.id) == str(household_id)
         if hasattr(obj, 'household_id'):
             # obj is a HouseholdSurvey
@@ -3,6 +3,7 @@ from .models import (
     FormSchema, FieldMapping,
     Household, HouseholdSurvey, Family, Person,
     ProgramAvailed, NormalizedData, HouseholdChangeLog,
+    DataVersion, ExportJob, HouseholdMapLayer,
 )
 
 
@@ -26,7 +27,7 @@ class HouseholdAdmin(admin.ModelAdmin):
     list_display    = ('household_number', 'purok', 'status', 'is_deleted', 'created_at')
     list_filter     = ('status', 'is_deleted', 'purok')
     search_fields   = ('household_number', 'address')
-    readonly_fields = ('id', 'created_at', 'updated_at')
+    readonly_fields = ('id', 'geohash', 'created_at', 'updated_at')
 
     def get_queryset(self, request):
         # Show ALL records (including deleted) in admin
@@ -79,8 +80,30 @@ class ProgramAvailedAdmin(admin.ModelAdmin):
 @admin.register(NormalizedData)
 class NormalizedDataAdmin(admin.ModelAdmin):
     list_display  = ('canonical_name', 'canonical_value', 'raw_value', 'survey_year', 'level')
-    list_filter   = ('survey_year', 'level', 'canonical_name')
-    search_fields = ('canonical_name', 'canonical_value')
+    list_filter   = ('survey_year', 'level', 'concept')
+    search_fields = ('concept__text', 'value__text')
+
+
+@admin.register(DataVersion)
+class DataVersionAdmin(admin.ModelAdmin):
+    list_display    = ('key', 'version', 'updated_at')
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(HouseholdMapLayer)
+class HouseholdMapLayerAdmin(admin.ModelAdmin):
+    list_display    = ('zoom', 'overlay', 'data_version', 'built_at')
+    list_filter     = ('zoom',)
+    readonly_fields = ('data_version', 'built_at')
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display    = ('entity_type', 'fmt', 'status', 'progress', 'total_rows',
+                       'requested_by', 'created_at', 'expires_at')
+    list_filter     = ('status', 'entity_type', 'fmt')
+    readonly_fields = ('dedupe_key', 'data_version', 'created_at', 'started_at',
+                       'finished_at', 'watermark')
 
 
 @admin.register(HouseholdChangeLog)
@@ -0,0 +1,240 @@
+"""
+Profiling App — In-process Columnar Analytics
+══════════════════════════════════════════════════════════════════════════════
+
+Optional NumPy engine behind the QueryService dashboard aggregates
+(get_trend, get_concept_values, count_matching).
+
+WHY
+───
+Those aggregates are plain counts over
+(concept, value, survey_year, purok, household_survey). PostgreSQL answers
+each with an index scan, but a dashboard fires dozens of them per page.
+Holding the active NormalizedData rows of a year in a few integer arrays
+turns every count into a binary search + bincount taking milliseconds,
+with no database round trip.
+
+LAYOUT
+──────
+One YearPartition per survey year, loaded with a single query:
+
+  concept  int16   ConceptName id          ┐ rows sorted by (concept, value),
+  value    int32   ConceptValue id         │ so one concept — and one value
+  purok    int32   Purok id (-1 = none)    │ within it — is a contiguous
+  survey   int32   dense survey code       ┘ slice found by searchsorted()
+
+The ids are NormalizedData's own dictionary ids (ConceptName /
+ConceptValue), so no string ever enters the arrays. Surveys are re-coded
+0 … n_surveys-1 per partition; one survey = one household in a year
+(HouseholdSurvey is unique on household + survey_year).
+
+FRESHNESS
+─────────
+Each partition remembers the per-year DataVersion ('normalized@<year>')
+it was loaded at. The engine re-reads the global 'normalized' counter at
+most every VERSION_CHECK_SECONDS; only when that has moved does it read
+the per-year counters of the loaded years (one query) and drop the
+partitions whose year changed. Editing a 2025 survey leaves the other
+years' partitions loaded. Aggregates may lag a write by up to that many
+seconds.
+
+FALLBACK
+────────
+numpy is optional. Without it, or with settings.PROFILING_ANALYTICS_ENGINE
+= False, engine_enabled() is False and QueryService runs the same
+aggregates in SQL.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from .models import DataVersion, NormalizedData
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how stale an aggregate can be after a write
+VERSION_CHECK_SECONDS = 5
+
+# purok code for rows whose household has no purok
+NO_PUROK = -1
+
+
+def engine_enabled() -> bool:
+    """True when numpy is installed and the engine is not switched off."""
+    return NUMPY_AVAILABLE and getattr(settings, 'PROFILING_ANALYTICS_ENGINE', True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# One survey year
+# ─────────────────────────────────────────────────────────────────────────────
+
+class YearPartition:
+    """Integer-coded, (concept, value)-sorted active NormalizedData of one year."""
+
+    __slots__ = ('year', 'version', 'concept', 'value', 'purok', 'survey', 'n_surveys')
+
+    def __init__(self, year: int):
+        # Read before the rows: a write in between only makes the
+        # partition look stale, never fresh
+        self.version = DataVersion.current_years(DataVersion.Key.NORMALIZED, [year])[year]
+        rows = (
+            NormalizedData.objects
+            .filter(survey_year=year, is_active=True)
+            .values_list('concept_id', 'value_id', 'purok_id', 'household_survey_id')
+            .iterator(chunk_size=20000)
+        )
+        survey_codes = {}
+        concept, value, purok, survey = [], [], [], []
+        for concept_id, value_id, purok_id, survey_id in rows:
+            concept.append(concept_id)
+            value.append(value_id)
+            purok.append(NO_PUROK if purok_id is None else purok_id)
+            survey.append(survey_codes.setdefault(survey_id, len(survey_codes)))
+
+        concept = np.array(concept, dtype=np.int16)
+        value   = np.array(value, dtype=np.int32)
+        order   = np.lexsort((value, concept))
+
+        self.year      = year
+        self.concept   = concept[order]
+        self.value     = value[order]
+        self.purok     = np.array(purok, dtype=np.int32)[order]
+        self.survey    = np.array(survey, dtype=np.int32)[order]
+        self.n_surveys = len(survey_codes)
+
+    def __len__(self):
+        return len(self.concept)
+
+    def _rows(self, concept_id: int, value_id: int | None = None, purok_ids=None):
+        """(value, survey) arrays of the rows for a concept (and value), purok-scoped."""
+        lo = np.searchsorted(self.concept, concept_id, 'left')
+        hi = np.searchsorted(self.concept, concept_id, 'right')
+        if value_id is not None:
+            values = self.value[lo:hi]
+            lo, hi = (lo + np.searchsorted(values, value_id, 'left'),
+                      lo + np.searchsorted(values, value_id, 'right'))
+
+        value, survey = self.value[lo:hi], self.survey[lo:hi]
+        if purok_ids:
+            keep = np.isin(self.purok[lo:hi], purok_ids)
+            value, survey = value[keep], survey[keep]
+        return value, survey
+
+    def survey_mask(self, concept_id: int, value_id: int, purok_ids=None):
+        """Boolean array over survey codes: True where the survey has concept=value."""
+        _, survey = self._rows(concept_id, value_id, purok_ids)
+        mask = np.zeros(self.n_surveys, dtype=bool)
+        mask[survey] = True
+        return mask
+
+    def count(self, concept_id: int, value_id: int, purok_ids=None) -> int:
+        """Distinct surveys with concept=value."""
+        return int(np.count_nonzero(self.survey_mask(concept_id, value_id, purok_ids)))
+
+    def value_counts(self, concept_id: int, purok_ids=None) -> dict[int, int]:
+        """{value_id: distinct surveys} for one concept."""
+        value, survey = self._rows(concept_id, purok_ids=purok_ids)
+        if not len(value):
+            return {}
+        # De-duplicate (value, survey) pairs — multiselect and person-level
+        # rows repeat a value within one survey — then count per value.
+        pairs = np.unique(value.astype(np.int64) * self.n_surveys + survey)
+        ids, counts = np.unique(pairs // self.n_surveys, return_counts=True)
+        return dict(zip(ids.tolist(), counts.tolist()))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Engine (one per process)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ColumnarEngine:
+    """
+    Lazily loaded, version-checked cache of YearPartitions.
+
+    All methods take and return dictionary ids; QueryService does the
+    string ↔ id translation.
+    """
+
+    def __init__(self):
+        self._lock       = threading.Lock()
+        self._partitions = {}
+        self._version    = None
+        self._checked_at = float('-inf')
+
+    def _check_version(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < VERSION_CHECK_SECONDS:
+            return
+        version = DataVersion.current(DataVersion.Key.NORMALIZED)
+        if version == self._version:
+            self._checked_at = now
+            return
+
+        # Something changed — find out which years
+        loaded = dict(self._partitions)
+        current = DataVersion.current_years(DataVersion.Key.NORMALIZED, loaded)
+        with self._lock:
+            self._checked_at = now
+            self._version    = version
+            for year, part in loaded.items():
+                if current[year] != part.version and self._partitions.get(year) is part:
+                    del self._partitions[year]
+
+    def partition(self, year: int) -> YearPartition:
+        self._check_version()
+        part = self._partitions.get(year)
+        if part is None:
+            with self._lock:
+                part = self._partitions.get(year)
+                if part is None:
+                    started = time.monotonic()
+                    part = self._partitions[year] = YearPartition(year)
+                    logger.info(
+                        '[Analytics] Loaded %s: %d rows, %d surveys in %.0f ms',
+                        year, len(part), part.n_surveys,
+                        (time.monotonic() - started) * 1000,
+                    )
+        return part
+
+    def invalidate(self) -> None:
+        """Drop every partition now (e.g. after a bulk rebuild in this process)."""
+        with self._lock:
+            self._partitions = {}
+            self._version    = None
+            self._checked_at = float('-inf')
+
+    # ── Aggregates ────────────────────────────────────────────────────────────
+
+    def trend(self, concept_id: int, value_id: int, years, purok_ids=None) -> dict[int, int]:
+        """{year: distinct surveys with concept=value}."""
+        return {
+            year: self.partition(year).count(concept_id, value_id, purok_ids)
+            for year in years
+        }
+
+    def value_counts(self, concept_id: int, year: int, purok_ids=None) -> dict[int, int]:
+        """{value_id: distinct surveys} for one concept in one year."""
+        return self.partition(year).value_counts(concept_id, purok_ids)
+
+    def count_matching(self, conditions, year: int, purok_ids=None) -> int:
+        """
+        Surveys of `year` matching EVERY (concept_id, value_id) pair — one
+        boolean mask per condition, AND-ed together.
+        """
+        part = self.partition(year)
+        mask = np.ones(part.n_surveys, dtype=bool)
+        for concept_id, value_id in conditions:
+            mask &= part.survey_mask(concept_id, value_id, purok_ids)
+        return int(np.count_nonzero(mask))
+
+
+engine = ColumnarEngine()
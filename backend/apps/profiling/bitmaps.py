@@ -0,0 +1,300 @@
+"""
+Profiling App — Household Bitmap Index
+══════════════════════════════════════════════════════════════════════════════
+
+Boolean program targeting ("4Ps AND NOT electricity, OR senior-headed")
+evaluated with integer bit operations instead of nested SQL.
+
+STORAGE
+───────
+HouseholdBitmap holds one bitset per (survey_year, concept, value); bit N
+stands for the household whose HouseholdOrdinal is N. In Python a bitmap
+is a plain int (int.from_bytes(bits, 'little')), so AND / OR / NOT are
+`&`, `|` and `universe & ~x` on arbitrary-length integers.
+
+  where = {'and': [
+      {'concept': 'water_source', 'value': 'level_1'},
+      {'not': {'concept': 'electricity_source', 'value': 'grid'}},
+  ]}
+  evaluate(where, 2025)  → int bitmap   (one query: the bitmaps involved)
+  members(bitmap)        → [ordinal, ...]
+  → QueryService fetches only the matching Household rows
+
+EXPRESSIONS
+───────────
+  {'concept': name, 'value': value}     leaf — canonical name / value
+  {'and': [expr, ...]}                  all of
+  {'or':  [expr, ...]}                  any of
+  {'not': expr}                         surveyed that year, but not expr
+
+Unknown concepts or values evaluate to the empty set. Malformed input
+raises ValueError.
+
+MAINTENANCE
+───────────
+refresh_survey() is called by the normalization functions (signals.py)
+after they rewrite a survey's NormalizedData, and re-indexes that one
+household in SQL with get_bit()/set_bit() — no bitmap is ever read into
+Python to be updated, and only the bitmaps of pairs the survey held
+before or holds after the rewrite are touched. rebuild() regenerates whole years
+(manage.py rebuild_bitmaps).
+"""
+
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .models import (
+    ConceptName, ConceptValue, Household, HouseholdBitmap, HouseholdOrdinal,
+    HouseholdSurvey, NormalizedData,
+)
+
+# (concept_key, value_key) of the per-year "every surveyed household" bitmap
+UNIVERSE = (0, 0)
+
+# Guards against pathological request bodies
+MAX_PREDICATES = 64
+MAX_DEPTH      = 16
+
+# pg_advisory_xact_lock() namespace: one lock per survey year serializes
+# refreshes of the same year so their multi-row UPDATEs cannot deadlock
+_LOCK_NAMESPACE = 0x4842_0000
+
+
+def _lock_year(cursor, year: int) -> None:
+    cursor.execute('SELECT pg_advisory_xact_lock(%s)', [_LOCK_NAMESPACE + year])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Maintenance
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Pairs the survey held before the rewrite (old_*) or still has rows for
+# (active or not), minus the ones it still actively holds; plus the
+# universe once the survey is soft-deleted.
+_CLEAR_SQL = """
+UPDATE {bitmap}
+   SET bits = set_bit(bits, %(bit)s, 0)
+ WHERE survey_year = %(year)s
+   AND (concept_key, value_key) IN (
+        SELECT * FROM unnest(%(old_concepts)s::integer[], %(old_values)s::integer[])
+        UNION
+        SELECT concept_id, value_id
+          FROM {normalized}
+         WHERE household_survey_id = %(survey)s
+        EXCEPT
+        SELECT concept_id, value_id
+          FROM {normalized}
+         WHERE household_survey_id = %(survey)s AND is_active
+        UNION
+        SELECT 0, 0 WHERE %(deleted)s
+       )
+   AND octet_length(bits) > %(bit)s / 8
+   AND get_bit(bits, %(bit)s) = 1
+"""
+
+_SET_SQL = """
+INSERT INTO {bitmap} (survey_year, concept_key, value_key, bits)
+SELECT %(year)s, k.concept_id, k.value_id,
+       set_bit(decode(repeat('00', %(bit)s / 8 + 1), 'hex'), %(bit)s, 1)
+  FROM (
+        SELECT DISTINCT concept_id, value_id
+          FROM {normalized}
+         WHERE household_survey_id = %(survey)s AND is_active
+        UNION
+        SELECT 0, 0
+       ) AS k
+ON CONFLICT (survey_year, concept_key, value_key) DO UPDATE
+   SET bits = set_bit(
+         CASE WHEN octet_length({bitmap}.bits) > %(bit)s / 8
+              THEN {bitmap}.bits
+              ELSE {bitmap}.bits
+                   || decode(repeat('00', %(bit)s / 8 + 1 - octet_length({bitmap}.bits)), 'hex')
+         END,
+         %(bit)s, 1)
+ WHERE octet_length({bitmap}.bits) <= %(bit)s / 8
+    OR get_bit({bitmap}.bits, %(bit)s) = 0
+"""
+
+
+def refresh_survey(survey: HouseholdSurvey, old_pairs=()) -> None:
+    """
+    Re-index one survey after its NormalizedData rows were rewritten.
+
+    `old_pairs` are the (concept_id, value_id) pairs of the rows the rewrite
+    deleted. The household's bit is cleared in the bitmaps of pairs it no
+    longer actively holds among those and the survey's remaining rows, then
+    — unless the survey is soft-deleted — set in the bitmaps of the pairs
+    its active rows now hold. Bitmaps whose bit is already right are not
+    written, and bitmaps of unrelated pairs are not read.
+    """
+    ordinal, _ = HouseholdOrdinal.objects.get_or_create(household_id=survey.household_id)
+    tables = {
+        'bitmap':     HouseholdBitmap._meta.db_table,
+        'normalized': NormalizedData._meta.db_table,
+    }
+    old_pairs = list(old_pairs)
+    params = {
+        'bit':          ordinal.id,
+        'year':         survey.survey_year,
+        'survey':       survey.pk,
+        'deleted':      survey.is_deleted,
+        'old_concepts': [concept_id for concept_id, _ in old_pairs],
+        'old_values':   [value_id for _, value_id in old_pairs],
+    }
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        _lock_year(cursor, survey.survey_year)
+        cursor.execute(_CLEAR_SQL.format(**tables), params)
+        if not survey.is_deleted:
+            cursor.execute(_SET_SQL.format(**tables), params)
+
+
+def rebuild(year: int | None = None) -> dict[int, int]:
+    """
+    Regenerate every bitmap of one year (or of all surveyed years) from
+    NormalizedData. Returns {year: bitmaps written}.
+    """
+    missing = Household.all_objects.filter(ordinal__isnull=True).values_list('pk', flat=True)
+    HouseholdOrdinal.objects.bulk_create(
+        [HouseholdOrdinal(household_id=pk) for pk in missing], ignore_conflicts=True,
+    )
+
+    if year is None:
+        years = sorted(set(
+            HouseholdSurvey.all_objects.order_by().values_list('survey_year', flat=True)
+        ))
+    else:
+        years = [year]
+
+    written = {}
+    for survey_year in years:
+        buffers = defaultdict(bytearray)
+
+        def mark(key, bit):
+            buf = buffers[key]
+            if len(buf) <= bit >> 3:
+                buf.extend(bytes((bit >> 3) + 1 - len(buf)))
+            buf[bit >> 3] |= 1 << (bit & 7)
+
+        rows = (
+            NormalizedData.objects
+            .filter(survey_year=survey_year, is_active=True)
+            .values_list('concept_id', 'value_id', 'household_survey__household__ordinal__id')
+            .distinct()
+        )
+        for concept_id, value_id, bit in rows.iterator(chunk_size=20000):
+            mark((concept_id, value_id), bit)
+        surveyed = (
+            HouseholdSurvey.objects
+            .filter(survey_year=survey_year)
+            .values_list('household__ordinal__id', flat=True)
+        )
+        for bit in surveyed.iterator(chunk_size=20000):
+            mark(UNIVERSE, bit)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            _lock_year(cursor, survey_year)
+            HouseholdBitmap.objects.filter(survey_year=survey_year).delete()
+            HouseholdBitmap.objects.bulk_create([
+                HouseholdBitmap(
+                    survey_year=survey_year, concept_key=concept_key,
+                    value_key=value_key, bits=bytes(buf),
+                )
+                for (concept_key, value_key), buf in buffers.items()
+            ], batch_size=500)
+        written[survey_year] = len(buffers)
+
+    return written
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Evaluation
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _collect(expr, leaves: set, depth: int = 0) -> None:
+    """Validate an expression and gather its (name, value) leaves."""
+    if not isinstance(expr, dict) or len(expr) == 0:
+        raise ValueError('Each expression must be a non-empty object.')
+    if depth > MAX_DEPTH:
+        raise ValueError(f'Expressions may nest at most {MAX_DEPTH} levels deep.')
+
+    if 'concept' in expr:
+        name, value = expr.get('concept'), expr.get('value')
+        if not isinstance(name, str) or not isinstance(value, str) or set(expr) != {'concept', 'value'}:
+            raise ValueError('A predicate is {"concept": <name>, "value": <value>}.')
+        leaves.add((name, value))
+    elif set(expr) in ({'and'}, {'or'}):
+        operands = next(iter(expr.values()))
+        if not isinstance(operands, list):
+            raise ValueError('"and" / "or" take a list of expressions.')
+        for operand in operands:
+            _collect(operand, leaves, depth + 1)
+    elif set(expr) == {'not'}:
+        _collect(expr['not'], leaves, depth + 1)
+    else:
+        raise ValueError(f'Unknown operator(s): {", ".join(sorted(expr))}.')
+
+    if len(leaves) > MAX_PREDICATES:
+        raise ValueError(f'At most {MAX_PREDICATES} distinct predicates are allowed.')
+
+
+def evaluate(where: dict, year: int) -> int:
+    """
+    Evaluate a targeting expression for one survey year.
+
+    Loads only the bitmaps the expression mentions (plus the year's
+    universe) in a single query and returns the result as an int bitmap.
+    """
+    leaves = set()
+    _collect(where, leaves)
+
+    name_ids  = ConceptName.ids_for(name for name, _ in leaves)
+    value_ids = ConceptValue.ids_for(value for _, value in leaves)
+    keys = {
+        (name, value): (name_ids.get(name), value_ids.get(value))
+        for name, value in leaves
+    }
+
+    wanted = Q(concept_key=UNIVERSE[0], value_key=UNIVERSE[1])
+    for concept_key, value_key in keys.values():
+        if concept_key is not None and value_key is not None:
+            wanted |= Q(concept_key=concept_key, value_key=value_key)
+    bitmaps = {
+        (concept_key, value_key): int.from_bytes(bytes(bits), 'little')
+        for concept_key, value_key, bits in (
+            HouseholdBitmap.objects
+            .filter(wanted, survey_year=year)
+            .values_list('concept_key', 'value_key', 'bits')
+        )
+    }
+    universe = bitmaps.get(UNIVERSE, 0)
+
+    def run(expr) -> int:
+        if 'concept' in expr:
+            return bitmaps.get(keys[(expr['concept'], expr['value'])], 0)
+        if 'and' in expr:
+            result = universe
+            for operand in expr['and']:
+                result &= run(operand)
+            return result
+        if 'or' in expr:
+            result = 0
+            for operand in expr['or']:
+                result |= run(operand)
+            return result
+        return universe & ~run(expr['not'])
+
+    return run(where)
+
+
+def members(bitmap: int) -> list[int]:
+    """Ordinals (set bit positions) of a bitmap, ascending."""
+    ordinals = []
+    for index, byte in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')):
+        while byte:
+            low = byte & -byte
+            ordinals.append(index * 8 + low.bit_length() - 1)
+            byte ^= low
+    return ordinals
@@ -15,6 +15,15 @@ FILTER DESIGN PRINCIPLES
     filter methods — the underlying SQL uses @> (GIN index path).
   • Age filtering prefers `age_at_survey` (snapshot value) over
     date_of_birth arithmetic to keep results historically accurate.
+  • Filters on a related record (survey year, purok, household number of
+    the parent survey) are semi-joins: `WHERE EXISTS (SELECT 1 FROM parent
+    WHERE parent.id = row.parent_id AND ...)`. The outer query never joins
+    the parent chain, so list endpoints need no DISTINCT and the planner
+    can probe the parent's primary key per row.
+  • Purok can be given by number (purok=3), by PK (purok_id=7), or as a
+    PK list (purok_ids=7,8) — PKs skip the Purok table entirely.
+  • Family, Person, and ProgramAvailed carry denormalized purok /
+    survey_year columns, so their scope filters are single-table lookups.
 
 USAGE
 ─────
@@ -24,16 +33,56 @@ USAGE
   GET /persons/?gender=FEMALE&sector=PWD&age_min=18&age_max=59
   GET /persons/?educational_attainment=COLLEGE_GRAD&survey_year=2024
   GET /programs/?program_type=4PS&date_from=2024-01-01&date_to=2024-12-31
+  GET /persons/?purok_ids=7,8&survey_year=2024
 """
 
 from datetime import date
 
 import django_filters
-from django.db.models import Q
+from django.db.models import Exists, F, OuterRef, Q
+from rest_framework.filters import OrderingFilter
 
 from .models import Family, Household, HouseholdSurvey, Person, ProgramAvailed
 
 
+class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
+    """Comma-separated list of numbers (purok_ids=7,8,9)."""
+
+
+class NullsLastOrderingFilter(OrderingFilter):
+    """
+    DRF ?ordering= with NULLs sorted last in both directions, so
+    ?ordering=-latest_survey_year lists never-surveyed households at the
+    end instead of first (PostgreSQL's default for DESC).
+    """
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if not ordering:
+            return queryset
+        return queryset.order_by(*(
+            F(field[1:]).desc(nulls_last=True) if field.startswith('-') else F(field).asc(nulls_last=True)
+            for field in ordering
+        ))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Semi-join helpers
+# ─────────────────────────────────────────────────────────────────────────────
+# Each returns an Exists() that is true when the row's parent record matches
+# `lookups`. Lookups are expressed relative to the parent, e.g.
+# _family_exists(household_survey__household__household_number='X') on a Person
+# queryset.
+# all_objects is used on purpose: soft-delete visibility is decided by the
+# outer queryset's manager, not by the parent row.
+
+def _household_exists(**lookups) -> Exists:
+    return Exists(Household.all_objects.filter(pk=OuterRef('household_id'), **lookups))
+
+
+def _family_exists(**lookups) -> Exists:
+    return Exists(Family.all_objects.filter(pk=OuterRef('family_id'), **lookups))
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # HouseholdFilter
 # ─────────────────────────────────────────────────────────────────────────────
@@ -44,18 +93,27 @@ class HouseholdFilter(django_filters.FilterSet):
 
     Params:
         purok           — filter by Purok.number (e.g. purok=3)
-        purok_id        — filter by Purok PK (UUID)
+        purok_id        — filter by Purok PK
+        purok_ids       — comma-separated Purok PKs (7,8)
         status          — ACTIVE | VACANT | ABANDONED | DEMOLISHED
         surveyed_year   — has at least one survey in this year
-        has_surveys     — true/false: has any surveys at all
+        has_surveys     — true/false: has any (active) surveys at all
+
+    Both survey filters read the Household.latest_survey_year /
+    survey_count columns HouseholdService maintains.
     """
     purok         = django_filters.NumberFilter(
         field_name='purok__number',
         label='Purok number',
     )
-    purok_id      = django_filters.UUIDFilter(
-        field_name='purok',
-        label='Purok UUID',
+    purok_id      = django_filters.NumberFilter(
+        field_name='purok_id',
+        label='Purok PK',
+    )
+    purok_ids     = NumberInFilter(
+        field_name='purok_id',
+        lookup_expr='in',
+        label='Purok PKs (comma-separated: 7,8)',
     )
     status        = django_filters.ChoiceFilter(choices=Household.Status.choices)
     surveyed_year = django_filters.NumberFilter(
@@ -72,14 +130,15 @@ class HouseholdFilter(django_filters.FilterSet):
         fields = ['status']
 
     def filter_surveyed_year(self, qs, name, value):
-        return qs.filter(
-            surveys__survey_year=value,
-            surveys__is_deleted=False,
-        ).distinct()
+        # Households whose latest survey is older cannot match (indexed);
+        # the EXISTS probe only runs when the latest survey is a later year
+        return qs.filter(latest_survey_year__gte=value).filter(
+            Q(latest_survey_year=value)
+            | Exists(HouseholdSurvey.objects.filter(household=OuterRef('pk'), survey_year=value))
+        )
 
     def filter_has_surveys(self, qs, name, value):
-        method = 'exclude' if not value else 'filter'
-        return getattr(qs, method)(surveys__isnull=not value).distinct()
+        return qs.filter(survey_count__gt=0) if value else qs.filter(survey_count=0)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -97,7 +156,8 @@ class HouseholdSurveyFilter(django_filters.FilterSet):
         years            — comma-separated list (2022,2023,2024)
         status           — DRAFT | SUBMITTED | VERIFIED | REVISION
         purok            — Purok.number
-        purok_id         — Purok UUID
+        purok_id         — Purok PK
+        purok_ids        — comma-separated Purok PKs
         household_number — household_number icontains
         surveyed_by      — staff user PK who conducted the survey
         verified         — true = only VERIFIED surveys
@@ -124,16 +184,23 @@ class HouseholdSurveyFilter(django_filters.FilterSet):
         choices=HouseholdSurvey.SurveyStatus.choices,
     )
     purok            = django_filters.NumberFilter(
-        field_name='household__purok__number',
+        field_name='purok__number',
+        method='filter_via_household',
         label='Purok number',
     )
-    purok_id         = django_filters.UUIDFilter(
-        field_name='household__purok',
-        label='Purok UUID',
+    purok_id         = django_filters.NumberFilter(
+        field_name='purok_id',
+        method='filter_via_household',
+        label='Purok PK',
+    )
+    purok_ids        = NumberInFilter(
+        field_name='purok_id__in',
+        method='filter_via_household',
+        label='Purok PKs (comma-separated: 7,8)',
     )
     household_number = django_filters.CharFilter(
-        field_name='household__household_number',
-        lookup_expr='icontains',
+        field_name='household_number__icontains',
+        method='filter_via_household',
         label='Household number (partial)',
     )
     surveyed_by      = django_filters.NumberFilter(
@@ -149,6 +216,10 @@ class HouseholdSurveyFilter(django_filters.FilterSet):
         model  = HouseholdSurvey
         fields = ['survey_year', 'status']
 
+    def filter_via_household(self, qs, name, value):
+        """`name` is a lookup on the parent Household (see field_name)."""
+        return qs.filter(_household_exists(**{name: value}))
+
     def filter_verified(self, qs, name, value):
         if value:
             return qs.filter(status=HouseholdSurvey.SurveyStatus.VERIFIED)
@@ -168,7 +239,8 @@ class FamilyFilter(django_filters.FilterSet):
         income_bracket   — NO_INCOME | BELOW_5K | 5K_10K | ...
         survey_year      — year of parent survey
         purok            — Purok.number
-        purok_id         — Purok UUID
+        purok_id         — Purok PK
+        purok_ids        — comma-separated Purok PKs
     """
     household_survey = django_filters.UUIDFilter(field_name='household_survey')
     income_bracket   = django_filters.ChoiceFilter(
@@ -176,15 +248,10 @@ class FamilyFilter(django_filters.FilterSet):
         choices=Family.IncomeBracket.choices,
         label='Income bracket',
     )
-    survey_year      = django_filters.NumberFilter(
-        field_name='household_survey__survey_year',
-    )
-    purok            = django_filters.NumberFilter(
-        field_name='household_survey__household__purok__number',
-    )
-    purok_id         = django_filters.UUIDFilter(
-        field_name='household_survey__household__purok',
-    )
+    survey_year      = django_filters.NumberFilter(field_name='survey_year')
+    purok            = django_filters.NumberFilter(field_name='purok__number')
+    purok_id         = django_filters.NumberFilter(field_name='purok_id')
+    purok_ids        = NumberInFilter(field_name='purok_id', lookup_expr='in')
 
     class Meta:
         model  = Family
@@ -211,7 +278,8 @@ class PersonFilter(django_filters.FilterSet):
         age_max                 — maximum age
         survey_year             — year of parent survey
         purok                   — Purok.number
-        purok_id                — Purok UUID
+        purok_id                — Purok PK
+        purok_ids               — comma-separated Purok PKs
         household_number        — partial match on household_number
 
     Age filtering notes:
@@ -248,24 +316,23 @@ class PersonFilter(django_filters.FilterSet):
         method='filter_age_max',
         label='Maximum age at survey',
     )
-    survey_year            = django_filters.NumberFilter(
-        field_name='family__household_survey__survey_year',
-    )
-    purok                  = django_filters.NumberFilter(
-        field_name='family__household_survey__household__purok__number',
-    )
-    purok_id               = django_filters.UUIDFilter(
-        field_name='family__household_survey__household__purok',
-    )
+    survey_year            = django_filters.NumberFilter(field_name='survey_year')
+    purok                  = django_filters.NumberFilter(field_name='purok__number')
+    purok_id               = django_filters.NumberFilter(field_name='purok_id')
+    purok_ids              = NumberInFilter(field_name='purok_id', lookup_expr='in')
     household_number       = django_filters.CharFilter(
-        field_name='family__household_survey__household__household_number',
-        lookup_expr='icontains',
+        field_name='household_survey__household__household_number__icontains',
+        method='filter_via_family',
     )
 
     class Meta:
         model  = Person
         fields = ['gender', 'civil_status', 'educational_attainment', 'role']
 
+    def filter_via_family(self, qs, name, value):
+        """`name` is a lookup on the parent Family (see field_name)."""
+        return qs.filter(_family_exists(**{name: value}))
+
     def filter_name(self, qs, name, value):
         return qs.filter(
             Q(first_name__icontains=value)
@@ -334,6 +401,8 @@ class ProgramAvailedFilter(django_filters.FilterSet):
         date_to      — date_availed <= YYYY-MM-DD
         survey_year  — year of parent survey
         purok        — Purok.number
+        purok_id     — Purok PK
+        purok_ids    — comma-separated Purok PKs
         family       — family UUID
         has_amount   — true = amount is not null/zero
     """
@@ -348,15 +417,10 @@ class ProgramAvailedFilter(django_filters.FilterSet):
         lookup_expr='lte',
         label='Date availed to',
     )
-    survey_year  = django_filters.NumberFilter(
-        field_name='family__household_survey__survey_year',
-    )
-    purok        = django_filters.NumberFilter(
-        field_name='family__household_survey__household__purok__number',
-    )
-    purok_id     = django_filters.UUIDFilter(
-        field_name='family__household_survey__household__purok',
-    )
+    survey_year  = django_filters.NumberFilter(field_name='survey_year')
+    purok        = django_filters.NumberFilter(field_name='purok__number')
+    purok_id     = django_filters.NumberFilter(field_name='purok_id')
+    purok_ids    = NumberInFilter(field_name='purok_id', lookup_expr='in')
     family       = django_filters.UUIDFilter(field_name='family')
     has_amount   = django_filters.BooleanFilter(
         method='filter_has_amount',
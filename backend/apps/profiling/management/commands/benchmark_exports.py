@@ -0,0 +1,103 @@
+"""
+Management command: benchmark_exports
+────────────────────────────────────────────────────────────────────────────────
+Measures ReportService export throughput against the current database.
+By default only the row builders (_get_rows) are timed — time to first
+row, total time, rows/s and SQL queries per entity type; --format adds
+file generation and reports the output size instead of first-row time.
+Run it before and after changing the row builders or their querysets, on
+the same data, and compare.
+
+Nothing is written — rows and files are discarded.
+
+Usage:
+    python manage.py benchmark_exports                          # all entity types
+    python manage.py benchmark_exports --entity person --format parquet
+    python manage.py benchmark_exports --year 2025 --repeat 5
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.profiling.services import ReportService
+
+
+class Command(BaseCommand):
+    help = 'Benchmark export row generation (rows/s, time to first row, queries)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity', action='append', choices=list(ReportService.ENTITY_COLUMNS),
+            help='Entity type to export (repeatable; default: all)',
+        )
+        parser.add_argument(
+            '--format', dest='fmt',
+            choices=['csv', 'excel', 'parquet', 'arrow'],
+            help='Also write the file in this format (default: rows only)',
+        )
+        parser.add_argument('--year', type=int, help='Limit to one survey year')
+        parser.add_argument(
+            '--purok', type=int, action='append', dest='purok_ids',
+            help='Limit to a purok id (repeatable)',
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=3,
+            help='Runs per entity; the fastest is reported (default 3)',
+        )
+
+    def handle(self, *args, **options):
+        filters = {}
+        if options['year']:
+            filters['survey_year'] = options['year']
+        if options['purok_ids']:
+            filters['purok_ids'] = options['purok_ids']
+
+        self.stdout.write(
+            f'{"entity":<10} {"rows":>9} {"first ms":>9} {"total ms":>9} '
+            f'{"rows/s":>9} {"MB":>7} {"queries":>8}'
+        )
+        for entity_type in options['entity'] or ReportService.ENTITY_COLUMNS:
+            best = min(
+                (self._run(entity_type, options['fmt'], filters) for _ in range(max(1, options['repeat']))),
+                key=lambda run: run['total'],
+            )
+            rate = best['rows'] / best['total'] if best['total'] else 0
+            self.stdout.write(
+                f'{entity_type:<10} {best["rows"]:>9} {best["first"] * 1000:>9.0f} '
+                f'{best["total"] * 1000:>9.0f} {rate:>9.0f} '
+                f'{best["bytes"] / 1_000_000:>7.2f} {best["queries"]:>8}'
+            )
+
+    @staticmethod
+    def _run(entity_type: str, fmt: str | None, filters: dict) -> dict:
+        rows  = 0
+        size  = 0
+        first = 0.0
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            if fmt is None:
+                for rows, _ in enumerate(ReportService._get_rows(entity_type, filters), start=1):
+                    if rows == 1:
+                        first = time.perf_counter() - started
+            else:
+                progress = []
+                result   = ReportService.generate_export(
+                    entity_type=entity_type,
+                    filters=filters,
+                    fmt=fmt,
+                    stream=True,
+                    on_progress=progress.append,
+                )
+                size = sum(len(chunk) for chunk in result.stream)
+                rows = progress[-1] if progress else 0
+            total = time.perf_counter() - started
+        return {
+            'rows':    rows,
+            'first':   first,
+            'total':   total,
+            'bytes':   size,
+            'queries': len(queries),
+        }
@@ -0,0 +1,33 @@
+"""
+Management command: rebuild_bitmaps
+────────────────────────────────────────────────────────────────────────────────
+Regenerates the HouseholdBitmap index (program targeting) from NormalizedData.
+
+Normalization keeps the bitmaps current one survey at a time; run this once
+after deploying the index, and after bulk imports or raw SQL fixes that
+bypassed the normalization signals.
+
+Usage:
+    python manage.py rebuild_bitmaps               # every survey year
+    python manage.py rebuild_bitmaps --year 2025
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.profiling import bitmaps
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the household bitmap index used by /query/target/'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--year', type=int,
+            help='Only rebuild bitmaps for this survey year',
+        )
+
+    def handle(self, *args, **options):
+        written = bitmaps.rebuild(options['year'])
+        for year, count in written.items():
+            self.stdout.write(f'  {year}: {count} bitmaps')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {len(written)} survey year(s).'))
@@ -0,0 +1,45 @@
+"""
+Management command: rebuild_map_layers
+────────────────────────────────────────────────────────────────────────────────
+Worker for the precomputed map-tile clusters
+(GET /households/tiles/{z}/{x}/{y}/). Tile requests build a zoom/overlay
+only the first time it is asked for and otherwise serve it as last built
+("stale": true); this rebuilds every layer whose DataVersion moved. It
+must be deployed next to the web workers (like run_export_jobs) — without
+it, tiles keep showing the data as of their first build. Layers are
+locked with SKIP LOCKED, so several workers can run side by side.
+
+Usage:
+    python manage.py rebuild_map_layers               # run forever
+    python manage.py rebuild_map_layers --once        # one pass, then exit (cron)
+    python manage.py rebuild_map_layers --poll 30
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.profiling.services import MapTileService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild stale map-tile cluster layers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit after one pass instead of waiting for layers to go stale',
+        )
+        parser.add_argument(
+            '--poll', type=float, default=10.0, metavar='SECONDS',
+            help='Seconds to wait between passes (default 10)',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            rebuilt = MapTileService.rebuild_stale()
+            if rebuilt:
+                self.stdout.write(self.style.SUCCESS(f'Rebuilt {rebuilt} map layer(s)'))
+            if options['once']:
+                return
+            time.sleep(options['poll'])
@@ -0,0 +1,56 @@
+"""
+Management command: reconcile_survey_counts
+────────────────────────────────────────────────────────────────────────────────
+Recounts HouseholdSurvey.family_count / person_count from the active Family
+and Person rows, and Household.latest_survey / latest_survey_year /
+survey_count from the active surveys, correcting whatever drifted.
+
+The counters are normally kept by HouseholdService (create, soft delete,
+restore); run this after bulk imports, raw SQL fixes, or anything else that
+added or removed surveys, families or persons outside the service layer.
+
+Usage:
+    python manage.py reconcile_survey_counts                  # all surveys
+    python manage.py reconcile_survey_counts --year 2024
+    python manage.py reconcile_survey_counts --household PRK3-2024-001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.profiling.models import Household, HouseholdSurvey
+from apps.profiling.services import HouseholdService
+
+
+class Command(BaseCommand):
+    help = 'Recount survey counters on households and household surveys and fix drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help='Only check surveys of this year')
+        parser.add_argument(
+            '--household', metavar='HOUSEHOLD_NUMBER',
+            help='Only check surveys of this household',
+        )
+
+    def handle(self, *args, **options):
+        surveys    = HouseholdSurvey.all_objects.all()
+        households = Household.all_objects.all()
+        if options['year']:
+            surveys = surveys.filter(survey_year=options['year'])
+            # A household's summary spans all its years; --year only narrows which ones are checked
+            households = households.filter(surveys__survey_year=options['year']).distinct()
+        if options['household']:
+            try:
+                household = Household.all_objects.get(household_number=options['household'])
+            except Household.DoesNotExist:
+                raise CommandError(f'Household "{options["household"]}" not found.')
+            surveys    = surveys.filter(household=household)
+            households = households.filter(pk=household.pk)
+
+        with transaction.atomic():
+            fixed_surveys    = HouseholdService.reconcile_survey_counts(surveys)
+            fixed_households = HouseholdService.reconcile_survey_summaries(households)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Corrected counts on {fixed_surveys} surveys and {fixed_households} households.'
+        ))
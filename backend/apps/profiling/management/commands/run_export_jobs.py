@@ -0,0 +1,61 @@
+"""
+Management command: run_export_jobs
+────────────────────────────────────────────────────────────────────────────────
+Worker for asynchronous exports (POST /reports/jobs/). Claims PENDING
+ExportJobs one at a time (SELECT … FOR UPDATE SKIP LOCKED, so several
+workers can run side by side), writes the files to MEDIA_ROOT/exports/,
+and sweeps expired artifacts between jobs.
+
+Run it as a separate process (systemd service, supervisor, container) so
+report generation never competes with web workers.
+
+Usage:
+    python manage.py run_export_jobs               # run forever
+    python manage.py run_export_jobs --once        # drain the queue, then exit (cron)
+    python manage.py run_export_jobs --poll 10
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.profiling.services import ExportJobService
+
+# Seconds between expiry sweeps while running forever
+SWEEP_INTERVAL = 15 * 60
+
+
+class Command(BaseCommand):
+    help = 'Process queued export jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Exit when the queue is empty instead of waiting for new jobs',
+        )
+        parser.add_argument(
+            '--poll', type=float, default=5.0, metavar='SECONDS',
+            help='Seconds to wait before checking an empty queue again (default 5)',
+        )
+
+    def handle(self, *args, **options):
+        last_sweep = float('-inf')
+        while True:
+            if time.monotonic() - last_sweep >= SWEEP_INTERVAL:
+                swept = ExportJobService.sweep()
+                last_sweep = time.monotonic()
+                if any(swept.values()):
+                    self.stdout.write(f'Swept: {swept}')
+
+            job = ExportJobService.claim_next()
+            if job is None:
+                if options['once']:
+                    return
+                time.sleep(options['poll'])
+                continue
+
+            job = ExportJobService.run(job)
+            style = self.style.SUCCESS if job.status == job.Status.DONE else self.style.ERROR
+            self.stdout.write(style(
+                f'{job.pk} {job.entity_type}.{job.fmt}: {job.status} ({job.progress} rows)'
+            ))
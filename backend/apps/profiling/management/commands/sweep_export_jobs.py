@@ -0,0 +1,25 @@
+"""
+Management command: sweep_export_jobs
+────────────────────────────────────────────────────────────────────────────────
+Deletes expired export files, fails jobs whose worker died mid-run, and
+purges old FAILED/EXPIRED job rows. run_export_jobs already sweeps every
+15 minutes; schedule this (cron) when the worker runs with --once.
+
+Usage:
+    python manage.py sweep_export_jobs
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.profiling.services import ExportJobService
+
+
+class Command(BaseCommand):
+    help = 'Expire old export job files'
+
+    def handle(self, *args, **options):
+        swept = ExportJobService.sweep()
+        self.stdout.write(self.style.SUCCESS(
+            f'Expired {swept["expired"]} files, failed {swept["stale"]} stale jobs, '
+            f'purged {swept["purged"]} old jobs.'
+        ))
@@ -0,0 +1,48 @@
+"""
+Management command: sync_purok_scope
+────────────────────────────────────────────────────────────────────────────────
+Re-copies purok / survey_year from household_survey → household onto every
+Family, Person, and ProgramAvailed row (soft-deleted rows included), and
+purok onto every NormalizedData row.
+
+The columns are normally kept in sync by HouseholdService; run this after
+bulk imports, raw SQL fixes, or anything else that bypassed the service layer.
+
+Usage:
+    python manage.py sync_purok_scope                         # all households
+    python manage.py sync_purok_scope --household PRK3-2024-001
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.profiling.models import Household
+from apps.profiling.services import HouseholdService
+
+
+class Command(BaseCommand):
+    help = 'Re-sync denormalized purok / survey_year on families, persons, programs and NormalizedData'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--household', metavar='HOUSEHOLD_NUMBER',
+            help='Only re-sync rows belonging to this household',
+        )
+
+    def handle(self, *args, **options):
+        household = None
+        if options['household']:
+            try:
+                household = Household.all_objects.get(household_number=options['household'])
+            except Household.DoesNotExist:
+                raise CommandError(f'Household "{options["household"]}" not found.')
+
+        with transaction.atomic():
+            counts = HouseholdService.sync_purok_scope(household)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Synced {counts["families"]} families, {counts["persons"]} persons, '
+                f'{counts["programs"]} programs, {counts["normalized"]} normalized rows.'
+            )
+        )
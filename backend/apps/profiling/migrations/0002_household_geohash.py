@@ -0,0 +1,60 @@
+"""
+Migration 0002 — Household geohash
+───────────────────────────────────
+1. Household.geohash          (derived from latitude/longitude)
+2. household_geohash_idx      (B-tree, varchar_pattern_ops for prefix LIKE)
+3. Backfill geohash for households that already have coordinates
+"""
+
+from django.db import migrations, models
+
+
+def backfill_geohash(apps, schema_editor):
+    from apps.profiling.spatial import encode_geohash
+
+    Household = apps.get_model('profiling', 'Household')
+    batch = []
+    qs = Household.objects.exclude(latitude=None).exclude(longitude=None)
+    for household in qs.only('id', 'latitude', 'longitude').iterator(chunk_size=500):
+        household.geohash = encode_geohash(household.latitude, household.longitude)
+        batch.append(household)
+        if len(batch) >= 500:
+            Household.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Household.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0001_initial'),
+    ]
+
+    operations = [
+        # ── 1. Household.geohash ──────────────────────────────────────────────
+        migrations.AddField(
+            model_name='household',
+            name='geohash',
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=12,
+                help_text='Derived from latitude/longitude on save — '
+                          'backs bbox/radius/nearest map queries (see spatial.py)',
+            ),
+        ),
+
+        # ── 2. Prefix-scan index ──────────────────────────────────────────────
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(
+                fields=['geohash'],
+                name='household_geohash_idx',
+                opclasses=['varchar_pattern_ops'],
+            ),
+        ),
+
+        # ── 3. Backfill ───────────────────────────────────────────────────────
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
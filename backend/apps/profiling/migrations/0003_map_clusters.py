@@ -0,0 +1,102 @@
+"""
+Migration 0003 — Precomputed household map clusters
+────────────────────────────────────────────────────
+1. DataVersion                 (change counters for derived data)
+2. HouseholdMapLayer           (one row per zoom level + overlay)
+3. HouseholdMapCluster         (households aggregated per tile cell + purok)
+4. map_cluster_layer_cell_idx  (tile lookup: layer + cell range)
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('residents', '0003_resident_personal_fields_and_optional_user'),
+        ('profiling', '0002_household_geohash'),
+    ]
+
+    operations = [
+        # ── 1. DataVersion ────────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('key', models.CharField(
+                    choices=[('household', 'Household records'), ('normalized', 'Normalized data')],
+                    max_length=30,
+                    primary_key=True,
+                    serialize=False,
+                )),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Data Version',
+                'verbose_name_plural': 'Data Versions',
+            },
+        ),
+
+        # ── 2. HouseholdMapLayer ──────────────────────────────────────────────
+        migrations.CreateModel(
+            name='HouseholdMapLayer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField()),
+                ('overlay', models.CharField(blank=True, max_length=120)),
+                ('data_version', models.PositiveBigIntegerField(
+                    blank=True,
+                    null=True,
+                    help_text='Version the clusters were built from. NULL = never built.',
+                )),
+                ('built_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Household Map Layer',
+                'verbose_name_plural': 'Household Map Layers',
+                'unique_together': {('zoom', 'overlay')},
+            },
+        ),
+
+        # ── 3. HouseholdMapCluster ────────────────────────────────────────────
+        migrations.CreateModel(
+            name='HouseholdMapCluster',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('cell_x', models.PositiveIntegerField()),
+                ('cell_y', models.PositiveIntegerField()),
+                ('household_count', models.PositiveIntegerField()),
+                ('latitude', models.FloatField(help_text='Centroid of the households in this cell')),
+                ('longitude', models.FloatField(help_text='Centroid of the households in this cell')),
+                ('value_counts', models.JSONField(
+                    blank=True,
+                    default=dict,
+                    help_text='Overlay layers only: {canonical_value: household count}',
+                )),
+                ('layer', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='clusters',
+                    to='profiling.householdmaplayer',
+                )),
+                ('purok', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to='residents.purok',
+                )),
+            ],
+            options={
+                'verbose_name': 'Household Map Cluster',
+                'verbose_name_plural': 'Household Map Clusters',
+            },
+        ),
+
+        # ── 4. Tile lookup index ──────────────────────────────────────────────
+        migrations.AddIndex(
+            model_name='householdmapcluster',
+            index=models.Index(
+                fields=['layer', 'cell_x', 'cell_y'],
+                name='map_cluster_layer_cell_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,115 @@
+"""
+Migration 0004 — Denormalized purok / survey_year on Family, Person, ProgramAvailed
+───────────────────────────────────────────────────────────────────────────────────
+1. Family.purok / Family.survey_year
+2. Person.purok / Person.survey_year
+3. ProgramAvailed.purok / ProgramAvailed.survey_year
+4. (purok, survey_year) indexes on all three
+5. Backfill from household_survey → household
+   (same logic as `manage.py sync_purok_scope`, on historical models)
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_scope(apps, schema_editor):
+    HouseholdSurvey = apps.get_model('profiling', 'HouseholdSurvey')
+    Family          = apps.get_model('profiling', 'Family')
+    Person          = apps.get_model('profiling', 'Person')
+    ProgramAvailed  = apps.get_model('profiling', 'ProgramAvailed')
+
+    survey = HouseholdSurvey.objects.filter(pk=OuterRef('household_survey_id')).order_by()
+    Family.objects.update(
+        purok_id=Subquery(survey.values('household__purok_id')[:1]),
+        survey_year=Subquery(survey.values('survey_year')[:1]),
+    )
+
+    family = Family.objects.filter(pk=OuterRef('family_id')).order_by()
+    for model in (Person, ProgramAvailed):
+        model.objects.update(
+            purok_id=Subquery(family.values('purok_id')[:1]),
+            survey_year=Subquery(family.values('survey_year')[:1]),
+        )
+
+
+def _purok_field(help_text):
+    return models.ForeignKey(
+        blank=True,
+        editable=False,
+        help_text=help_text,
+        null=True,
+        on_delete=django.db.models.deletion.PROTECT,
+        related_name='+',
+        to='residents.purok',
+    )
+
+
+def _year_field(help_text):
+    return models.PositiveSmallIntegerField(
+        blank=True, editable=False, help_text=help_text, null=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('residents', '0003_resident_personal_fields_and_optional_user'),
+        ('profiling', '0003_map_clusters'),
+    ]
+
+    operations = [
+        # ── 1. Family ─────────────────────────────────────────────────────────
+        migrations.AddField(
+            model_name='family',
+            name='purok',
+            field=_purok_field('Copy of household_survey.household.purok'),
+        ),
+        migrations.AddField(
+            model_name='family',
+            name='survey_year',
+            field=_year_field('Copy of household_survey.survey_year'),
+        ),
+
+        # ── 2. Person ─────────────────────────────────────────────────────────
+        migrations.AddField(
+            model_name='person',
+            name='purok',
+            field=_purok_field('Copy of family.household_survey.household.purok'),
+        ),
+        migrations.AddField(
+            model_name='person',
+            name='survey_year',
+            field=_year_field('Copy of family.household_survey.survey_year'),
+        ),
+
+        # ── 3. ProgramAvailed ─────────────────────────────────────────────────
+        migrations.AddField(
+            model_name='programavailed',
+            name='purok',
+            field=_purok_field('Copy of family.household_survey.household.purok'),
+        ),
+        migrations.AddField(
+            model_name='programavailed',
+            name='survey_year',
+            field=_year_field('Copy of family.household_survey.survey_year'),
+        ),
+
+        # ── 4. Scope indexes ──────────────────────────────────────────────────
+        migrations.AddIndex(
+            model_name='family',
+            index=models.Index(fields=['purok', 'survey_year'], name='family_purok_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['purok', 'survey_year'], name='person_purok_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='programavailed',
+            index=models.Index(fields=['purok', 'survey_year'], name='program_purok_year_idx'),
+        ),
+
+        # ── 5. Backfill ───────────────────────────────────────────────────────
+        migrations.RunPython(backfill_scope, migrations.RunPython.noop),
+    ]
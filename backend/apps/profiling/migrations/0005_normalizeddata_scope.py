@@ -0,0 +1,77 @@
+"""
+Migration 0005 — Purok and active flag on NormalizedData
+─────────────────────────────────────────────────────────
+1. NormalizedData.purok       (copy of household_survey.household.purok)
+2. NormalizedData.is_active   (False while the source survey is soft-deleted)
+3. Backfill both from the survey/household
+4. Replace norm_canonical_year_idx with norm_concept_scope_idx
+   (canonical_name, canonical_value, survey_year, purok)
+   INCLUDE (household_survey) WHERE is_active
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_scope(apps, schema_editor):
+    HouseholdSurvey = apps.get_model('profiling', 'HouseholdSurvey')
+    NormalizedData  = apps.get_model('profiling', 'NormalizedData')
+
+    survey = HouseholdSurvey.objects.filter(pk=OuterRef('household_survey_id')).order_by()
+    NormalizedData.objects.update(
+        purok_id=Subquery(survey.values('household__purok_id')[:1]),
+    )
+    NormalizedData.objects.filter(household_survey__is_deleted=True).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('residents', '0003_resident_personal_fields_and_optional_user'),
+        ('profiling', '0004_denormalized_purok_scope'),
+    ]
+
+    operations = [
+        # ── 1. NormalizedData.purok ───────────────────────────────────────────
+        migrations.AddField(
+            model_name='normalizeddata',
+            name='purok',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                help_text='Copy of household_survey.household.purok',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='residents.purok',
+            ),
+        ),
+
+        # ── 2. NormalizedData.is_active ───────────────────────────────────────
+        migrations.AddField(
+            model_name='normalizeddata',
+            name='is_active',
+            field=models.BooleanField(
+                default=True,
+                help_text='False while the source survey is soft-deleted',
+            ),
+        ),
+
+        # ── 3. Backfill ───────────────────────────────────────────────────────
+        migrations.RunPython(backfill_scope, migrations.RunPython.noop),
+
+        # ── 4. Concept index ──────────────────────────────────────────────────
+        migrations.RemoveIndex(
+            model_name='normalizeddata',
+            name='norm_canonical_year_idx',
+        ),
+        migrations.AddIndex(
+            model_name='normalizeddata',
+            index=models.Index(
+                condition=models.Q(('is_active', True)),
+                fields=['canonical_name', 'canonical_value', 'survey_year', 'purok'],
+                include=('household_survey',),
+                name='norm_concept_scope_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,118 @@
+"""
+Migration 0006 — Dictionary tables for NormalizedData strings
+──────────────────────────────────────────────────────────────
+1. ConceptName                 (canonical_name strings, smallint ids)
+2. ConceptValue                (raw/canonical value strings, int ids)
+3. NormalizedData.concept / raw / value  (nullable FKs for now)
+4. Fill the dictionaries from the existing strings and point every row at them
+
+The old string columns are dropped in 0007. Keeping the UPDATE and the
+ALTER TABLEs in separate migrations avoids PostgreSQL's "pending trigger
+events" error from the deferred FK checks the UPDATE queues up.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+ENCODE_SQL = """
+INSERT INTO profiling_conceptname (text)
+SELECT DISTINCT canonical_name FROM profiling_normalizeddata
+ON CONFLICT (text) DO NOTHING;
+
+INSERT INTO profiling_conceptvalue (text)
+SELECT canonical_value FROM profiling_normalizeddata
+UNION
+SELECT raw_value FROM profiling_normalizeddata
+ON CONFLICT (text) DO NOTHING;
+
+UPDATE profiling_normalizeddata nd
+   SET concept_id = c.id,
+       value_id   = v.id,
+       raw_id     = r.id
+  FROM profiling_conceptname c, profiling_conceptvalue v, profiling_conceptvalue r
+ WHERE c.text = nd.canonical_name
+   AND v.text = nd.canonical_value
+   AND r.text = nd.raw_value;
+"""
+
+DECODE_SQL = """
+UPDATE profiling_normalizeddata nd
+   SET canonical_name  = c.text,
+       canonical_value = v.text,
+       raw_value       = r.text
+  FROM profiling_conceptname c, profiling_conceptvalue v, profiling_conceptvalue r
+ WHERE c.id = nd.concept_id
+   AND v.id = nd.value_id
+   AND r.id = nd.raw_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0005_normalizeddata_scope'),
+    ]
+
+    operations = [
+        # ── 1. ConceptName ────────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='ConceptName',
+            fields=[
+                ('id', models.SmallAutoField(primary_key=True, serialize=False)),
+                ('text', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Concept Name',
+                'verbose_name_plural': 'Concept Names',
+            },
+        ),
+
+        # ── 2. ConceptValue ───────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='ConceptValue',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('text', models.CharField(max_length=500, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Concept Value',
+                'verbose_name_plural': 'Concept Values',
+            },
+        ),
+
+        # ── 3. Id columns on NormalizedData ───────────────────────────────────
+        migrations.AddField(
+            model_name='normalizeddata',
+            name='concept',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptname',
+            ),
+        ),
+        migrations.AddField(
+            model_name='normalizeddata',
+            name='raw',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+        migrations.AddField(
+            model_name='normalizeddata',
+            name='value',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+
+        # ── 4. Encode existing rows ───────────────────────────────────────────
+        migrations.RunSQL(ENCODE_SQL, DECODE_SQL),
+    ]
@@ -0,0 +1,94 @@
+"""
+Migration 0007 — NormalizedData stores dictionary ids only
+───────────────────────────────────────────────────────────
+1. Drop the string-keyed indexes
+2. Drop canonical_name / raw_value / canonical_value
+3. concept / raw / value become NOT NULL
+4. Re-create norm_concept_scope_idx and norm_survey_canonical_idx on the ids
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0006_concept_dictionaries'),
+    ]
+
+    operations = [
+        # ── 1. Old indexes ────────────────────────────────────────────────────
+        migrations.RemoveIndex(
+            model_name='normalizeddata',
+            name='norm_concept_scope_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='normalizeddata',
+            name='norm_survey_canonical_idx',
+        ),
+
+        # ── 2. String columns ─────────────────────────────────────────────────
+        migrations.RemoveField(
+            model_name='normalizeddata',
+            name='canonical_name',
+        ),
+        migrations.RemoveField(
+            model_name='normalizeddata',
+            name='raw_value',
+        ),
+        migrations.RemoveField(
+            model_name='normalizeddata',
+            name='canonical_value',
+        ),
+
+        # ── 3. Id columns NOT NULL ────────────────────────────────────────────
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='concept',
+            field=models.ForeignKey(
+                help_text='FieldMapping.canonical_name (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptname',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='raw',
+            field=models.ForeignKey(
+                help_text='Original value from the data JSON, exactly as stored (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='value',
+            field=models.ForeignKey(
+                help_text='Value translated to the canonical vocabulary via FieldMapping (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+
+        # ── 4. Id-keyed indexes ───────────────────────────────────────────────
+        migrations.AddIndex(
+            model_name='normalizeddata',
+            index=models.Index(
+                condition=models.Q(is_active=True),
+                fields=['concept', 'value', 'survey_year', 'purok'],
+                include=['household_survey'],
+                name='norm_concept_scope_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='normalizeddata',
+            index=models.Index(
+                fields=['household_survey', 'concept'],
+                name='norm_survey_canonical_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+"""
+Migration 0008 — Household bitmap index
+────────────────────────────────────────
+1. HouseholdOrdinal           (dense integer id per household = bit position)
+2. HouseholdBitmap            (one bitset per survey_year + concept + value)
+3. household_bitmap_key_uniq  (upsert target for incremental refresh)
+
+Existing data is indexed by `python manage.py rebuild_bitmaps`; from then
+on normalization keeps the bitmaps current.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0007_normalizeddata_drop_strings'),
+    ]
+
+    operations = [
+        # ── 1. HouseholdOrdinal ───────────────────────────────────────────────
+        migrations.CreateModel(
+            name='HouseholdOrdinal',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('household', models.OneToOneField(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='ordinal',
+                    to='profiling.household',
+                )),
+            ],
+            options={
+                'verbose_name': 'Household Ordinal',
+                'verbose_name_plural': 'Household Ordinals',
+            },
+        ),
+
+        # ── 2. HouseholdBitmap ────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='HouseholdBitmap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('survey_year', models.PositiveSmallIntegerField()),
+                ('concept_key', models.PositiveSmallIntegerField(
+                    help_text='ConceptName id (0 = every household surveyed that year)',
+                )),
+                ('value_key', models.PositiveIntegerField(
+                    help_text='ConceptValue id (0 = every household surveyed that year)',
+                )),
+                ('bits', models.BinaryField(default=bytes)),
+            ],
+            options={
+                'verbose_name': 'Household Bitmap',
+                'verbose_name_plural': 'Household Bitmaps',
+            },
+        ),
+
+        # ── 3. Unique key ─────────────────────────────────────────────────────
+        migrations.AddConstraint(
+            model_name='householdbitmap',
+            constraint=models.UniqueConstraint(
+                fields=('survey_year', 'concept_key', 'value_key'),
+                name='household_bitmap_key_uniq',
+            ),
+        ),
+    ]
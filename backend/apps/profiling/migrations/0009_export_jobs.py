@@ -0,0 +1,99 @@
+"""
+Migration 0009 — Asynchronous export jobs
+──────────────────────────────────────────
+1. DataVersion key 'program'   (ProgramAvailed change counter)
+2. ExportJob                   (queued export + stored artifact)
+3. export_job_live_dedupe_uniq (one live job per dedupe key)
+"""
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('profiling', '0008_household_bitmaps'),
+    ]
+
+    operations = [
+        # ── 1. DataVersion.key choices ────────────────────────────────────────
+        migrations.AlterField(
+            model_name='dataversion',
+            name='key',
+            field=models.CharField(
+                choices=[
+                    ('household', 'Household records'),
+                    ('normalized', 'Normalized data'),
+                    ('program', 'Programs availed'),
+                ],
+                max_length=30,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+
+        # ── 2. ExportJob ──────────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('entity_type', models.CharField(max_length=20)),
+                ('fmt', models.CharField(max_length=10)),
+                ('filters', models.JSONField(default=dict)),
+                ('data_version', models.CharField(
+                    max_length=60,
+                    help_text='DataVersion counters the export was requested at',
+                )),
+                ('dedupe_key', models.CharField(max_length=64)),
+                ('status', models.CharField(
+                    choices=[
+                        ('PENDING', 'Pending'),
+                        ('RUNNING', 'Running'),
+                        ('DONE', 'Done'),
+                        ('FAILED', 'Failed'),
+                        ('EXPIRED', 'Expired'),
+                    ],
+                    db_index=True,
+                    default='PENDING',
+                    max_length=8,
+                )),
+                ('progress', models.PositiveIntegerField(default=0, help_text='Rows written so far')),
+                ('total_rows', models.PositiveIntegerField(blank=True, null=True)),
+                ('file', models.FileField(blank=True, upload_to='exports/%Y/%m/')),
+                ('filename', models.CharField(blank=True, max_length=120)),
+                ('content_type', models.CharField(blank=True, max_length=100)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('expires_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('requested_by', models.ForeignKey(
+                    blank=True,
+                    null=True,
+                    on_delete=django.db.models.deletion.SET_NULL,
+                    related_name='export_jobs',
+                    to=settings.AUTH_USER_MODEL,
+                )),
+            ],
+            options={
+                'verbose_name': 'Export Job',
+                'verbose_name_plural': 'Export Jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+
+        # ── 3. Live-job dedupe constraint ─────────────────────────────────────
+        migrations.AddConstraint(
+            model_name='exportjob',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(status__in=['PENDING', 'RUNNING', 'DONE']),
+                fields=('dedupe_key',),
+                name='export_job_live_dedupe_uniq',
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+"""
+Migration 0010 — Delta export watermark
+────────────────────────────────────────
+1. ExportJob.watermark   (upper end of a delta export's window)
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0009_export_jobs'),
+    ]
+
+    operations = [
+        # ── 1. ExportJob.watermark ────────────────────────────────────────────
+        migrations.AddField(
+            model_name='exportjob',
+            name='watermark',
+            field=models.DateTimeField(
+                blank=True,
+                null=True,
+                help_text='Delta exports: upper end of the window, the next `since`',
+            ),
+        ),
+    ]
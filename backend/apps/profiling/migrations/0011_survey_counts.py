@@ -0,0 +1,65 @@
+"""
+Migration 0011 — Denormalized family / person counts on HouseholdSurvey
+────────────────────────────────────────────────────────────────────────
+1. HouseholdSurvey.family_count
+2. HouseholdSurvey.person_count
+3. Backfill from the active Family / Person rows
+   (same logic as `manage.py reconcile_survey_counts`, on historical models)
+"""
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counts(apps, schema_editor):
+    HouseholdSurvey = apps.get_model('profiling', 'HouseholdSurvey')
+    Family          = apps.get_model('profiling', 'Family')
+    Person          = apps.get_model('profiling', 'Person')
+
+    # Historical models have plain managers — filter soft-deleted rows here
+    def active_count(model, parent):
+        rows = (
+            model.objects
+            .filter(**{parent: OuterRef('pk'), 'is_deleted': False})
+            .order_by()
+            .values(parent)
+            .annotate(n=Count('*'))
+            .values('n')
+        )
+        return Coalesce(Subquery(rows), 0)
+
+    HouseholdSurvey.objects.update(
+        family_count=active_count(Family, 'household_survey'),
+        person_count=active_count(Person, 'family__household_survey'),
+    )
+
+
+def _count_field(help_text):
+    return models.PositiveIntegerField(default=0, editable=False, help_text=help_text)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0010_exportjob_watermark'),
+    ]
+
+    operations = [
+        # ── 1. HouseholdSurvey.family_count ───────────────────────────────────
+        migrations.AddField(
+            model_name='householdsurvey',
+            name='family_count',
+            field=_count_field('Active families in this survey'),
+        ),
+
+        # ── 2. HouseholdSurvey.person_count ───────────────────────────────────
+        migrations.AddField(
+            model_name='householdsurvey',
+            name='person_count',
+            field=_count_field('Active persons across all families of this survey'),
+        ),
+
+        # ── 3. Backfill ───────────────────────────────────────────────────────
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,89 @@
+"""
+Migration 0012 — Denormalized survey summary on Household
+──────────────────────────────────────────────────────────
+1. Household.latest_survey
+2. Household.latest_survey_year
+3. Household.survey_count
+4. household_recency_idx   (latest_survey_year DESC NULLS LAST)
+5. Backfill from the active HouseholdSurvey rows
+   (same logic as HouseholdService.reconcile_survey_summaries, on historical models)
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_summary(apps, schema_editor):
+    Household       = apps.get_model('profiling', 'Household')
+    HouseholdSurvey = apps.get_model('profiling', 'HouseholdSurvey')
+
+    # Historical models have plain managers — filter soft-deleted rows here
+    surveys = HouseholdSurvey.objects.filter(household=OuterRef('pk'), is_deleted=False)
+    latest  = surveys.order_by('-survey_year')
+    counts  = surveys.order_by().values('household').annotate(n=Count('*')).values('n')
+    Household.objects.update(
+        latest_survey_id=Subquery(latest.values('pk')[:1]),
+        latest_survey_year=Subquery(latest.values('survey_year')[:1]),
+        survey_count=Coalesce(Subquery(counts), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0011_survey_counts'),
+    ]
+
+    operations = [
+        # ── 1. Household.latest_survey ────────────────────────────────────────
+        migrations.AddField(
+            model_name='household',
+            name='latest_survey',
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text='Most recent active survey',
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to='profiling.householdsurvey',
+            ),
+        ),
+
+        # ── 2. Household.latest_survey_year ───────────────────────────────────
+        migrations.AddField(
+            model_name='household',
+            name='latest_survey_year',
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                editable=False,
+                help_text='Year of latest_survey — filters and recency sorting',
+                null=True,
+            ),
+        ),
+
+        # ── 3. Household.survey_count ─────────────────────────────────────────
+        migrations.AddField(
+            model_name='household',
+            name='survey_count',
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                editable=False,
+                help_text='Active surveys of this household',
+            ),
+        ),
+
+        # ── 4. Recency index ──────────────────────────────────────────────────
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(
+                models.OrderBy(models.F('latest_survey_year'), descending=True, nulls_last=True),
+                name='household_recency_idx',
+            ),
+        ),
+
+        # ── 5. Backfill ───────────────────────────────────────────────────────
+        migrations.RunPython(backfill_summary, migrations.RunPython.noop),
+    ]
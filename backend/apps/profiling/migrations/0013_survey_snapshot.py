@@ -0,0 +1,41 @@
+"""
+Migration 0013 — Serialized snapshots of VERIFIED surveys
+──────────────────────────────────────────────────────────
+1. SurveySnapshot   (gzip-compressed HouseholdSurveySerializer JSON)
+
+Existing verified surveys get their snapshot on first read
+(SnapshotService.content), so there is no backfill here.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0012_household_survey_summary'),
+    ]
+
+    operations = [
+        # ── 1. SurveySnapshot ─────────────────────────────────────────────────
+        migrations.CreateModel(
+            name='SurveySnapshot',
+            fields=[
+                ('survey', models.OneToOneField(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    primary_key=True,
+                    related_name='snapshot',
+                    serialize=False,
+                    to='profiling.householdsurvey',
+                )),
+                ('content', models.BinaryField(help_text='gzip-compressed JSON')),
+                ('size', models.PositiveIntegerField(help_text='Uncompressed size in bytes')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Survey Snapshot',
+                'verbose_name_plural': 'Survey Snapshots',
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+"""
+Migration 0014 — Drop the implicit NormalizedData foreign-key indexes
+──────────────────────────────────────────────────────────────────────
+1. concept / raw / value → db_index=False
+
+Migration 0007 re-declared the three foreign keys with Django's default
+db_index=True, which gives each its own single-column index. concept is
+already the leading column of norm_concept_scope_idx, and raw / value are never looked up alone, so
+the three indexes only slow down normalization rewrites. 0007 is already
+applied on existing databases, so the change is a migration of its own.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0013_survey_snapshot'),
+    ]
+
+    operations = [
+        # ── 1. Foreign keys without their own index ───────────────────────────
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='concept',
+            field=models.ForeignKey(
+                db_index=False,
+                help_text='FieldMapping.canonical_name (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptname',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='raw',
+            field=models.ForeignKey(
+                db_index=False,
+                help_text='Original value from the data JSON, exactly as stored (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='normalizeddata',
+            name='value',
+            field=models.ForeignKey(
+                db_index=False,
+                help_text='Value translated to the canonical vocabulary via FieldMapping (dictionary id)',
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='+',
+                to='profiling.conceptvalue',
+            ),
+        ),
+    ]
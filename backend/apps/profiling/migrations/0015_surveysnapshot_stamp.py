@@ -0,0 +1,30 @@
+"""
+Migration 0015 — Staleness stamp on SurveySnapshot
+───────────────────────────────────────────────────
+1. SurveySnapshot.stamp   (hash of SnapshotService.STAMP_FIELDS)
+
+Existing snapshots get an empty stamp, which never matches, so each is
+rebuilt on its next read (SnapshotService.content) — no backfill here.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiling', '0014_normalizeddata_fk_indexes'),
+    ]
+
+    operations = [
+        # ── 1. SurveySnapshot.stamp ───────────────────────────────────────────
+        migrations.AddField(
+            model_name='surveysnapshot',
+            name='stamp',
+            field=models.CharField(
+                blank=True,
+                help_text='Hash of SnapshotService.STAMP_FIELDS when rendered',
+                max_length=64,
+            ),
+        ),
+    ]
@@ -13,7 +13,11 @@ The system separates three concerns:
      Household → HouseholdSurvey → Family → Person → ProgramAvailed
 
   3. QUERY LAYER   — pre-flattened data for fast cross-year search
-     NormalizedData
+     NormalizedData (+ ConceptName/ConceptValue), DataVersion, HouseholdMapLayer → HouseholdMapCluster,
+     HouseholdOrdinal, HouseholdBitmap, SurveySnapshot
+
+  4. EXPORTS       — generated report files
+     ExportJob
 
 KEY INSIGHT: Household ≠ HouseholdSurvey
 ─────────────────────────────────────────
@@ -41,10 +45,13 @@ Use `Model.all_objects` only in admin/audit views.
 
 import uuid
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
 
+from .spatial import encode_geohash
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Custom Managers  (soft delete)
@@ -426,10 +433,23 @@ class Household(SoftDeleteMixin, AuditMixin):
         address          — full street address
         status           — whether household is currently occupied/active
 
+    SPATIAL LOOKUP:
+        geohash is derived from latitude/longitude in save() and indexed with
+        varchar_pattern_ops. Map queries cover a bounding box with a few
+        geohash prefixes (see spatial.py) instead of scanning every row.
+
     NO JSON DATA HERE:
         The Household model itself has no JSON data field. All survey
         responses are in HouseholdSurvey.data. This keeps the Household
         record clean and stable.
+
+    SURVEY SUMMARY:
+        latest_survey / latest_survey_year / survey_count describe the
+        household's active (not soft-deleted) surveys. HouseholdService
+        refreshes them whenever a survey is created, soft-deleted, or
+        restored, so the household directory can filter and sort by recency
+        without touching HouseholdSurvey. `manage.py reconcile_survey_counts`
+        repairs drift.
     """
     class Status(models.TextChoices):
         ACTIVE    = 'ACTIVE',    'Active / Occupied'
@@ -455,11 +475,27 @@ class Household(SoftDeleteMixin, AuditMixin):
                          max_digits=9, decimal_places=6,
                          null=True, blank=True,
                          help_text='GPS longitude for map display')
+    geohash          = models.CharField(
+                         max_length=12, blank=True, editable=False,
+                         help_text='Derived from latitude/longitude on save — '
+                                   'backs bbox/radius/nearest map queries (see spatial.py)')
     status           = models.CharField(
                          max_length=12, choices=Status.choices,
                          default=Status.ACTIVE, db_index=True)
     notes            = models.TextField(blank=True)
 
+    # Maintained by HouseholdService — see SURVEY SUMMARY above
+    latest_survey      = models.ForeignKey(
+                           'HouseholdSurvey', on_delete=models.SET_NULL,
+                           null=True, blank=True, editable=False, related_name='+',
+                           help_text='Most recent active survey')
+    latest_survey_year = models.PositiveSmallIntegerField(
+                           null=True, blank=True, editable=False,
+                           help_text='Year of latest_survey — filters and recency sorting')
+    survey_count       = models.PositiveSmallIntegerField(
+                           default=0, editable=False,
+                           help_text='Active surveys of this household')
+
     class Meta:
         verbose_name        = 'Household'
         verbose_name_plural = 'Households'
@@ -467,14 +503,34 @@ class Household(SoftDeleteMixin, AuditMixin):
         indexes             = [
             models.Index(fields=['purok', 'status']),
             models.Index(fields=['is_deleted', 'status']),
+            # varchar_pattern_ops lets PostgreSQL answer `geohash LIKE 'wdw4%'`
+            # with a B-tree range scan regardless of the database collation
+            models.Index(fields=['geohash'], name='household_geohash_idx',
+                         opclasses=['varchar_pattern_ops']),
+            # ?ordering=-latest_survey_year (NULLS LAST) and ?surveyed_year=
+            models.Index(F('latest_survey_year').desc(nulls_last=True),
+                         name='household_recency_idx'),
         ]
 
     def __str__(self):
         return f'Household {self.household_number} ({self.purok})'
 
-    @property
-    def latest_survey(self):
-        return self.surveys.order_by('-survey_year').first()
+    def save(self, *args, **kwargs):
+        """
+        Keep `geohash` in step with latitude/longitude.
+
+        Partial saves (update_fields) that touch a coordinate also write the
+        geohash; saves that don't touch coordinates leave it alone.
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'latitude', 'longitude'} & set(update_fields):
+            if self.latitude is not None and self.longitude is not None:
+                self.geohash = encode_geohash(self.latitude, self.longitude)
+            else:
+                self.geohash = ''
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'geohash'}
+        super().save(*args, **kwargs)
 
 
 class HouseholdSurvey(SoftDeleteMixin, AuditMixin):
@@ -523,6 +579,12 @@ class HouseholdSurvey(SoftDeleteMixin, AuditMixin):
         form_schema  FK tells you which form was used → what's in data
         survey_year  denormalized for fast filtering without JOIN
 
+    COUNTERS:
+        family_count / person_count are the survey's active (not
+        soft-deleted) families and persons, kept by HouseholdService on
+        create, soft delete, and restore — list pages read them instead of
+        counting per row. `manage.py reconcile_survey_counts` repairs drift.
+
     STATUS FLOW:
         DRAFT → data is being entered, not yet complete
         SUBMITTED → staff submitted, pending verification
@@ -577,6 +639,14 @@ class HouseholdSurvey(SoftDeleteMixin, AuditMixin):
     verified_at = models.DateTimeField(null=True, blank=True)
     notes       = models.TextField(blank=True, help_text='Supervisor notes during verification')
 
+    # Maintained by HouseholdService — see COUNTERS above
+    family_count = models.PositiveIntegerField(
+                    default=0, editable=False,
+                    help_text='Active families in this survey')
+    person_count = models.PositiveIntegerField(
+                    default=0, editable=False,
+                    help_text='Active persons across all families of this survey')
+
     class Meta:
         verbose_name        = 'Household Survey'
         verbose_name_plural = 'Household Surveys'
@@ -609,6 +679,13 @@ class Family(SoftDeleteMixin, AuditMixin):
     It is set at creation and NEVER changes, even if earlier families
     are soft-deleted. This gives staff a stable reference number.
 
+    DENORMALIZED SCOPE:
+        purok and survey_year are copies of household_survey.household.purok
+        and household_survey.survey_year, so purok-scoped lists and permission
+        checks hit one indexed table instead of joining survey → household.
+        Set on create and re-synced by HouseholdService when a household
+        changes purok (see HouseholdService.sync_purok_scope).
+
     INCOME BRACKET:
         Stored as an enum choice, not in the JSON data, because:
         - Income bracket is used in almost every household report
@@ -650,6 +727,16 @@ class Family(SoftDeleteMixin, AuditMixin):
                                default=dict,
                                help_text='Answers to family-level form fields')
 
+    # ── Denormalized scope (see docstring) ──
+    purok                  = models.ForeignKey(
+                               'residents.Purok', on_delete=models.PROTECT,
+                               null=True, blank=True, editable=False,
+                               related_name='+',
+                               help_text='Copy of household_survey.household.purok')
+    survey_year            = models.PositiveSmallIntegerField(
+                               null=True, blank=True, editable=False,
+                               help_text='Copy of household_survey.survey_year')
+
     class Meta:
         verbose_name        = 'Family'
         verbose_name_plural = 'Families'
@@ -658,6 +745,7 @@ class Family(SoftDeleteMixin, AuditMixin):
         indexes             = [
             models.Index(fields=['household_survey', 'is_deleted']),
             models.Index(fields=['monthly_income_bracket', 'is_deleted']),
+            models.Index(fields=['purok', 'survey_year'], name='family_purok_year_idx'),
         ]
 
     def __str__(self):
@@ -695,6 +783,10 @@ class Person(SoftDeleteMixin, AuditMixin):
         PostgreSQL:  WHERE sectors @> '["PWD"]'
         Django ORM:  Person.objects.filter(sectors__contains=['PWD'])
 
+    DENORMALIZED SCOPE:
+        purok / survey_year mirror the parent survey, as on Family — staff
+        scoping filters on them without joining family → survey → household.
+
     WHAT GOES IN data JSON:
     ────────────────────────
     Dynamic person-level questions from the schema (level="person"):
@@ -800,6 +892,16 @@ class Person(SoftDeleteMixin, AuditMixin):
                                default=dict,
                                help_text='Answers to person-level form fields')
 
+    # ── Denormalized scope (see docstring) ──
+    purok                  = models.ForeignKey(
+                               'residents.Purok', on_delete=models.PROTECT,
+                               null=True, blank=True, editable=False,
+                               related_name='+',
+                               help_text='Copy of family.household_survey.household.purok')
+    survey_year            = models.PositiveSmallIntegerField(
+                               null=True, blank=True, editable=False,
+                               help_text='Copy of family.household_survey.survey_year')
+
     class Meta:
         verbose_name        = 'Person'
         verbose_name_plural = 'Persons'
@@ -814,6 +916,7 @@ class Person(SoftDeleteMixin, AuditMixin):
             # Query: Person.objects.filter(sectors__contains=['PWD'])
             GinIndex(fields=['sectors'], name='person_sectors_gin'),
             GinIndex(fields=['data'],    name='person_data_gin'),
+            models.Index(fields=['purok', 'survey_year'], name='person_purok_year_idx'),
         ]
 
     def __str__(self):
@@ -842,6 +945,9 @@ class ProgramAvailed(SoftDeleteMixin, AuditMixin):
     `beneficiary` points to the specific Person who is the named beneficiary
     (important for scholarships, PWD assistance, solo parent aid, etc.).
     It's nullable because some programs (relief goods) apply to the whole family.
+
+    DENORMALIZED SCOPE:
+        purok / survey_year mirror the parent survey (see Family).
     """
     class ProgramType(models.TextChoices):
         FINANCIAL   = 'FINANCIAL',   'Financial Assistance'
@@ -876,6 +982,16 @@ class ProgramAvailed(SoftDeleteMixin, AuditMixin):
     data          = models.JSONField(default=dict,
                       help_text='Any extra structured fields for this program')
 
+    # ── Denormalized scope (see docstring) ──
+    purok         = models.ForeignKey(
+                      'residents.Purok', on_delete=models.PROTECT,
+                      null=True, blank=True, editable=False,
+                      related_name='+',
+                      help_text='Copy of family.household_survey.household.purok')
+    survey_year   = models.PositiveSmallIntegerField(
+                      null=True, blank=True, editable=False,
+                      help_text='Copy of family.household_survey.survey_year')
+
     class Meta:
         verbose_name        = 'Program Availed'
         verbose_name_plural = 'Programs Availed'
@@ -884,6 +1000,7 @@ class ProgramAvailed(SoftDeleteMixin, AuditMixin):
             models.Index(fields=['program_type', 'date_availed']),
             models.Index(fields=['family', 'program_type']),
             models.Index(fields=['is_deleted', 'program_type']),
+            models.Index(fields=['purok', 'survey_year'], name='program_purok_year_idx'),
         ]
 
     def __str__(self):
@@ -894,6 +1011,98 @@ class ProgramAvailed(SoftDeleteMixin, AuditMixin):
 # QUERY LAYER  (pre-flattened for fast cross-year search)
 # ─────────────────────────────────────────────────────────────────────────────
 
+class DictionaryEntry(models.Model):
+    """
+    Abstract append-only string dictionary (dictionary encoding).
+
+    NormalizedData repeats the same few hundred concept names and a few
+    thousand distinct values across millions of rows. Storing each string
+    once here and only its small integer id on the fact rows keeps the table
+    and its indexes several times smaller and turns string comparisons into
+    integer comparisons.
+
+    Entries are never updated or deleted, so an id ↔ text pair, once read,
+    stays valid for the life of the process and is cached per subclass.
+    Use ids_for()/texts_for() rather than querying the table directly.
+    """
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return self.text
+
+    @classmethod
+    def _cache(cls) -> tuple[dict, dict]:
+        """({text: id}, {id: text}) — one pair per concrete subclass."""
+        if '_by_text' not in cls.__dict__:
+            cls._by_text, cls._by_id = {}, {}
+        return cls._by_text, cls._by_id
+
+    @classmethod
+    def ids_for(cls, texts, create: bool = False) -> dict[str, int]:
+        """
+        Translate strings to ids: {text: id}.
+
+        Unknown strings are left out of the result unless create=True, in
+        which case they are inserted first (ON CONFLICT DO NOTHING, so
+        concurrent writers converge on the same id).
+        """
+        by_text, by_id = cls._cache()
+        texts   = set(texts)
+        result  = {text: by_text[text] for text in texts if text in by_text}
+        missing = texts - result.keys()
+        if missing:
+            if create:
+                cls.objects.bulk_create(
+                    [cls(text=text) for text in missing], ignore_conflicts=True,
+                )
+            found = dict(cls.objects.filter(text__in=missing).values_list('text', 'pk'))
+            # An id inserted inside a transaction that later rolls back must
+            # not outlive it — only cache once it is known to be committed.
+            if not (create and transaction.get_connection().in_atomic_block):
+                by_text.update(found)
+                by_id.update((pk, text) for text, pk in found.items())
+            result.update(found)
+        return result
+
+    @classmethod
+    def id_for(cls, text: str) -> int | None:
+        """Id of one string, or None if it was never stored."""
+        return cls.ids_for([text]).get(text)
+
+    @classmethod
+    def texts_for(cls, ids) -> dict[int, str]:
+        """Translate ids back to strings: {id: text}."""
+        _, by_id = cls._cache()
+        ids      = set(ids)
+        missing  = ids - by_id.keys()
+        if missing:
+            # id → text only: sequences never hand out an id twice, so this
+            # direction stays correct even if the row's transaction rolls back
+            by_id.update(cls.objects.filter(pk__in=missing).values_list('pk', 'text'))
+        return {pk: by_id[pk] for pk in ids if pk in by_id}
+
+
+class ConceptName(DictionaryEntry):
+    """Dictionary of FieldMapping.canonical_name strings used by NormalizedData."""
+    id   = models.SmallAutoField(primary_key=True)
+    text = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        verbose_name        = 'Concept Name'
+        verbose_name_plural = 'Concept Names'
+
+
+class ConceptValue(DictionaryEntry):
+    """Dictionary of raw and canonical value strings used by NormalizedData."""
+    id   = models.AutoField(primary_key=True)
+    text = models.CharField(max_length=500, unique=True)
+
+    class Meta:
+        verbose_name        = 'Concept Value'
+        verbose_name_plural = 'Concept Values'
+
+
 class NormalizedData(models.Model):
     """
     Pre-flattened lookup table for fast cross-year JSON field queries.
@@ -918,17 +1127,34 @@ class NormalizedData(models.Model):
         └──────────────┴───────────────┴───────────────┴──────────────┘
 
         Cross-year query becomes:
-          NormalizedData.objects.filter(
-              canonical_name='water_source',
-              canonical_value='level_3',
-              survey_year__range=(2024, 2026)
-          ).values_list('household_survey_id', flat=True)
+          QueryService.filter_by_concept(
+              'water_source', 'level_3', year_start=2024, year_end=2026,
+          )
 
     THIS IS A READ-ONLY TABLE:
         Never write to it directly. It is always regenerated from
         HouseholdSurvey.data + FieldMapping. If data changes, the
         normalization job runs again and replaces existing rows.
 
+    DENORMALIZED SCOPE:
+        purok and is_active are copied from the survey (household.purok and
+        NOT is_deleted) so concept queries never join back to the survey or
+        household tables. HouseholdService flips is_active on survey
+        soft-delete/restore and rewrites purok when a household moves.
+        Concept queries must always filter is_active=True — the main index
+        is partial on it.
+
+    DICTIONARY ENCODING:
+        canonical_name, raw_value and canonical_value are not stored as
+        strings: concept/raw/value hold ids into ConceptName and ConceptValue
+        (2- and 4-byte keys instead of up to 500-byte varchars). The string
+        properties of the same names decode them from a per-process cache.
+        Query through QueryService, which translates names/values to ids
+        before filtering and ids back to strings after aggregating.
+        The three foreign keys carry no single-column indexes of their own:
+        concept leads norm_concept_scope_idx, and nothing looks rows up by raw or value alone (dictionary entries
+        are never deleted, so the PROTECT check never runs).
+
     TRADE-OFFS:
         + Cross-year queries become trivial O(1) lookups
         + Report builder can query without knowing field name per year
@@ -950,24 +1176,38 @@ class NormalizedData(models.Model):
                          null=True, blank=True, db_index=True,
                          help_text='UUID of the Family or Person this value came from. '
                                    'NULL for household-level fields.')
-    canonical_name   = models.CharField(
-                         max_length=100, db_index=True,
-                         help_text='FieldMapping.canonical_name')
-    raw_value        = models.CharField(
-                         max_length=500,
-                         help_text='Original value from the data JSON, exactly as stored')
-    canonical_value  = models.CharField(
-                         max_length=500,
-                         help_text='Value translated to the canonical vocabulary via FieldMapping')
+    concept          = models.ForeignKey(
+                         ConceptName, on_delete=models.PROTECT, related_name='+',
+                         db_index=False,
+                         help_text='FieldMapping.canonical_name (dictionary id)')
+    raw              = models.ForeignKey(
+                         ConceptValue, on_delete=models.PROTECT, related_name='+',
+                         db_index=False,
+                         help_text='Original value from the data JSON, exactly as stored (dictionary id)')
+    value            = models.ForeignKey(
+                         ConceptValue, on_delete=models.PROTECT, related_name='+',
+                         db_index=False,
+                         help_text='Value translated to the canonical vocabulary via FieldMapping (dictionary id)')
+    purok            = models.ForeignKey(
+                         'residents.Purok', on_delete=models.PROTECT,
+                         null=True, blank=True, related_name='+',
+                         help_text='Copy of household_survey.household.purok')
+    is_active        = models.BooleanField(
+                         default=True,
+                         help_text='False while the source survey is soft-deleted')
 
     class Meta:
         verbose_name        = 'Normalized Data'
         verbose_name_plural = 'Normalized Data'
         indexes             = [
-            # The primary query pattern: find surveys with canonical_name=X, value=Y, year in range
-            models.Index(fields=['canonical_name', 'canonical_value', 'survey_year'],
-                         name='norm_canonical_year_idx'),
-            models.Index(fields=['household_survey', 'canonical_name'],
+            # The primary query pattern: surveys with concept=X, value=Y,
+            # year in range, optionally scoped to puroks. INCLUDE + the partial
+            # condition let trend/histogram counts run as index-only scans.
+            models.Index(fields=['concept', 'value', 'survey_year', 'purok'],
+                         include=['household_survey'],
+                         condition=models.Q(is_active=True),
+                         name='norm_concept_scope_idx'),
+            models.Index(fields=['household_survey', 'concept'],
                          name='norm_survey_canonical_idx'),
             models.Index(fields=['survey_year', 'level'],
                          name='norm_year_level_idx'),
@@ -976,6 +1216,268 @@ class NormalizedData(models.Model):
     def __str__(self):
         return f'{self.canonical_name}={self.canonical_value} (Survey {self.survey_year})'
 
+    # ── Decoded strings (served from the dictionary cache) ───────────────────
+    @property
+    def canonical_name(self) -> str:
+        return ConceptName.texts_for([self.concept_id]).get(self.concept_id, '')
+
+    @property
+    def canonical_value(self) -> str:
+        return ConceptValue.texts_for([self.value_id]).get(self.value_id, '')
+
+    @property
+    def raw_value(self) -> str:
+        return ConceptValue.texts_for([self.raw_id]).get(self.raw_id, '')
+
+
+class DataVersion(models.Model):
+    """
+    Monotonic change counters for derived/precomputed data.
+
+    WHY:
+        Precomputed artifacts (map cluster layers, caches) must know when the
+        rows they were built from have changed. Comparing a stored version
+        number against DataVersion.current(key) is one primary-key lookup —
+        far cheaper than re-aggregating to find out.
+
+    KEYS:
+        household  — bumped after any Household insert/update/delete
+        normalized — bumped after NormalizedData rows are rewritten
+                     (i.e. after every survey / family / person save)
+        program    — bumped after any ProgramAvailed insert/update/delete
+
+        normalized@2025 (year_key) — per-year counter, bumped together with
+                     normalized for the survey years a write touched, so a
+                     cache partitioned by year reloads only those years
+
+    household / program are bumped from signals.py via
+    transaction.on_commit(), so a rolled-back transaction never invalidates
+    anything. normalized is bumped once per transaction, on commit, for
+    every survey year its normalization runs touched
+    (signals._queue_normalized_bump) — or right after the rows are
+    rewritten when the normalize_* functions run outside a transaction.
+    Either way the row lock is held only for the instant of the UPDATE.
+    """
+    class Key(models.TextChoices):
+        HOUSEHOLD  = 'household',  'Household records'
+        NORMALIZED = 'normalized', 'Normalized data'
+        PROGRAM    = 'program',    'Programs availed'
+
+    key        = models.CharField(max_length=30, primary_key=True, choices=Key.choices)
+    version    = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = 'Data Version'
+        verbose_name_plural = 'Data Versions'
+
+    def __str__(self):
+        return f'{self.key} v{self.version}'
+
+    @classmethod
+    def current(cls, key: str) -> int:
+        """Current counter value (0 if the key was never bumped)."""
+        return cls.objects.filter(key=key).values_list('version', flat=True).first() or 0
+
+    @staticmethod
+    def year_key(key: str, year: int) -> str:
+        """Per-year counter of `key`, e.g. 'normalized@2025'."""
+        return f'{key}@{year}'
+
+    @classmethod
+    def current_years(cls, key: str, years) -> dict[int, int]:
+        """{year: current per-year counter} in one query (0 if never bumped)."""
+        keys  = {cls.year_key(key, year): year for year in years}
+        found = dict(cls.objects.filter(key__in=keys).values_list('key', 'version'))
+        return {year: found.get(k, 0) for k, year in keys.items()}
+
+    @classmethod
+    def bump(cls, key: str, *years: int) -> None:
+        """
+        Atomically increment the counter for `key`, creating it on first use.
+        `years` also bumps those per-year counters — before `key`, so a
+        reader that sees the new `key` version also sees the new year ones.
+        """
+        for k in [*(cls.year_key(key, year) for year in sorted(set(years))), key]:
+            updated = cls.objects.filter(key=k).update(
+                version=models.F('version') + 1, updated_at=timezone.now(),
+            )
+            if not updated:
+                cls.objects.get_or_create(key=k)
+                cls.objects.filter(key=k).update(
+                    version=models.F('version') + 1, updated_at=timezone.now(),
+                )
+
+
+class HouseholdMapLayer(models.Model):
+    """
+    One precomputed zoom level of household map clusters.
+
+    A layer is identified by (zoom, overlay):
+        overlay = ''                      → plain household counts
+        overlay = 'water_source@2025'     → counts + canonical value breakdown
+                                            of a household-level concept
+
+    data_version records the DataVersion the clusters were built from
+    (household, plus normalized for overlays; NULL = never built — the
+    first tile request builds it). `manage.py rebuild_map_layers` rebuilds
+    the whole layer in one pass when it no longer matches — tiles are served from HouseholdMapCluster rows
+    with an indexed range lookup, stale or not.
+    """
+    zoom         = models.PositiveSmallIntegerField()
+    overlay      = models.CharField(max_length=120, blank=True)
+    data_version = models.PositiveBigIntegerField(
+                     null=True, blank=True,
+                     help_text='Version the clusters were built from. NULL = never built.')
+    built_at     = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name        = 'Household Map Layer'
+        verbose_name_plural = 'Household Map Layers'
+        unique_together     = ('zoom', 'overlay')
+
+    def __str__(self):
+        return f'Map layer z{self.zoom} {self.overlay or "(base)"}'
+
+
+class HouseholdMapCluster(models.Model):
+    """
+    Households aggregated into one grid cell of a HouseholdMapLayer.
+
+    Cells are 1/8 of a web-mercator tile (see spatial.cluster_cell), and
+    are kept per purok so STAFF purok scoping still applies to the map.
+    """
+    id              = models.BigAutoField(primary_key=True)
+    layer           = models.ForeignKey(
+                        HouseholdMapLayer, on_delete=models.CASCADE,
+                        related_name='clusters')
+    cell_x          = models.PositiveIntegerField()
+    cell_y          = models.PositiveIntegerField()
+    purok           = models.ForeignKey(
+                        'residents.Purok', on_delete=models.CASCADE,
+                        related_name='+')
+    household_count = models.PositiveIntegerField()
+    latitude        = models.FloatField(help_text='Centroid of the households in this cell')
+    longitude       = models.FloatField(help_text='Centroid of the households in this cell')
+    value_counts    = models.JSONField(
+                        default=dict, blank=True,
+                        help_text='Overlay layers only: {canonical_value: household count}')
+
+    class Meta:
+        verbose_name        = 'Household Map Cluster'
+        verbose_name_plural = 'Household Map Clusters'
+        indexes             = [
+            models.Index(fields=['layer', 'cell_x', 'cell_y'],
+                         name='map_cluster_layer_cell_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.household_count} households @ ({self.cell_x}, {self.cell_y})'
+
+
+class HouseholdOrdinal(models.Model):
+    """
+    Dense integer id for a household — its bit position in HouseholdBitmap.
+
+    Household ids are UUIDs, which cannot index a bitset. Ordinals are
+    assigned the first time a household is indexed and never reused.
+    """
+    id        = models.AutoField(primary_key=True)
+    household = models.OneToOneField(
+                  Household, on_delete=models.CASCADE, related_name='ordinal')
+
+    class Meta:
+        verbose_name        = 'Household Ordinal'
+        verbose_name_plural = 'Household Ordinals'
+
+    def __str__(self):
+        return f'#{self.id} → {self.household_id}'
+
+
+class HouseholdBitmap(models.Model):
+    """
+    Bitmap index: which households had concept=value in a survey year.
+
+    One row per (survey_year, concept, value). Bit N of `bits` is set when
+    the household with HouseholdOrdinal N has an active NormalizedData row
+    (any level) for that concept/value in that year's survey. The row with
+    concept_key = value_key = 0 is the year's universe — every household
+    with an active survey — which NOT is evaluated against.
+
+    LAYOUT:
+        bits is little-endian: bit N lives in byte N // 8 at position N % 8,
+        which is both PostgreSQL's get_bit()/set_bit() numbering and
+        int.from_bytes(bits, 'little'). Large values are compressed by
+        TOAST automatically.
+
+    MAINTENANCE:
+        bitmaps.refresh_survey() re-indexes one survey in SQL (clear the
+        household's bit for the pairs it no longer holds, set it for its
+        current values) and runs after every normalization, so the index never
+        needs a full rebuild. `manage.py rebuild_bitmaps` rebuilds from
+        scratch (first deployment, or after bypassing the signals).
+    """
+    survey_year = models.PositiveSmallIntegerField()
+    concept_key = models.PositiveSmallIntegerField(
+                    help_text='ConceptName id (0 = every household surveyed that year)')
+    value_key   = models.PositiveIntegerField(
+                    help_text='ConceptValue id (0 = every household surveyed that year)')
+    bits        = models.BinaryField(default=bytes)
+
+    class Meta:
+        verbose_name        = 'Household Bitmap'
+        verbose_name_plural = 'Household Bitmaps'
+        constraints         = [
+            models.UniqueConstraint(fields=['survey_year', 'concept_key', 'value_key'],
+                                    name='household_bitmap_key_uniq'),
+        ]
+
+    def __str__(self):
+        return f'{self.survey_year} {self.concept_key}={self.value_key}'
+
+
+class SurveySnapshot(models.Model):
+    """
+    The HouseholdSurveySerializer JSON of a VERIFIED survey, rendered once
+    and stored gzip-compressed.
+
+    WHY:
+        A verified survey is immutable — update_survey_data, update_family
+        and update_person all reject edits — yet its detail response nests
+        every family, person and program. surveys/{id}/ and
+        households/{id}/latest-survey/ send `content` as-is
+        (Content-Encoding: gzip) instead of re-serializing the tree.
+
+    LIFECYCLE (SnapshotService):
+        written  by verify_survey(), or on the first read of a verified
+                 survey without one (verified before snapshots existed,
+                 or restored after a soft delete)
+        deleted  by request_revision() and soft_delete_survey(), and when
+                 something the representation embeds changes underneath:
+                 a program of the survey, its household, its FormSchema
+        rebuilt  on read when `stamp` no longer matches the rows it was
+                 rendered from — the same columns the survey's ETag hashes
+                 (purok name/number, surveyor and verifier names, ...), so
+                 edits made outside the invalidating services (a purok
+                 renamed, a user renaming themselves) are never served
+    """
+    survey     = models.OneToOneField(
+                   HouseholdSurvey, on_delete=models.CASCADE,
+                   primary_key=True, related_name='snapshot')
+    content    = models.BinaryField(help_text='gzip-compressed JSON')
+    size       = models.PositiveIntegerField(help_text='Uncompressed size in bytes')
+    stamp      = models.CharField(
+                   max_length=64, blank=True,
+                   help_text='Hash of SnapshotService.STAMP_FIELDS when rendered')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = 'Survey Snapshot'
+        verbose_name_plural = 'Survey Snapshots'
+
+    def __str__(self):
+        return f'Snapshot of {self.survey_id} ({self.size} B)'
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # AUDIT TRAIL
@@ -1099,3 +1601,81 @@ class HouseholdChangeLog(models.Model):
             survey_year=survey_year,
             notes=notes,
         )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# EXPORTS
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ExportJob(models.Model):
+    """
+    One asynchronous report export and its stored artifact.
+
+    LIFECYCLE:
+        PENDING  → created by POST /reports/jobs/
+        RUNNING  → claimed by `manage.py run_export_jobs` (SKIP LOCKED)
+        DONE     → file written under MEDIA_ROOT/exports/, downloadable
+                   until expires_at
+        FAILED   → error holds the reason
+        EXPIRED  → the sweeper deleted the file
+
+    DEDUPLICATION:
+        dedupe_key hashes everything that determines the file's content —
+        entity type, format, filters (purok scope included) and the
+        DataVersion counters of the source tables. A second identical
+        request while a job is PENDING/RUNNING/DONE gets that job back
+        instead of a new one; the partial unique constraint makes this hold
+        even for simultaneous double-clicks. Any data change moves the
+        version, so a new request after an edit produces a fresh file.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        DONE    = 'DONE',    'Done'
+        FAILED  = 'FAILED',  'Failed'
+        EXPIRED = 'EXPIRED', 'Expired'
+
+    id           = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    requested_by = models.ForeignKey(
+                     settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
+                     null=True, blank=True, related_name='export_jobs')
+    entity_type  = models.CharField(max_length=20)
+    fmt          = models.CharField(max_length=10)
+    filters      = models.JSONField(default=dict)
+    data_version = models.CharField(
+                     max_length=60,
+                     help_text='DataVersion counters the export was requested at')
+    dedupe_key   = models.CharField(max_length=64)
+    status       = models.CharField(
+                     max_length=8, choices=Status.choices,
+                     default=Status.PENDING, db_index=True)
+    progress     = models.PositiveIntegerField(default=0, help_text='Rows written so far')
+    total_rows   = models.PositiveIntegerField(null=True, blank=True)
+    file         = models.FileField(upload_to='exports/%Y/%m/', blank=True)
+    filename     = models.CharField(max_length=120, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    error        = models.TextField(blank=True)
+    created_at   = models.DateTimeField(auto_now_add=True)
+    started_at   = models.DateTimeField(null=True, blank=True)
+    finished_at  = models.DateTimeField(null=True, blank=True)
+    expires_at   = models.DateTimeField(null=True, blank=True, db_index=True)
+    watermark    = models.DateTimeField(
+                     null=True, blank=True,
+                     help_text='Delta exports: upper end of the window, the next `since`')
+
+    LIVE_STATUSES = (Status.PENDING, Status.RUNNING, Status.DONE)
+
+    class Meta:
+        verbose_name        = 'Export Job'
+        verbose_name_plural = 'Export Jobs'
+        ordering            = ['-created_at']
+        constraints         = [
+            models.UniqueConstraint(
+                fields=['dedupe_key'],
+                condition=models.Q(status__in=['PENDING', 'RUNNING', 'DONE']),
+                name='export_job_live_dedupe_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.entity_type}.{self.fmt} [{self.status}]'
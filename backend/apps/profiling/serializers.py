@@ -20,32 +20,133 @@ CHANGE LOG
 ──────────
 Serializers must NEVER call HouseholdChangeLog directly.
 All logging happens in services.py.
+
+SPARSE FIELDSETS
+────────────────
+Read serializers mix in SparseFieldsetMixin, which honors two GET params:
+  ?fields=id,status,families.family_number   keep only these fields
+  ?expand=families                           add opt-in nested fields
+                                             (Meta.expandable_fields)
+Dotted paths reach into nested serializers. The viewsets read the same
+trees back (read_attributes()) to defer unrequested columns and skip
+unrequested prefetches.
 """
 
 from django.db import transaction
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.exceptions import ValidationError
 
 from .models import (
-    Family, FieldMapping, FormSchema, Household,
+    ExportJob, Family, FieldMapping, FormSchema, Household,
     HouseholdChangeLog, HouseholdSurvey, NormalizedData, Person,
     ProgramAvailed,
 )
 from .services import HouseholdService, SurveyAlreadyExistsError
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Sparse fieldsets
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _parse_paths(raw: str) -> dict:
+    """'id,families.persons.first_name' → {'id': {}, 'families': {'persons': {'first_name': {}}}}"""
+    tree = {}
+    for path in raw.split(','):
+        node = tree
+        for part in filter(None, (part.strip() for part in path.split('.'))):
+            node = node.setdefault(part, {})
+    return tree
+
+
+class SparseFieldsetMixin:
+    """
+    ?fields= / ?expand= for a read serializer.
+
+    The top-level serializer parses both params from its context request
+    (GET / HEAD only); each nested sparse serializer is handed its branch of
+    the two trees by its parent. A nested name without a dotted path below
+    it keeps that serializer whole. Expanded fields are always included.
+
+    Meta options:
+        expandable_fields  {name: (serializer_class, kwargs)} — left out
+                           unless named in ?expand= (or ?fields=)
+        field_sources      {field: (model attributes...)} — what a computed
+                           field reads, for read_attributes()
+
+    Unknown names raise ValidationError (400).
+    """
+    _sparse = None   # (fields tree | None, expand tree), set by the parent serializer
+
+    def _sparse_spec(self) -> tuple:
+        if self._sparse is not None:
+            return self._sparse
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get('request')
+        if parent is not None or request is None or request.method not in SAFE_METHODS:
+            return None, {}
+        params = request.query_params
+        return _parse_paths(params.get('fields', '')) or None, _parse_paths(params.get('expand', ''))
+
+    @property
+    def is_sparse(self) -> bool:
+        """True when ?fields= narrows this serializer."""
+        return self._sparse_spec()[0] is not None
+
+    def get_fields(self):
+        fields       = super().get_fields()
+        only, expand = self._sparse_spec()
+        expandable   = getattr(self.Meta, 'expandable_fields', {})
+
+        for name in (expand.keys() | (only or {}).keys()) & expandable.keys():
+            serializer_class, kwargs = expandable[name]
+            fields[name] = serializer_class(**kwargs)
+
+        errors = {}
+        for param, tree in (('fields', only or {}), ('expand', expand)):
+            unknown = tree.keys() - fields.keys()
+            if unknown:
+                errors[param] = f"Unknown field(s): {', '.join(sorted(unknown))}."
+        if errors:
+            raise ValidationError(errors)
+
+        if only is not None:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in only or name in expand
+            }
+        for name, field in fields.items():
+            nested = getattr(field, 'child', field)
+            if isinstance(nested, SparseFieldsetMixin):
+                nested._sparse = ((only or {}).get(name) or None, expand.get(name, {}))
+        return fields
+
+    def read_attributes(self) -> set[str]:
+        """Model attributes (first hop of each source) the kept fields read."""
+        sources = getattr(self.Meta, 'field_sources', {})
+        attrs   = set()
+        for name, field in self.fields.items():
+            if name in sources:
+                attrs.update(sources[name])
+            elif field.source != '*':
+                attrs.add(field.source.split('.')[0])
+        return attrs
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # FormSchema / FieldMapping
 # ─────────────────────────────────────────────────────────────────────────────
 
-class FieldMappingSerializer(serializers.ModelSerializer):
+class FieldMappingSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model   = FieldMapping
         fields  = '__all__'
         read_only_fields = ('id', 'created_at', 'updated_at')
 
 
-class FormSchemaSerializer(serializers.ModelSerializer):
+class FormSchemaSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model   = FormSchema
         fields  = '__all__'
@@ -63,7 +164,7 @@ class FormSchemaLightSerializer(serializers.ModelSerializer):
 # ProgramAvailed
 # ─────────────────────────────────────────────────────────────────────────────
 
-class ProgramAvailedSerializer(serializers.ModelSerializer):
+class ProgramAvailedSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     beneficiary_name = serializers.SerializerMethodField()
 
     class Meta:
@@ -75,6 +176,7 @@ class ProgramAvailedSerializer(serializers.ModelSerializer):
             'is_deleted', 'created_at', 'updated_at',
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'beneficiary_name')
+        field_sources    = {'beneficiary_name': ('beneficiary',)}
 
     def get_beneficiary_name(self, obj):
         return obj.beneficiary.full_name if obj.beneficiary else None
@@ -98,7 +200,7 @@ class ProgramAvailedWriteSerializer(serializers.ModelSerializer):
 # Person
 # ─────────────────────────────────────────────────────────────────────────────
 
-class PersonSerializer(serializers.ModelSerializer):
+class PersonSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Full person read representation.
 
@@ -125,6 +227,10 @@ class PersonSerializer(serializers.ModelSerializer):
             'is_deleted', 'created_at', 'updated_at',
         )
         read_only_fields = ('id', 'full_name', 'current_age', 'created_at', 'updated_at')
+        field_sources    = {
+            'full_name':   ('first_name', 'middle_name', 'last_name', 'suffix'),
+            'current_age': ('date_of_birth',),
+        }
 
     def get_current_age(self, obj) -> int | None:
         """
@@ -174,7 +280,7 @@ class PersonUpdateSerializer(serializers.Serializer):
 # Family
 # ─────────────────────────────────────────────────────────────────────────────
 
-class FamilySerializer(serializers.ModelSerializer):
+class FamilySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Full family read representation with nested persons and programs."""
     persons          = PersonSerializer(many=True, read_only=True)
     programs_availed = ProgramAvailedSerializer(many=True, read_only=True)
@@ -191,6 +297,7 @@ class FamilySerializer(serializers.ModelSerializer):
         read_only_fields = (
             'id', 'family_number', 'person_count', 'created_at', 'updated_at'
         )
+        field_sources = {'person_count': ('persons',)}
 
     def get_person_count(self, obj):
         # Use prefetched cache if available to avoid N+1
@@ -214,7 +321,7 @@ class FamilyUpdateSerializer(serializers.Serializer):
 # HouseholdSurvey
 # ─────────────────────────────────────────────────────────────────────────────
 
-class HouseholdSurveySerializer(serializers.ModelSerializer):
+class HouseholdSurveySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Full survey read representation.
     Includes nested families (with persons) for detail views.
@@ -253,10 +360,25 @@ class HouseholdSurveySerializer(serializers.ModelSerializer):
         )
 
 
-class HouseholdSurveyLightSerializer(serializers.ModelSerializer):
+class HouseholdSurveyStatusSerializer(HouseholdSurveySerializer):
+    """
+    Survey header without the data JSON or nested families — returned by
+    the workflow actions (submit / verify / request-revision / restore),
+    which change only the survey row.
+    """
+    class Meta(HouseholdSurveySerializer.Meta):
+        fields = tuple(
+            field for field in HouseholdSurveySerializer.Meta.fields
+            if field not in ('data', 'families')
+        ) + ('family_count', 'person_count')
+
+
+class HouseholdSurveyLightSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Compact survey representation for list views.
-    No nested families — just summary counts.
+    No nested families — just summary counts, read from the maintained
+    family_count / person_count columns (no per-row COUNT queries).
+    ?expand=families adds the FamilySerializer tree per row.
     """
     household_number = serializers.CharField(
         source='household.household_number', read_only=True
@@ -264,8 +386,6 @@ class HouseholdSurveyLightSerializer(serializers.ModelSerializer):
     purok            = serializers.CharField(
         source='household.purok.__str__', read_only=True
     )
-    family_count     = serializers.SerializerMethodField()
-    person_count     = serializers.SerializerMethodField()
 
     class Meta:
         model  = HouseholdSurvey
@@ -275,12 +395,7 @@ class HouseholdSurveyLightSerializer(serializers.ModelSerializer):
             'family_count', 'person_count',
             'is_deleted', 'created_at', 'updated_at',
         )
-
-    def get_family_count(self, obj):
-        return obj.families.count()
-
-    def get_person_count(self, obj):
-        return Person.objects.filter(family__household_survey=obj).count()
+        expandable_fields = {'families': (FamilySerializer, {'many': True, 'read_only': True})}
 
 
 class SurveyDataUpdateSerializer(serializers.Serializer):
@@ -492,29 +607,23 @@ class CreateSurveySerializer(serializers.Serializer):
 # Household
 # ─────────────────────────────────────────────────────────────────────────────
 
-class HouseholdSerializer(serializers.ModelSerializer):
-    """Full household read representation."""
-    purok_label       = serializers.CharField(source='purok.__str__', read_only=True)
-    latest_survey_year = serializers.SerializerMethodField()
-    survey_count      = serializers.SerializerMethodField()
+class HouseholdSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Full household read representation. The survey summary is read from
+    the maintained latest_survey / latest_survey_year / survey_count columns.
+    """
+    purok_label = serializers.CharField(source='purok.__str__', read_only=True)
 
     class Meta:
         model  = Household
         fields = (
             'id', 'household_number', 'purok', 'purok_label', 'address',
             'latitude', 'longitude', 'status', 'notes',
-            'latest_survey_year', 'survey_count',
+            'latest_survey', 'latest_survey_year', 'survey_count',
             'is_deleted', 'created_at', 'updated_at',
         )
         read_only_fields = ('id', 'created_at', 'updated_at')
 
-    def get_latest_survey_year(self, obj):
-        latest = obj.surveys.order_by('-survey_year').values('survey_year').first()
-        return latest['survey_year'] if latest else None
-
-    def get_survey_count(self, obj):
-        return obj.surveys.count()
-
 
 class HouseholdWriteSerializer(serializers.ModelSerializer):
     """Validates POST/PATCH payload for Household."""
@@ -573,3 +682,30 @@ class HouseholdChangeLogSerializer(serializers.ModelSerializer):
             'changed_at', 'ip_address', 'survey_year', 'notes',
         )
         read_only_fields = fields
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ExportJob
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    """Status of an asynchronous export (GET /reports/jobs/{id}/)."""
+    percent = serializers.SerializerMethodField()
+
+    class Meta:
+        model  = ExportJob
+        fields = (
+            'id', 'entity_type', 'fmt', 'filters', 'status',
+            'progress', 'total_rows', 'percent',
+            'filename', 'error',
+            'created_at', 'started_at', 'finished_at', 'expires_at',
+            'watermark',
+        )
+        read_only_fields = fields
+
+    def get_percent(self, obj):
+        if obj.status == ExportJob.Status.DONE:
+            return 100
+        if not obj.total_rows:
+            return None
+        return min(99, obj.progress * 100 // obj.total_rows)
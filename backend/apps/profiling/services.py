@@ -10,7 +10,9 @@ SERVICE CLASSES
   HouseholdService    — CRUD + status transitions + year-over-year comparison
   NormalizationService — NormalizedData population and batch rebuild
   QueryService         — Cross-year concept queries and demographic summaries
-  ReportService        — CSV and Excel export (PDF stubbed)
+  SpatialService       — Bounding-box / radius / nearest household map queries
+  MapTileService       — Precomputed clustered map tiles (z/x/y) + concept overlays
+  ReportService        — CSV, Excel, Parquet and Arrow export (PDF stubbed)
 
 CHANGE LOGGING
 ──────────────
@@ -26,33 +28,70 @@ Do NOT put log_change calls in model.save() or signals — only here, because
 signals don't have access to request.user.
 """
 
+import codecs
 import csv
+import gzip
+import hashlib
 import io
 import json
 import logging
+import tempfile
+import zipfile
+import zlib
 from collections import Counter
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import chain, islice
 from typing import Iterator
 
-from django.db import transaction
-from django.db.models import Count, Max, Prefetch, Q
-from django.db.models.functions import ExtractYear
+from django.core.files import File
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Max, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce, ExtractYear
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
+from . import analytics, bitmaps, sheets
 from .models import (
-    Family, FieldMapping, FormSchema, Household,
-    HouseholdChangeLog, HouseholdSurvey, NormalizedData,
-    Person, ProgramAvailed,
+    ConceptName, ConceptValue, DataVersion, ExportJob, Family, FieldMapping,
+    FormSchema, Household, HouseholdChangeLog, HouseholdMapCluster,
+    HouseholdMapLayer, HouseholdSurvey, NormalizedData, Person, ProgramAvailed,
+    SurveySnapshot,
+)
+from .spatial import (
+    CLUSTER_CELL_BITS, cluster_cell, cover_bbox, haversine_m, radius_bbox,
 )
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+try:
+    import weasyprint
+    WEASYPRINT_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: the package is installed but Pango / its system libraries are not
+    WEASYPRINT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,6 +169,26 @@ def _person_match_key(person: Person) -> tuple:
     )
 
 
+def _child_count(model, parent: str):
+    """
+    Correlated COUNT(*) of a child table's active rows for each outer row.
+
+    Replaces Count(<reverse relation>, distinct=True): those joins
+    multiply the parent rows (surveys × families × persons) and make
+    PostgreSQL sort / hash the whole product for the DISTINCT before
+    the first row can stream. The subquery is one index lookup per row.
+    """
+    children = (
+        model.objects
+        .filter(**{parent: OuterRef('pk')})
+        .order_by()
+        .values(parent)
+        .annotate(n=Count('*'))
+        .values('n')
+    )
+    return Coalesce(Subquery(children), 0)
+
+
 def _apply_transition(survey: HouseholdSurvey, action: str) -> str:
     """
     Validate and return the new status for a survey status transition.
@@ -204,6 +263,158 @@ class HouseholdService:
             updated_by=created_by,
         )
 
+    @staticmethod
+    @transaction.atomic
+    def update_household(household: Household, data: dict, updated_by) -> Household:
+        """
+        Apply validated HouseholdWriteSerializer data to a Household.
+
+        Moving a household to another purok also re-syncs the purok copied
+        onto its families, persons, programs, and NormalizedData rows (see
+        sync_purok_scope), so scoping stays correct for every survey year.
+
+        Only the submitted fields are written: a full save would put back
+        the survey summary columns (latest_survey, survey_count, ...) as
+        they were when `household` was loaded, undoing a concurrent refresh.
+        Household.save() adds geohash when a coordinate is among them.
+        """
+        old_purok_id = household.purok_id
+        for field, value in data.items():
+            setattr(household, field, value)
+        household.updated_by = updated_by
+        household.save(update_fields=[*data, 'updated_by', 'updated_at'])
+        # Snapshots embed household_number and the purok label
+        SnapshotService.invalidate(survey__household=household)
+
+        if household.purok_id != old_purok_id:
+            HouseholdService.sync_purok_scope(household)
+        return household
+
+    @staticmethod
+    def sync_purok_scope(household: Household | None = None) -> dict:
+        """
+        Re-copy purok / survey_year from household_survey → household onto
+        Family, Person, and ProgramAvailed (including soft-deleted rows), and
+        purok onto NormalizedData.
+
+        household=None re-syncs every row — used by
+        `manage.py sync_purok_scope` to repair or backfill.
+
+        Returns:
+            {'families': 3, 'persons': 12, 'programs': 4, 'normalized': 80}   (rows updated)
+        """
+        families   = Family.all_objects.all()
+        persons    = Person.all_objects.all()
+        programs   = ProgramAvailed.all_objects.all()
+        normalized = NormalizedData.objects.all()
+        if household is not None:
+            families   = families.filter(household_survey__household=household)
+            persons    = persons.filter(family__household_survey__household=household)
+            programs   = programs.filter(family__household_survey__household=household)
+            normalized = normalized.filter(household_survey__household=household)
+
+        surveys = HouseholdSurvey.all_objects.all()
+        if household is not None:
+            surveys = surveys.filter(household=household)
+        years = set(surveys.values_list('survey_year', flat=True))
+
+        survey = HouseholdSurvey.all_objects.filter(pk=OuterRef('household_survey_id')).order_by()
+        family_count = families.update(
+            purok_id=Subquery(survey.values('household__purok_id')[:1]),
+            survey_year=Subquery(survey.values('survey_year')[:1]),
+        )
+
+        # Families are already correct, so persons/programs copy from them
+        family = Family.all_objects.filter(pk=OuterRef('family_id')).order_by()
+        scope = {
+            'purok_id':    Subquery(family.values('purok_id')[:1]),
+            'survey_year': Subquery(family.values('survey_year')[:1]),
+        }
+        transaction.on_commit(lambda: DataVersion.bump(DataVersion.Key.NORMALIZED, *years))
+        return {
+            'families':   family_count,
+            'persons':    persons.update(**scope),
+            'programs':   programs.update(**scope),
+            'normalized': normalized.update(
+                purok_id=Subquery(survey.values('household__purok_id')[:1]),
+            ),
+        }
+
+    @staticmethod
+    def reconcile_survey_counts(surveys=None) -> int:
+        """
+        Recount HouseholdSurvey.family_count / person_count from the active
+        Family and Person rows, writing only the surveys that drifted.
+
+        surveys=None checks every survey (soft-deleted ones included) —
+        used by `manage.py reconcile_survey_counts` after bulk imports or
+        raw SQL fixes that bypassed the service layer.
+
+        Returns:
+            number of surveys corrected
+        """
+        if surveys is None:
+            surveys = HouseholdSurvey.all_objects.all()
+        counted = surveys.annotate(
+            actual_families=_child_count(Family, 'household_survey'),
+            actual_persons=_child_count(Person, 'family__household_survey'),
+        )
+        drifted = counted.exclude(
+            family_count=F('actual_families'), person_count=F('actual_persons'),
+        ).order_by().values('pk')
+        return HouseholdSurvey.all_objects.filter(pk__in=drifted).update(
+            family_count=_child_count(Family, 'household_survey'),
+            person_count=_child_count(Person, 'family__household_survey'),
+        )
+
+    @staticmethod
+    def _survey_summary() -> dict:
+        """Household.latest_survey / latest_survey_year / survey_count, as subqueries."""
+        latest = HouseholdSurvey.objects.filter(household=OuterRef('pk')).order_by('-survey_year')
+        return {
+            'latest_survey_id':   Subquery(latest.values('pk')[:1]),
+            'latest_survey_year': Subquery(latest.values('survey_year')[:1]),
+            'survey_count':       _child_count(HouseholdSurvey, 'household'),
+        }
+
+    @staticmethod
+    def refresh_survey_summary(household: Household) -> None:
+        """
+        Recompute a household's survey summary columns in one UPDATE.
+        Called after a survey is created, soft-deleted, or restored.
+        """
+        summary = HouseholdService._survey_summary()
+        Household.all_objects.filter(pk=household.pk).update(**summary)
+        household.refresh_from_db(fields=['latest_survey', 'latest_survey_year', 'survey_count'])
+
+    @staticmethod
+    def reconcile_survey_summaries(households=None) -> int:
+        """
+        Recompute Household.latest_survey / latest_survey_year / survey_count
+        from the active surveys, writing only the households that drifted.
+
+        households=None checks every household (soft-deleted ones included).
+
+        Returns:
+            number of households corrected
+        """
+        if households is None:
+            households = Household.all_objects.all()
+        summary = HouseholdService._survey_summary()
+        counted = households.annotate(
+            actual_id=summary['latest_survey_id'],
+            actual_year=summary['latest_survey_year'],
+            actual_count=summary['survey_count'],
+        )
+        # NULL never equals NULL in SQL — households without surveys match explicitly
+        in_sync = (
+            Q(survey_count=F('actual_count'))
+            & (Q(latest_survey_id=F('actual_id')) | Q(latest_survey__isnull=True, actual_id__isnull=True))
+            & (Q(latest_survey_year=F('actual_year')) | Q(latest_survey_year__isnull=True, actual_year__isnull=True))
+        )
+        drifted = counted.exclude(in_sync).order_by().values('pk')
+        return Household.all_objects.filter(pk__in=drifted).update(**summary)
+
     # ── Survey: full nested create ────────────────────────────────────────────
 
     @staticmethod
@@ -295,11 +506,14 @@ class HouseholdService:
 
         # Create families, persons, programs
         for family_dict in families_data:
-            HouseholdService._create_family_with_members(
+            survey.person_count += HouseholdService._create_family_with_members(
                 survey=survey,
                 family_dict=family_dict,
                 created_by=created_by,
             )
+        survey.family_count = len(families_data)
+        survey.save(update_fields=['family_count', 'person_count'])
+        HouseholdService.refresh_survey_summary(household)
 
         # Log the creation
         HouseholdChangeLog.log_change(
@@ -316,10 +530,12 @@ class HouseholdService:
         return survey
 
     @staticmethod
-    def _create_family_with_members(survey: HouseholdSurvey, family_dict: dict, created_by):
+    def _create_family_with_members(survey: HouseholdSurvey, family_dict: dict, created_by) -> int:
         """
         Internal helper: create one Family with its Persons and Programs.
         Must be called inside an active transaction.atomic() block.
+
+        Returns the number of persons created (for survey.person_count).
         """
         # Auto-assign sequential family_number within this survey.
         # MAX + 1 inside the transaction prevents race conditions.
@@ -328,6 +544,12 @@ class HouseholdService:
         ).aggregate(m=Max('family_number'))['m'] or 0
         family_number = last_num + 1
 
+        # Denormalized scope copied onto every row created below
+        scope = {
+            'purok_id':    survey.household.purok_id,
+            'survey_year': survey.survey_year,
+        }
+
         family = Family.objects.create(
             household_survey=survey,
             family_number=family_dict.get('family_number', family_number),
@@ -338,6 +560,7 @@ class HouseholdService:
             data=family_dict.get('data', {}),
             created_by=created_by,
             updated_by=created_by,
+            **scope,
         )
 
         # Create persons — collect in list to resolve beneficiary_index later
@@ -360,6 +583,7 @@ class HouseholdService:
                 data=person_dict.get('data', {}),
                 created_by=created_by,
                 updated_by=created_by,
+                **scope,
             )
             created_persons.append(person)
 
@@ -382,10 +606,23 @@ class HouseholdService:
                 data=prog_dict.get('data', {}),
                 created_by=created_by,
                 updated_by=created_by,
+                **scope,
             )
+        return len(created_persons)
 
     # ── Survey: data mutations ────────────────────────────────────────────────
 
+    @staticmethod
+    def touch_survey(*survey_ids) -> None:
+        """
+        Set updated_at on the given surveys after one of their families,
+        persons or programs changed. A survey's ETag is built from its own
+        row, so child edits have to show up there. Programs can still change
+        under a VERIFIED survey, so its snapshot is dropped too.
+        """
+        HouseholdSurvey.all_objects.filter(pk__in=set(survey_ids)).update(updated_at=timezone.now())
+        SnapshotService.invalidate(survey__in=set(survey_ids))
+
     @staticmethod
     @transaction.atomic
     def update_survey_data(
@@ -478,6 +715,7 @@ class HouseholdService:
 
         family.updated_by = updated_by
         family.save()
+        HouseholdService.touch_survey(survey.pk)
 
         HouseholdChangeLog.log_change(
             household=survey.household,
@@ -535,6 +773,7 @@ class HouseholdService:
 
         person.updated_by = updated_by
         person.save()
+        HouseholdService.touch_survey(survey.pk)
 
         HouseholdChangeLog.log_change(
             household=survey.household,
@@ -604,6 +843,7 @@ class HouseholdService:
         survey.save(update_fields=[
             'status', 'verified_by', 'verified_at', 'notes', 'updated_by', 'updated_at'
         ])
+        SnapshotService.build(survey.pk)
 
         HouseholdChangeLog.log_change(
             household=survey.household,
@@ -637,6 +877,7 @@ class HouseholdService:
         survey.notes = notes
         survey.updated_by = requested_by
         survey.save(update_fields=['status', 'notes', 'updated_by', 'updated_at'])
+        SnapshotService.invalidate(survey=survey)
 
         HouseholdChangeLog.log_change(
             household=survey.household,
@@ -663,18 +904,32 @@ class HouseholdService:
         NEVER calls .delete() — only sets is_deleted=True on all records.
 
         The cascade is manual (not DB-level) so each deletion is logged.
+        Every record deleted here gets the same deleted_at as the survey,
+        which is how restore_survey() knows which children to bring back.
+        NormalizedData rows are deactivated, not removed. With every child
+        deleted, family_count / person_count drop to 0.
         """
-        # Cascade soft delete to children
-        for family in Family.all_objects.filter(household_survey=survey):
-            Person.all_objects.filter(family=family).update(
-                is_deleted=True, deleted_at=timezone.now(), deleted_by=deleted_by
-            )
-            ProgramAvailed.all_objects.filter(family=family).update(
-                is_deleted=True, deleted_at=timezone.now(), deleted_by=deleted_by
-            )
-            family.soft_delete(deleted_by_user=deleted_by)
+        now = timezone.now()
+        deleted = {'is_deleted': True, 'deleted_at': now, 'deleted_by': deleted_by}
 
-        survey.soft_delete(deleted_by_user=deleted_by)
+        # Cascade soft delete to children (already-deleted rows keep their stamp)
+        for family in Family.all_objects.filter(household_survey=survey):
+            Person.all_objects.filter(family=family, is_deleted=False).update(**deleted)
+            ProgramAvailed.all_objects.filter(family=family, is_deleted=False).update(**deleted)
+            if not family.is_deleted:
+                for field, value in deleted.items():
+                    setattr(family, field, value)
+                family.save(update_fields=list(deleted))
+
+        for field, value in deleted.items():
+            setattr(survey, field, value)
+        survey.family_count = 0
+        survey.person_count = 0
+        survey.save(update_fields=[*deleted, 'family_count', 'person_count'])
+        HouseholdService.refresh_survey_summary(survey.household)
+        SnapshotService.invalidate(survey=survey)
+
+        NormalizedData.objects.filter(household_survey=survey).update(is_active=False)
 
         HouseholdChangeLog.log_change(
             household=survey.household,
@@ -687,6 +942,56 @@ class HouseholdService:
             survey_year=survey.survey_year,
         )
 
+    @staticmethod
+    @transaction.atomic
+    def restore_survey(
+        survey: HouseholdSurvey,
+        restored_by,
+        ip_address: str | None = None,
+    ) -> HouseholdSurvey:
+        """
+        Undo soft_delete_survey(): restore the survey, the families, persons,
+        and programs deleted in the same cascade (matched on deleted_at), and
+        reactivate the survey's NormalizedData rows.
+
+        Children that were deleted individually before the survey stay deleted,
+        so family_count / person_count are recounted rather than restored.
+        """
+        if not survey.is_deleted:
+            return survey
+
+        deleted_at = survey.deleted_at
+        restored   = {'is_deleted': False, 'deleted_at': None, 'deleted_by': None}
+
+        Person.all_objects.filter(
+            family__household_survey=survey, is_deleted=True, deleted_at=deleted_at,
+        ).update(**restored)
+        ProgramAvailed.all_objects.filter(
+            family__household_survey=survey, is_deleted=True, deleted_at=deleted_at,
+        ).update(**restored)
+        for family in Family.all_objects.filter(
+            household_survey=survey, is_deleted=True, deleted_at=deleted_at,
+        ):
+            family.restore()
+
+        survey.restore()
+        HouseholdService.reconcile_survey_counts(HouseholdSurvey.all_objects.filter(pk=survey.pk))
+        survey.refresh_from_db(fields=['family_count', 'person_count'])
+        HouseholdService.refresh_survey_summary(survey.household)
+        NormalizedData.objects.filter(household_survey=survey).update(is_active=True)
+
+        HouseholdChangeLog.log_change(
+            household=survey.household,
+            target_type=HouseholdChangeLog.TargetType.SURVEY,
+            target_id=survey.id,
+            action=HouseholdChangeLog.Action.RESTORED,
+            changed_fields={'is_deleted': {'old': True, 'new': False}},
+            changed_by=restored_by,
+            ip_address=ip_address,
+            survey_year=survey.survey_year,
+        )
+        return survey
+
     # ── Cross-year comparison ─────────────────────────────────────────────────
 
     @staticmethod
@@ -750,10 +1055,16 @@ class HouseholdService:
             diff = HouseholdService.compare_surveys(survey_2024, survey_2026)
         """
         # ── Household-level diff via NormalizedData ──────────────────────────
-        nd_a = {nd.canonical_name: nd for nd in
-                NormalizedData.objects.filter(household_survey=survey_a, level='household')}
-        nd_b = {nd.canonical_name: nd for nd in
-                NormalizedData.objects.filter(household_survey=survey_b, level='household')}
+        rows_a = list(NormalizedData.objects.filter(household_survey=survey_a, level='household'))
+        rows_b = list(NormalizedData.objects.filter(household_survey=survey_b, level='household'))
+        # Warm the dictionary caches up front so the string properties below
+        # don't each cost a query on a cold process
+        ConceptName.texts_for(nd.concept_id for nd in rows_a + rows_b)
+        ConceptValue.texts_for(
+            pk for nd in rows_a + rows_b for pk in (nd.value_id, nd.raw_id)
+        )
+        nd_a = {nd.canonical_name: nd for nd in rows_a}
+        nd_b = {nd.canonical_name: nd for nd in rows_b}
 
         # Warn if NormalizedData hasn't been populated yet
         missing_nd = not nd_a and bool(survey_a.data)
@@ -943,6 +1254,93 @@ def _compare_persons(persons_a: list, persons_b: list) -> tuple[list, int, int]:
     return results, added, removed
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# SnapshotService
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SnapshotService:
+    """
+    Pre-rendered responses for VERIFIED surveys (see models.SurveySnapshot).
+
+    build() renders HouseholdSurveySerializer over the full tree with the
+    same JSONRenderer the API uses, so a snapshot is byte-for-byte the body
+    a fresh GET /surveys/{id}/ would return — gzip-compressed (mtime=0, so
+    the bytes only depend on the JSON).
+
+    Each snapshot carries a stamp of STAMP_FIELDS — every column outside
+    the survey's own tree that the body embeds. content() compares it with
+    the current rows in the same query that reads the snapshot, and
+    rebuilds on a mismatch.
+    """
+
+    STAMP_FIELDS = (
+        'updated_at', 'form_schema__updated_at',
+        'household__household_number', 'household__purok__number', 'household__purok__name',
+        'surveyed_by__first_name', 'surveyed_by__last_name', 'surveyed_by__email',
+        'verified_by__first_name', 'verified_by__last_name', 'verified_by__email',
+    )
+
+    @staticmethod
+    def stamp(values) -> str:
+        """Hash of the STAMP_FIELDS values of one survey."""
+        payload = json.dumps(list(values), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def build(cls, survey_id) -> bytes:
+        """Render and store the snapshot of one survey; returns the compressed bytes."""
+        # serializers imports this module — import at call time
+        from rest_framework.renderers import JSONRenderer
+        from .serializers import HouseholdSurveySerializer
+
+        # Stamped before rendering: a change in between makes the snapshot
+        # look stale, never fresh
+        stamp = cls.stamp(
+            HouseholdSurvey.all_objects.filter(pk=survey_id).values_list(*cls.STAMP_FIELDS).get()
+        )
+        survey = (
+            HouseholdSurvey.all_objects
+            .select_related('household__purok', 'form_schema', 'surveyed_by', 'verified_by')
+            .prefetch_related(Prefetch('families', queryset=Family.objects.prefetch_related(
+                Prefetch('persons', queryset=Person.objects.all()),
+                Prefetch('programs_availed', queryset=ProgramAvailed.objects.select_related('beneficiary')),
+            )))
+            .get(pk=survey_id)
+        )
+        raw     = JSONRenderer().render(HouseholdSurveySerializer(survey).data)
+        content = gzip.compress(raw, mtime=0)
+        SurveySnapshot.objects.update_or_create(
+            survey_id=survey_id,
+            defaults={'content': content, 'size': len(raw), 'stamp': stamp},
+        )
+        return content
+
+    @classmethod
+    def content(cls, survey: HouseholdSurvey) -> bytes | None:
+        """
+        The compressed snapshot of an active VERIFIED survey — built now if it
+        has none yet or its stamp is stale. None for any other survey
+        (serialize it normally). Reads survey.status / is_deleted only.
+        """
+        if survey.is_deleted or survey.status != HouseholdSurvey.SurveyStatus.VERIFIED:
+            return None
+        row = (
+            SurveySnapshot.objects
+            .filter(survey_id=survey.pk)
+            .values_list('content', 'stamp', *(f'survey__{path}' for path in cls.STAMP_FIELDS))
+            .first()
+        )
+        if row is None or row[1] != cls.stamp(row[2:]):
+            return cls.build(survey.pk)
+        return bytes(row[0])
+
+    @staticmethod
+    def invalidate(**filters) -> int:
+        """Delete the snapshots matching `filters` (SurveySnapshot lookups)."""
+        deleted, _ = SurveySnapshot.objects.filter(**filters).delete()
+        return deleted
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # NormalizationService
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1046,8 +1444,31 @@ class QueryService:
     Cross-year queries using the NormalizedData table.
 
     All query methods return querysets or plain dicts — never raw SQL strings.
+
+    NormalizedData stores dictionary ids, not strings (see ConceptName /
+    ConceptValue). Every method here takes and returns plain strings and does
+    the translation itself, so callers never see the encoding.
     """
 
+    @staticmethod
+    def _concept_lookup(canonical_name: str, canonical_value: str | None = None) -> dict | None:
+        """
+        NormalizedData filter kwargs for a concept (and optionally a value),
+        translated to dictionary ids. None when either string was never
+        normalized — the caller can short-circuit to an empty result without
+        touching NormalizedData at all.
+        """
+        concept_id = ConceptName.id_for(canonical_name)
+        if concept_id is None:
+            return None
+        lookup = {'concept_id': concept_id}
+        if canonical_value is not None:
+            value_id = ConceptValue.id_for(canonical_value)
+            if value_id is None:
+                return None
+            lookup['value_id'] = value_id
+        return lookup
+
     @staticmethod
     def filter_by_concept(
         canonical_name: str,
@@ -1084,14 +1505,18 @@ class QueryService:
                 year_end=2026,
             )
         """
+        lookup = QueryService._concept_lookup(canonical_name, canonical_value)
+        if lookup is None:
+            return HouseholdSurvey.objects.none()
+
         matching_survey_ids = (
             NormalizedData.objects
             .filter(
-                canonical_name=canonical_name,
-                canonical_value=canonical_value,
+                **lookup,
                 level=level,
                 survey_year__gte=year_start,
                 survey_year__lte=year_end,
+                is_active=True,
             )
             .values_list('household_survey_id', flat=True)
             .distinct()
@@ -1134,13 +1559,23 @@ class QueryService:
                 years=[2024, 2025, 2026],
             )
         """
+        lookup = QueryService._concept_lookup(canonical_name, canonical_value)
+        if lookup is None:
+            return [{'year': y, 'count': 0} for y in sorted(years)]
+
+        if analytics.engine_enabled():
+            result_map = analytics.engine.trend(
+                lookup['concept_id'], lookup['value_id'], set(years), purok_ids,
+            )
+            return [{'year': y, 'count': result_map[y]} for y in sorted(years)]
+
         qs = NormalizedData.objects.filter(
-            canonical_name=canonical_name,
-            canonical_value=canonical_value,
+            **lookup,
             survey_year__in=years,
+            is_active=True,
         )
         if purok_ids:
-            qs = qs.filter(household_survey__household__purok_id__in=purok_ids)
+            qs = qs.filter(purok_id__in=purok_ids)
 
         rows = (
             qs
@@ -1154,6 +1589,126 @@ class QueryService:
         result_map = {row['survey_year']: row['count'] for row in rows}
         return [{'year': y, 'count': result_map.get(y, 0)} for y in sorted(years)]
 
+    @staticmethod
+    def get_concept_values(
+        canonical_name: str,
+        year: int | None = None,
+        purok_ids: list | None = None,
+    ) -> list[dict]:
+        """
+        Distinct canonical values recorded for a concept, with the number of
+        surveys per value, most common first. Soft-deleted surveys excluded.
+
+        Returns:
+            [{'canonical_value': 'level_3', 'count': 450}, ...]
+        """
+        lookup = QueryService._concept_lookup(canonical_name)
+        if lookup is None:
+            return []
+
+        if year is not None and analytics.engine_enabled():
+            counts = analytics.engine.value_counts(lookup['concept_id'], year, purok_ids)
+            rows = [
+                {'value_id': value_id, 'count': count}
+                for value_id, count in sorted(counts.items(), key=lambda item: -item[1])
+            ]
+        else:
+            qs = NormalizedData.objects.filter(**lookup, is_active=True)
+            if year is not None:
+                qs = qs.filter(survey_year=year)
+            if purok_ids:
+                qs = qs.filter(purok_id__in=purok_ids)
+
+            # Group on the integer id, decode the (few) distinct values afterwards
+            rows = list(
+                qs.values('value_id')
+                .annotate(count=Count('household_survey', distinct=True))
+                .order_by('-count')
+            )
+        texts = ConceptValue.texts_for(row['value_id'] for row in rows)
+        return [
+            {'canonical_value': texts.get(row['value_id'], ''), 'count': row['count']}
+            for row in rows
+        ]
+
+    @staticmethod
+    def count_matching(
+        conditions: list[tuple[str, str]],
+        year: int,
+        purok_ids: list | None = None,
+    ) -> int:
+        """
+        Number of households whose `year` survey matches EVERY
+        (canonical_name, canonical_value) pair — the cross-tab cell count
+        behind dashboard tiles such as "no toilet AND deep-well water".
+
+        Example:
+            QueryService.count_matching(
+                [('water_source', 'level_1'), ('toilet_facility', 'none')],
+                year=2025,
+            )
+        """
+        lookups = [QueryService._concept_lookup(name, value) for name, value in conditions]
+        if not lookups or None in lookups:
+            return 0
+
+        if analytics.engine_enabled():
+            return analytics.engine.count_matching(
+                [(lookup['concept_id'], lookup['value_id']) for lookup in lookups],
+                year, purok_ids,
+            )
+
+        qs = HouseholdSurvey.objects.filter(survey_year=year)
+        for lookup in lookups:
+            qs = qs.filter(pk__in=NormalizedData.objects.filter(
+                **lookup, survey_year=year, is_active=True,
+            ).values('household_survey_id'))
+        if purok_ids:
+            qs = qs.filter(household__purok_id__in=purok_ids)
+        return qs.count()
+
+    @staticmethod
+    def target_households(where: dict, year: int, purok_ids: list | None = None):
+        """
+        Households whose `year` survey satisfies a boolean targeting
+        expression of concept predicates (AND / OR / NOT — grammar in
+        bitmaps.py).
+
+        The expression is evaluated entirely on the HouseholdBitmap index;
+        PostgreSQL is only asked for the Household rows of the final set.
+
+        Raises:
+            ValueError: malformed expression
+
+        Example:
+            # 2025 households on deep-well water without grid electricity
+            QueryService.target_households({'and': [
+                {'concept': 'water_source', 'value': 'level_1'},
+                {'not': {'concept': 'electricity_source', 'value': 'grid'}},
+            ]}, year=2025)
+        """
+        ordinals = bitmaps.members(bitmaps.evaluate(where, year))
+        qs = (
+            Household.objects
+            .filter(ordinal__id__in=ordinals)
+            .select_related('purok')
+        )
+        if purok_ids:
+            qs = qs.filter(purok_id__in=purok_ids)
+        return qs
+
+    @staticmethod
+    def count_target(where: dict, year: int, purok_ids: list | None = None) -> int:
+        """
+        Size of target_households(). Without a purok scope this is a popcount
+        of the result bitmap and never touches the household table — like
+        get_trend it counts surveys, so a soft-deleted household whose survey
+        is still active is included.
+        """
+        if purok_ids:
+            return QueryService.target_households(where, year, purok_ids).count()
+        return bitmaps.evaluate(where, year).bit_count()
+
     @staticmethod
     def search_persons(
         query: str,
@@ -1197,12 +1752,10 @@ class QueryService:
             )
 
         if survey_year is not None:
-            qs = qs.filter(family__household_survey__survey_year=survey_year)
+            qs = qs.filter(survey_year=survey_year)
 
         if purok_ids:
-            qs = qs.filter(
-                family__household_survey__household__purok_id__in=purok_ids
-            )
+            qs = qs.filter(purok_id__in=purok_ids)
 
         if sectors:
             # JSONField containment: person must have ALL specified sectors
@@ -1316,89 +1869,810 @@ class QueryService:
             'income_brackets':      income_counts,
         }
 
+    @staticmethod
+    def get_facet_counts(
+        qs,
+        facets: dict[str, str],
+        array_facets: tuple[str, ...] = (),
+    ) -> dict:
+        """
+        Count every facet of an (already filtered) queryset in ONE query.
+
+        The filtered queryset becomes a subquery projecting only the facet
+        columns, and PostgreSQL aggregates it once with GROUPING SETS —
+        one grouping set per facet plus the empty set for the grand total:
+
+            SELECT f.gender, f.purok, GROUPING(f.gender), GROUPING(f.purok), COUNT(*)
+            FROM (<filtered queryset>) f
+            GROUP BY GROUPING SETS ((f.gender), (f.purok), ())
+
+        GROUPING(col) = 0 marks which facet a result row belongs to.
+
+        Facets named in array_facets hold a JSON array (Person.sectors);
+        they are unnested with a LATERAL join, and every count switches to
+        COUNT(DISTINCT pk) so the extra rows never inflate other facets.
+        Rows with an empty array are counted under the None key.
+
+        Args:
+            qs:            Filtered queryset (filterset + scoping applied)
+            facets:        {facet_name: ORM path}, e.g. {'purok': 'household__purok__number'}
+            array_facets:  Facet names whose column is a JSON array
+
+        Returns:
+            {'total': 120, 'facets': {'gender': {'MALE': 60, 'FEMALE': 58, None: 2}, ...}}
+        """
+        qn = connection.ops.quote_name
+        aliases = {name: f'facet_{name}' for name in facets}
+
+        inner = (
+            qs.order_by()
+            .prefetch_related(None)
+            .annotate(facet_row_id=F('pk'))
+            .annotate(**{aliases[name]: F(path) for name, path in facets.items()})
+            .values('facet_row_id', *aliases.values())
+        )
+        inner_sql, params = inner.query.get_compiler(using=inner.db).as_sql()
+
+        columns = {}
+        laterals = []
+        for name in facets:
+            if name in array_facets:
+                element = qn(f'{aliases[name]}_el')
+                laterals.append(
+                    f"LEFT JOIN LATERAL jsonb_array_elements_text("
+                    f"CASE WHEN jsonb_typeof(f.{qn(aliases[name])}) = 'array' "
+                    f"THEN f.{qn(aliases[name])} ELSE '[]'::jsonb END"
+                    f") AS {element}(value) ON TRUE"
+                )
+                columns[name] = f'{element}.value'
+            else:
+                columns[name] = f'f.{qn(aliases[name])}'
+
+        count_expr    = 'COUNT(DISTINCT f.facet_row_id)' if array_facets else 'COUNT(*)'
+        select_cols   = ', '.join(columns.values())
+        grouping_cols = ', '.join(f'GROUPING({col})' for col in columns.values())
+        grouping_sets = ', '.join(f'({col})' for col in columns.values())
+        sql = (
+            f'SELECT {select_cols}, {grouping_cols}, {count_expr} '
+            f'FROM ({inner_sql}) f {" ".join(laterals)} '
+            f'GROUP BY GROUPING SETS ({grouping_sets}, ())'
+        )
+
+        n = len(columns)
+        names = list(columns)
+        result = {'total': 0, 'facets': {name: {} for name in names}}
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for row in cursor.fetchall():
+                values, grouping, count = row[:n], row[n:2 * n], row[-1]
+                if all(grouping):
+                    result['total'] = count
+                    continue
+                idx = grouping.index(0)
+                result['facets'][names[idx]][values[idx]] = count
+        return result
+
 
 # ─────────────────────────────────────────────────────────────────────────────
-# ReportService
+# SpatialService
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
-class ExportResult:
-    """Returned by ReportService.generate_export(). Pass directly to HttpResponse."""
-    content:      bytes
-    content_type: str
-    filename:     str
+class SpatialService:
+    """
+    Map queries over Household coordinates, backed by Household.geohash.
 
+    Every method takes a Household queryset (already purok-scoped and
+    filtered by the caller) and narrows it spatially, so permission rules
+    and HouseholdFilter params keep working on the map endpoint.
 
-class ReportService:
+    Results are compact row tuples rather than model instances — the map
+    only needs a pin per household, and thousands of pins must fit in one
+    response.
     """
-    Generates downloadable exports (CSV, Excel) from profiling data.
 
-    Supported entity_types:
-        'household' — Household records with latest survey summary
-        'survey'    — HouseholdSurvey records
-        'family'    — Family records with household+survey context
-        'person'    — All Person records (demographic data)
-        'program'   — ProgramAvailed records
+    # Columns returned for each pin (in this order)
+    POINT_FIELDS = ('id', 'household_number', 'latitude', 'longitude', 'status')
 
-    Supported formats:
-        'csv'   — Single-sheet CSV (utf-8-sig BOM for Excel compatibility)
-        'excel' — Single-sheet .xlsx (requires openpyxl; add to requirements)
-        'pdf'   — Not yet implemented (requires weasyprint or reportlab)
+    # Hard cap on pins per response; the map should zoom in past this
+    MAX_POINTS = 10_000
 
-    Filters dict (all optional):
-        'survey_year':  int or [int, int] range
-        'purok_ids':    list of Purok PKs
-        'status':       HouseholdSurvey status filter
-        'include_deleted': bool (default False)
-    """
+    # nearest(): start the search at this radius and double until satisfied
+    NEAREST_START_RADIUS_M = 250
+    NEAREST_MAX_RADIUS_M   = 50_000
 
-    # Column definitions for each entity type
-    ENTITY_COLUMNS = {
-        'household': [
-            'household_number', 'purok', 'address', 'status',
-            'latitude', 'longitude', 'total_surveys', 'latest_survey_year',
-            'created_at',
-        ],
-        'survey': [
-            'household_number', 'purok', 'survey_year', 'status',
-            'surveyed_by', 'surveyed_at', 'verified_by', 'verified_at',
-            'family_count', 'person_count', 'form_schema', 'created_at',
-        ],
-        'family': [
-            'household_number', 'purok', 'survey_year', 'family_number',
-            'monthly_income_bracket', 'person_count', 'programs_count',
-        ],
-        'person': [
-            'household_number', 'purok', 'survey_year', 'family_number',
-            'last_name', 'first_name', 'middle_name', 'suffix',
-            'role', 'gender', 'date_of_birth', 'age_at_survey',
-            'civil_status', 'educational_attainment',
-            'is_registered_voter', 'sectors',
-        ],
-        'program': [
-            'household_number', 'purok', 'survey_year', 'family_number',
-            'beneficiary_name', 'program_type', 'program_name',
-            'date_availed', 'amount', 'reference_no', 'description',
-        ],
-    }
+    @staticmethod
+    def _bbox_filter(qs, min_lat: float, min_lng: float, max_lat: float, max_lng: float):
+        """
+        Restrict qs to households inside the box.
 
-    @classmethod
-    def generate_export(
-        cls,
-        entity_type: str,
-        filters: dict,
-        fmt: str = 'csv',
-    ) -> ExportResult:
+        The geohash prefix OR-chain is what the index serves; the lat/lng
+        range check trims the edges of the covering cells.
         """
-        Generate a downloadable export file.
+        qs = qs.filter(
+            latitude__gte=min_lat, latitude__lte=max_lat,
+            longitude__gte=min_lng, longitude__lte=max_lng,
+        )
+        prefixes = cover_bbox(min_lat, min_lng, max_lat, max_lng)
+        if prefixes:
+            prefix_q = Q()
+            for prefix in prefixes:
+                prefix_q |= Q(geohash__startswith=prefix)
+            qs = qs.filter(prefix_q)
+        return qs
 
-        Args:
-            entity_type: One of ENTITY_COLUMNS keys
-            filters:     Dict of filter params (see class docstring)
-            fmt:         'csv' | 'excel' | 'pdf'
+    @classmethod
+    def _points(cls, qs):
+        return qs.order_by('geohash').values_list(*cls.POINT_FIELDS)
+
+    @staticmethod
+    def _pin(row) -> list:
+        """Serialize one POINT_FIELDS tuple into a JSON-friendly list."""
+        pk, number, lat, lng, status = row
+        return [str(pk), number, float(lat), float(lng), status]
+
+    @classmethod
+    def in_bbox(
+        cls,
+        qs,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+    ) -> dict:
+        """
+        All households whose pin falls inside the bounding box.
 
         Returns:
-            ExportResult with content bytes, content_type, and filename
+            {'count': N, 'truncated': bool, 'fields': [...], 'points': [[...], ...]}
+        """
+        rows = list(
+            cls._points(cls._bbox_filter(qs, min_lat, min_lng, max_lat, max_lng))
+            [:cls.MAX_POINTS + 1]
+        )
+        truncated = len(rows) > cls.MAX_POINTS
+        points = [cls._pin(r) for r in rows[:cls.MAX_POINTS]]
+        return {
+            'count':     len(points),
+            'truncated': truncated,
+            'fields':    ['id', 'household_number', 'lat', 'lng', 'status'],
+            'points':    points,
+        }
+
+    @classmethod
+    def within_radius(cls, qs, lat: float, lng: float, radius_m: float) -> dict:
+        """
+        All households within radius_m metres of (lat, lng), nearest first.
+
+        The circle's bounding box goes through the index; the exact
+        haversine distance is checked in Python on that small candidate set.
+        """
+        candidates = cls._points(cls._bbox_filter(qs, *radius_bbox(lat, lng, radius_m)))
+        hits = []
+        for row in candidates.iterator(chunk_size=2000):
+            distance = haversine_m(lat, lng, row[2], row[3])
+            if distance <= radius_m:
+                hits.append((distance, row))
+        hits.sort(key=lambda h: h[0])
+
+        truncated = len(hits) > cls.MAX_POINTS
+        points = [cls._pin(row) + [round(d, 1)] for d, row in hits[:cls.MAX_POINTS]]
+        return {
+            'count':     len(points),
+            'truncated': truncated,
+            'fields':    ['id', 'household_number', 'lat', 'lng', 'status', 'distance_m'],
+            'points':    points,
+        }
+
+    @classmethod
+    def nearest(cls, qs, lat: float, lng: float, limit: int = 10) -> dict:
+        """
+        The `limit` households closest to (lat, lng).
+
+        Searches a growing radius (doubling from NEAREST_START_RADIUS_M) until
+        at least `limit` households lie inside the circle — only then is the
+        top-N guaranteed correct, because anything outside the circle is
+        farther than everything inside it.
+        """
+        radius = cls.NEAREST_START_RADIUS_M
+        hits: list = []
+        while True:
+            candidates = cls._points(cls._bbox_filter(qs, *radius_bbox(lat, lng, radius)))
+            hits = []
+            for row in candidates:
+                distance = haversine_m(lat, lng, row[2], row[3])
+                if distance <= radius:
+                    hits.append((distance, row))
+            if len(hits) >= limit or radius >= cls.NEAREST_MAX_RADIUS_M:
+                break
+            radius *= 2
+
+        hits.sort(key=lambda h: h[0])
+        points = [cls._pin(row) + [round(d, 1)] for d, row in hits[:limit]]
+        return {
+            'count':     len(points),
+            'truncated': False,
+            'fields':    ['id', 'household_number', 'lat', 'lng', 'status', 'distance_m'],
+            'points':    points,
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MapTileService
+# ─────────────────────────────────────────────────────────────────────────────
+
+class MapTileService:
+    """
+    Server-side clustered map tiles (slippy-map z/x/y) for households.
+
+    Clusters are precomputed per zoom level into HouseholdMapLayer /
+    HouseholdMapCluster, so serving a tile is one indexed range query no
+    matter how many households the barangay has. A layer goes stale when
+    its source data changes:
+
+        base layer     → stale when DataVersion('household') moves
+        overlay layer  → stale when household OR normalized version moves
+
+    Tile requests only build a layer the first time it is asked for
+    (one per zoom × overlay; overlay years are validated by the view), so
+    an empty tile always means "no households here". After that they serve
+    the layer as last built, flagged stale; rebuild_stale(), run by
+    `manage.py rebuild_map_layers`, refreshes stale layers outside the
+    request path. Deploy that worker, or stale tiles are never refreshed.
+
+    Overlays break each cluster down by the canonical value of one
+    household-level NormalizedData concept for one survey year, e.g.
+    water_source@2025 → {"level_3": 40, "level_2": 12}.
+    """
+
+    @staticmethod
+    def overlay_key(concept: str | None, year: int | None) -> str:
+        """'' for the base layer, 'water_source@2025' for an overlay."""
+        if not concept:
+            return ''
+        return f'{concept}@{year}'
+
+    @staticmethod
+    def _source_version(overlay: str) -> int:
+        """
+        Combined version of the data a layer is built from. Both counters
+        only ever grow, so their sum changes whenever either one does.
+        """
+        version = DataVersion.current(DataVersion.Key.HOUSEHOLD)
+        if overlay:
+            version += DataVersion.current(DataVersion.Key.NORMALIZED)
+        return version
+
+    @staticmethod
+    def parse_overlay(overlay: str) -> tuple[str | None, int | None]:
+        """Inverse of overlay_key(): (concept, year), or (None, None) for the base layer."""
+        if not overlay:
+            return None, None
+        concept, _, year = overlay.rpartition('@')
+        return concept, int(year)
+
+    @classmethod
+    def get_layer(cls, zoom: int, concept: str | None = None,
+                  year: int | None = None) -> tuple[HouseholdMapLayer, bool]:
+        """
+        (layer, stale) for (zoom, overlay).
+
+        A layer that was never built is built now — concurrent first
+        requests wait on its row lock instead of serving an empty layer.
+        A built layer is returned as-is, stale or not. Callers must
+        validate concept/year first — every new key is a layer to build.
+        """
+        overlay  = cls.overlay_key(concept, year)
+        layer, _ = HouseholdMapLayer.objects.get_or_create(zoom=zoom, overlay=overlay)
+        if layer.data_version is None:
+            cls.rebuild_layer(layer, wait=True)
+            layer.refresh_from_db(fields=['data_version', 'built_at'])
+        return layer, layer.data_version != cls._source_version(overlay)
+
+    @classmethod
+    def rebuild_layer(cls, layer: HouseholdMapLayer, wait: bool = False) -> bool:
+        """
+        Rebuild one layer if it is stale. The row is locked with SKIP LOCKED,
+        so concurrent workers split the stale layers instead of queueing on
+        one; wait=True blocks on the lock instead (first build, see
+        get_layer). Returns True if this call rebuilt it.
+        """
+        with transaction.atomic():
+            layer = (
+                HouseholdMapLayer.objects
+                .select_for_update(skip_locked=not wait)
+                .filter(pk=layer.pk)
+                .first()
+            )
+            if layer is None:
+                return False
+            version = cls._source_version(layer.overlay)
+            if layer.data_version == version:
+                return False
+            cls._build_layer(layer, *cls.parse_overlay(layer.overlay))
+            layer.data_version = version
+            layer.built_at     = timezone.now()
+            layer.save(update_fields=['data_version', 'built_at'])
+        return True
+
+    @classmethod
+    def rebuild_stale(cls) -> int:
+        """Rebuild every stale or never-built layer. Returns how many were rebuilt."""
+        return sum(
+            cls.rebuild_layer(layer)
+            for layer in HouseholdMapLayer.objects.order_by('zoom', 'overlay')
+        )
+
+    @classmethod
+    def _build_layer(cls, layer: HouseholdMapLayer, concept: str | None, year: int | None) -> int:
+        """
+        Replace every cluster of `layer` with a fresh aggregation.
+
+        One pass over the geocoded households; overlay values come from one
+        NormalizedData query. Returns the number of clusters written.
+        """
+        values_by_household = {}
+        concept_id = ConceptName.id_for(concept) if concept else None
+        if concept_id is not None:
+            value_ids = dict(
+                NormalizedData.objects
+                .filter(
+                    concept_id=concept_id,
+                    survey_year=year,
+                    level='household',
+                    is_active=True,
+                )
+                .values_list('household_survey__household_id', 'value_id')
+            )
+            texts = ConceptValue.texts_for(value_ids.values())
+            values_by_household = {hh: texts[pk] for hh, pk in value_ids.items()}
+
+        buckets: dict[tuple, list] = {}
+        households = (
+            Household.objects
+            .exclude(geohash='')
+            .values_list('id', 'purok_id', 'latitude', 'longitude')
+        )
+        for pk, purok_id, lat, lng in households.iterator(chunk_size=2000):
+            lat, lng = float(lat), float(lng)
+            cell_x, cell_y = cluster_cell(lat, lng, layer.zoom)
+            bucket = buckets.get((cell_x, cell_y, purok_id))
+            if bucket is None:
+                bucket = buckets[(cell_x, cell_y, purok_id)] = [0, 0.0, 0.0, Counter()]
+            bucket[0] += 1
+            bucket[1] += lat
+            bucket[2] += lng
+            if concept:
+                bucket[3][values_by_household.get(pk, '')] += 1
+
+        clusters = [
+            HouseholdMapCluster(
+                layer=layer,
+                cell_x=cell_x,
+                cell_y=cell_y,
+                purok_id=purok_id,
+                household_count=count,
+                latitude=lat_sum / count,
+                longitude=lng_sum / count,
+                value_counts=dict(values) if concept else {},
+            )
+            for (cell_x, cell_y, purok_id), (count, lat_sum, lng_sum, values) in buckets.items()
+        ]
+
+        layer.clusters.all().delete()
+        HouseholdMapCluster.objects.bulk_create(clusters, batch_size=1000)
+        return len(clusters)
+
+    @classmethod
+    def get_tile(
+        cls,
+        zoom: int,
+        x: int,
+        y: int,
+        purok_ids: list | None = None,
+        concept: str | None = None,
+        year: int | None = None,
+    ) -> dict:
+        """
+        Clusters that fall inside tile (zoom, x, y).
+
+        Per-purok clusters sharing a cell are merged here (count-weighted
+        centroid, summed value counts), after purok scoping is applied.
+
+        Returns:
+            {
+                'z': 14, 'x': 13720, 'y': 7550,
+                'overlay': 'water_source@2025' | '',
+                'fields': ['lat', 'lng', 'count', 'values'],
+                'clusters': [[14.59, 120.98, 42, {'level_3': 30, ...}], ...],
+                'total': 120,
+                'stale': False,    # True → served from an older build
+            }
+        """
+        layer, stale = cls.get_layer(zoom, concept, year)
+
+        span = 1 << CLUSTER_CELL_BITS
+        qs = HouseholdMapCluster.objects.filter(
+            layer=layer,
+            cell_x__gte=x * span, cell_x__lt=(x + 1) * span,
+            cell_y__gte=y * span, cell_y__lt=(y + 1) * span,
+        )
+        if purok_ids is not None:
+            qs = qs.filter(purok_id__in=purok_ids)
+
+        merged: dict[tuple, list] = {}
+        rows = qs.values_list(
+            'cell_x', 'cell_y', 'household_count', 'latitude', 'longitude', 'value_counts',
+        )
+        for cell_x, cell_y, count, lat, lng, values in rows:
+            cell = merged.get((cell_x, cell_y))
+            if cell is None:
+                cell = merged[(cell_x, cell_y)] = [0, 0.0, 0.0, Counter()]
+            cell[0] += count
+            cell[1] += lat * count
+            cell[2] += lng * count
+            cell[3].update(values)
+
+        clusters = [
+            [round(lat_w / count, 6), round(lng_w / count, 6), count, dict(values)]
+            for _, (count, lat_w, lng_w, values) in sorted(merged.items())
+        ]
+        return {
+            'z':        zoom,
+            'x':        x,
+            'y':        y,
+            'overlay':  layer.overlay,
+            'fields':   ['lat', 'lng', 'count', 'values'],
+            'clusters': clusters,
+            'total':    sum(c[2] for c in clusters),
+            'stale':    stale,
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ReportService
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that hands out what was written since the last
+    drain() — lets pyarrow's IPC writer feed a streaming response.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._parts    = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        chunk, self._parts = b''.join(self._parts), []
+        return chunk
+
+
+@dataclass
+class ExportResult:
+    """
+    Returned by ReportService.generate_export().
+
+    Exactly one of `content` (whole file, for HttpResponse) or `stream`
+    (iterator of byte chunks, for StreamingHttpResponse) is set.
+    """
+    content:      bytes | None
+    content_type: str
+    filename:     str
+    stream:       Iterator[bytes] | None = None
+    watermark:    str | None = None   # delta exports: pass as `since` next time
+
+
+class AnswerColumns:
+    """
+    Flattens the per-year JSON answers (HouseholdSurvey / Family / Person
+    .data) of one export into extra columns.
+
+    MODES:
+        'fields'    — one column per FormSchema field id, labeled and ordered
+                      as get_fields_for_level() lists them (newest schema
+                      first; older schemas append the ids they add)
+        'canonical' — one column per canonical name, so the same concept
+                      lines up across years; select values are translated
+                      with FieldMapping.get_canonical_value()
+
+    The schemas are resolved once, from the surveys the export covers;
+    each row then only does dictionary lookups (see row()).
+    """
+
+    MODES = ('fields', 'canonical')
+
+    # Entity type → FormSchema section level
+    LEVELS = {'survey': 'household', 'family': 'family', 'person': 'person'}
+
+    def __init__(self, mode: str, level: str, schemas, mappings: dict, reserved):
+        self.columns = []
+        self.labels  = {}
+        # schema id → [(column, field id, FieldMapping or None), ...]
+        self.fields  = {}
+
+        reserved = set(reserved)
+        keys     = {}
+        for schema in schemas:
+            pairs = []
+            for field in schema.get_fields_for_level(level):
+                field_id = field.get('id')
+                if not field_id:
+                    continue
+                key     = field.get('canonical', field_id) if mode == 'canonical' else field_id
+                mapping = mappings.get(key)
+                if key not in keys:
+                    # Never shadow a fixed column ('status', 'gender', ...)
+                    column = f'data_{key}' if key in reserved else key
+                    keys[key] = column
+                    self.columns.append(column)
+                    self.labels[column] = mapping.label if mapping else field.get('label', key)
+                pairs.append((keys[key], field_id, mapping))
+            self.fields[schema.pk] = pairs
+
+    @classmethod
+    def validate(cls, entity_type: str, mode: str) -> None:
+        """Raises ValueError for an unknown mode or an entity type without answers."""
+        if mode not in cls.MODES:
+            raise ValueError(f"Unknown answers mode '{mode}'. Choose from: {', '.join(cls.MODES)}")
+        if entity_type not in cls.LEVELS:
+            raise ValueError(
+                f"Answer columns are available for: {', '.join(cls.LEVELS)}, "
+                f"not '{entity_type}'."
+            )
+
+    @classmethod
+    def for_export(cls, entity_type: str, mode: str, survey_qs, reserved) -> 'AnswerColumns':
+        """Build the columns for an export whose surveys are `survey_qs`."""
+        cls.validate(entity_type, mode)
+        level   = cls.LEVELS[entity_type]
+        schemas = FormSchema.objects.filter(
+            pk__in=survey_qs.order_by().values('form_schema_id'),
+        ).order_by('-year', '-version')
+        mappings = {}
+        if mode == 'canonical':
+            mappings = {m.canonical_name: m for m in FieldMapping.objects.filter(level=level)}
+        return cls(mode, level, list(schemas), mappings, reserved)
+
+    @staticmethod
+    def _flat(value):
+        """Multiselect lists pipe-joined like Person.sectors; objects as JSON."""
+        if isinstance(value, list):
+            return '|'.join(str(v) for v in value)
+        if isinstance(value, dict):
+            return json.dumps(value, ensure_ascii=False, sort_keys=True)
+        return value
+
+    def row(self, schema_id, year: int, data: dict | None) -> dict:
+        """Answer columns for one record filled with form_schema `schema_id`."""
+        data   = data or {}
+        result = dict.fromkeys(self.columns, '')
+        for column, field_id, mapping in self.fields.get(schema_id, ()):
+            value = data.get(field_id)
+            if value is None or value == '':
+                continue
+            if mapping is not None:
+                if isinstance(value, list):
+                    value = [mapping.get_canonical_value(year, v) for v in value]
+                elif isinstance(value, str):
+                    value = mapping.get_canonical_value(year, value)
+            result[column] = self._flat(value)
+        return result
+
+
+class ReportService:
+    """
+    Generates downloadable exports (CSV, Excel) from profiling data.
+
+    Supported entity_types:
+        'household' — Household records with latest survey summary
+        'survey'    — HouseholdSurvey records
+        'family'    — Family records with household+survey context
+        'person'    — All Person records (demographic data)
+        'program'   — ProgramAvailed records
+        'bundle'    — All five in one ZIP (see generate_bundle)
+        'sheets'    — Printable per-household profile sheets, one ZIP per
+                      purok selection (see generate_sheets; html / pdf)
+
+    Supported formats:
+        'csv'     — Single-sheet CSV (utf-8-sig BOM for Excel compatibility)
+        'excel'   — Single-sheet .xlsx (requires openpyxl; add to requirements)
+        'parquet' — Typed columnar file for pandas / analysts (requires pyarrow)
+        'arrow'   — Arrow IPC stream, same schema as parquet (requires pyarrow)
+        'pdf'     — Profile sheets only; tabular PDF is not implemented
+
+    Filters dict (all optional):
+        'survey_year':  int or [int, int] range
+        'purok_ids':    list of Purok PKs
+        'status':       HouseholdSurvey status filter
+        'include_deleted': bool (default False)
+        'answers':      'fields' | 'canonical' — append the JSON form answers
+                        as columns (survey / family / person; see AnswerColumns)
+        'since':        ISO datetime — delta export (see below)
+
+    Streaming (stream=True):
+        CSV rows are pulled from the _get_rows generators and flushed every
+        CSV_CHUNK_ROWS rows, so memory stays flat and the first bytes leave
+        before the last row is read. Excel is written row by row to a
+        temporary file (write_only mode), which is then streamed back.
+
+    Parquet / Arrow:
+        Rows are gathered into record batches of ARROW_BATCH_ROWS and typed
+        per ARROW_TYPES — real dates, integers, booleans and decimals
+        instead of text, choice fields dictionary-encoded. The Arrow IPC
+        stream is sent batch by batch; Parquet needs its footer written
+        last, so it goes through a temporary file like Excel.
+
+    Delta exports (filters['since']):
+        Only survey / family / person / program records created, updated,
+        soft-deleted or restored after `since` — found through updated_at,
+        deleted_at, and HouseholdChangeLog (soft delete and restore do not
+        touch updated_at, and the survey-level cascade is logged on the
+        survey only). Rows gain DELTA_COLUMNS: op = created | updated |
+        deleted, the record id, and its timestamps; deleted rows are
+        tombstones carrying only those columns. The window is closed at a
+        watermark fixed when the export starts (ExportResult.watermark) —
+        send it back as `since` for the next delta. The window opens
+        DELTA_OVERLAP early to catch transactions that committed late, so
+        consumers must upsert by id.
+
+    Compression (compression='gzip' | 'zstd'):
+        CSV and Arrow output is passed through an incremental compressor
+        chunk by chunk (.csv.gz, .arrows.zst, ...), so nothing is buffered
+        beyond the compressor's window. Levels are COMPRESSION_LEVELS;
+        zstd needs the optional `zstandard` package.
+    """
+
+    # Rows per streamed CSV chunk (~50–100 KB for person exports)
+    CSV_CHUNK_ROWS = 500
+
+    # Rows inspected to size Excel columns before the sheet is written
+    EXCEL_WIDTH_SAMPLE_ROWS = 200
+
+    # Rows between on_progress callbacks
+    PROGRESS_EVERY = 1000
+
+    # Rows per Arrow record batch (and per Parquet row group write)
+    ARROW_BATCH_ROWS = 10000
+
+    FORMATS = ('csv', 'excel', 'parquet', 'arrow', 'pdf')
+
+    # Delta exports: entity type → HouseholdChangeLog target type
+    DELTA_TARGETS = {
+        'survey':  HouseholdChangeLog.TargetType.SURVEY,
+        'family':  HouseholdChangeLog.TargetType.FAMILY,
+        'person':  HouseholdChangeLog.TargetType.PERSON,
+        'program': HouseholdChangeLog.TargetType.PROGRAM,
+    }
+
+    # Lookup path from each delta entity to its HouseholdSurvey
+    DELTA_SURVEY_PATH = {
+        'survey':  '',
+        'family':  'household_survey__',
+        'person':  'family__household_survey__',
+        'program': 'family__household_survey__',
+    }
+
+    DELTA_COLUMNS = ['op', 'id', 'updated_at', 'deleted_at']
+
+    # entity_type of the multi-entity ZIP
+    BUNDLE = 'bundle'
+
+    # entity_type of the per-household profile sheet ZIP (html / pdf)
+    SHEETS = 'sheets'
+
+    # Formats already compressed — stored in the bundle ZIP as-is, and
+    # not offered with compression=
+    PRECOMPRESSED_FORMATS = ('excel', 'parquet')
+
+    # compression= → level. gzip 6 is zlib's default; zstd 3 compresses
+    # repetitive CSV better than gzip 9 at several times the speed.
+    COMPRESSION_LEVELS = {'gzip': 6, 'zstd': 3}
+
+    # How far before `since` a delta window starts (late commits)
+    DELTA_OVERLAP = timedelta(minutes=5)
+
+    # Column definitions for each entity type
+    ENTITY_COLUMNS = {
+        'household': [
+            'household_number', 'purok', 'address', 'status',
+            'latitude', 'longitude', 'total_surveys', 'latest_survey_year',
+            'created_at',
+        ],
+        'survey': [
+            'household_number', 'purok', 'survey_year', 'status',
+            'surveyed_by', 'surveyed_at', 'verified_by', 'verified_at',
+            'family_count', 'person_count', 'form_schema', 'created_at',
+        ],
+        'family': [
+            'household_number', 'purok', 'survey_year', 'family_number',
+            'monthly_income_bracket', 'person_count', 'programs_count',
+        ],
+        'person': [
+            'household_number', 'purok', 'survey_year', 'family_number',
+            'last_name', 'first_name', 'middle_name', 'suffix',
+            'role', 'gender', 'date_of_birth', 'age_at_survey',
+            'civil_status', 'educational_attainment',
+            'is_registered_voter', 'sectors',
+        ],
+        'program': [
+            'household_number', 'purok', 'survey_year', 'family_number',
+            'beneficiary_name', 'program_type', 'program_name',
+            'date_availed', 'amount', 'reference_no', 'description',
+        ],
+    }
+
+    # Arrow column types (Parquet / Arrow formats). Columns not listed are
+    # plain strings; 'category' = dictionary-encoded string (choice fields
+    # and other low-cardinality text).
+    ARROW_TYPES = {
+        'purok':                  'category',
+        'status':                 'category',
+        'latitude':               'float',
+        'longitude':              'float',
+        'total_surveys':          'int32',
+        'latest_survey_year':     'int16',
+        'created_at':             'date',
+        'survey_year':            'int16',
+        'surveyed_at':            'date',
+        'verified_at':            'date',
+        'family_count':           'int32',
+        'person_count':           'int32',
+        'form_schema':            'category',
+        'family_number':          'int16',
+        'monthly_income_bracket': 'category',
+        'programs_count':         'int32',
+        'role':                   'category',
+        'gender':                 'category',
+        'date_of_birth':          'date',
+        'age_at_survey':          'int16',
+        'civil_status':           'category',
+        'educational_attainment': 'category',
+        'is_registered_voter':    'bool',
+        'program_type':           'category',
+        'date_availed':           'date',
+        'amount':                 'decimal',
+        'op':                     'category',
+        'updated_at':             'timestamp',
+        'deleted_at':             'timestamp',
+    }
+
+    @classmethod
+    def generate_export(
+        cls,
+        entity_type: str,
+        filters: dict,
+        fmt: str = 'csv',
+        stream: bool = False,
+        on_progress=None,
+        compression: str | None = None,
+    ) -> ExportResult:
+        """
+        Generate a downloadable export file.
+
+        Args:
+            entity_type: One of ENTITY_COLUMNS keys
+            filters:     Dict of filter params (see class docstring)
+            fmt:         'csv' | 'excel' | 'parquet' | 'arrow' | 'pdf'
+            stream:      Return an iterator of chunks (ExportResult.stream)
+                         instead of the finished file
+            on_progress: Optional callback(rows_written), see _get_rows()
+            compression: None | 'gzip' | 'zstd' (csv / arrow only)
+
+        Returns:
+            ExportResult with content bytes (or stream), content_type, and filename
 
         Example:
             result = ReportService.generate_export(
@@ -1409,33 +2683,259 @@ class ReportService:
             response = HttpResponse(result.content, content_type=result.content_type)
             response['Content-Disposition'] = f'attachment; filename="{result.filename}"'
         """
+        if compression is not None:
+            cls._check_compression(compression, entity_type, fmt)
+            result = cls.generate_export(entity_type, filters, fmt, stream=True, on_progress=on_progress)
+            return cls._compress(result, compression, stream)
+        if entity_type == cls.BUNDLE:
+            return cls.generate_bundle(filters, fmt, stream, on_progress)
+        if entity_type == cls.SHEETS:
+            return cls.generate_sheets(filters, fmt, stream, on_progress)
         if entity_type not in cls.ENTITY_COLUMNS:
             raise ValueError(
                 f"Unknown entity_type '{entity_type}'. "
-                f"Choose from: {', '.join(cls.ENTITY_COLUMNS)}"
+                f"Choose from: {', '.join(cls.ENTITY_COLUMNS)}, {cls.BUNDLE}, {cls.SHEETS}"
             )
 
         columns = cls.ENTITY_COLUMNS[entity_type]
         today = date.today().isoformat()
 
+        if fmt not in cls.FORMATS:
+            raise ValueError(f"Unknown format '{fmt}'. Choose from: {', '.join(cls.FORMATS)}")
+
+        filters = cls.pin_watermark(filters)
+        window  = cls._delta_window(entity_type, filters)
+
+        answers = None
+        labels  = {}
+        if filters.get('answers'):
+            answers = AnswerColumns.for_export(
+                entity_type, filters['answers'],
+                cls._base_survey_filter(HouseholdSurvey.all_objects, filters),
+                reserved=columns,
+            )
+            columns = columns + answers.columns
+            labels  = answers.labels
+        if window is not None:
+            columns = cls.DELTA_COLUMNS[:2] + columns + cls.DELTA_COLUMNS[2:]
+
+        rows = cls._get_rows(entity_type, filters, on_progress, answers)
         if fmt == 'csv':
-            return cls._export_csv(entity_type, columns, filters, today)
+            result = cls._export_csv(entity_type, columns, rows, today, stream)
         elif fmt == 'excel':
-            return cls._export_excel(entity_type, columns, filters, today)
-        elif fmt == 'pdf':
+            result = cls._export_excel(entity_type, columns, rows, today, stream, labels)
+        elif fmt == 'parquet':
+            result = cls._export_parquet(entity_type, columns, rows, today, stream)
+        elif fmt == 'arrow':
+            result = cls._export_arrow(entity_type, columns, rows, today, stream)
+        else:
             raise NotImplementedError(
-                "PDF export is not yet implemented. "
-                "Install 'weasyprint' or 'reportlab' and implement _export_pdf()."
+                "Tabular PDF export is not implemented. "
+                "Use entity_type 'sheets' for printable household profiles."
+            )
+        if window is not None:
+            result.watermark = filters['until']
+        return result
+
+    @classmethod
+    def _check_compression(cls, compression: str, entity_type: str, fmt: str) -> None:
+        if compression not in cls.COMPRESSION_LEVELS:
+            raise ValueError(
+                f"Unknown compression '{compression}'. "
+                f"Choose from: {', '.join(cls.COMPRESSION_LEVELS)}"
             )
+        if entity_type in (cls.BUNDLE, cls.SHEETS) or fmt in cls.PRECOMPRESSED_FORMATS:
+            raise ValueError(f"'{fmt}' exports, bundles and sheets are already compressed.")
+        if compression == 'zstd' and not ZSTANDARD_AVAILABLE:
+            raise ImportError(
+                "zstandard is required for zstd compression. "
+                "Run: pip install zstandard"
+            )
+
+    @classmethod
+    def _compress(cls, result: ExportResult, compression: str, stream: bool) -> ExportResult:
+        """Wrap a streamed export in an incremental gzip / zstd compressor."""
+        level = cls.COMPRESSION_LEVELS[compression]
+        if compression == 'gzip':
+            # wbits 16 + 15: zlib with a gzip header and trailer
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            suffix, content_type = '.gz', 'application/gzip'
         else:
-            raise ValueError(f"Unknown format '{fmt}'. Choose from: csv, excel, pdf")
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            suffix, content_type = '.zst', 'application/zstd'
+
+        def compressed(chunks) -> Iterator[bytes]:
+            for chunk in chunks:
+                if data := compressor.compress(chunk):
+                    yield data
+            yield compressor.flush()
+
+        chunks = compressed(result.stream)
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type=content_type,
+            filename=result.filename + suffix,
+            stream=chunks if stream else None,
+            watermark=result.watermark,
+        )
+
+    @classmethod
+    def generate_bundle(
+        cls,
+        filters: dict,
+        fmt: str = 'csv',
+        stream: bool = False,
+        on_progress=None,
+    ) -> ExportResult:
+        """
+        Every entity type in one ZIP, one member file per entity in `fmt`.
+
+        The filtered survey ids are resolved once and handed to every row
+        builder (filters['survey_ids']), so _base_survey_filter and its
+        joins run a single time instead of once per file. All five files
+        are read inside one REPEATABLE READ transaction: they describe the
+        same snapshot even while surveys are being edited.
+        """
+        if fmt not in cls.FORMATS or fmt == 'pdf':
+            raise ValueError(f"Unknown bundle format '{fmt}'. Choose from: csv, excel, parquet, arrow")
+        if filters.get('since'):
+            raise ValueError('Delta exports are per entity type; they cannot be bundled.')
+        if fmt in ('parquet', 'arrow'):
+            cls._require_pyarrow(fmt.title())
+        elif fmt == 'excel' and not OPENPYXL_AVAILABLE:
+            raise ImportError("openpyxl is required for Excel export. Run: pip install openpyxl")
+        if filters.get('answers'):
+            AnswerColumns.validate('survey', filters['answers'])
+
+        today  = date.today().isoformat()
+        chunks = cls._iter_bundle(filters, fmt, on_progress)
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type='application/zip',
+            filename=f'bundle_export_{today}.zip',
+            stream=chunks if stream else None,
+        )
 
     @classmethod
-    def _export_csv(cls, entity_type, columns, filters, today) -> ExportResult:
+    def _iter_bundle(cls, filters: dict, fmt: str, on_progress=None) -> Iterator[bytes]:
+        """Stream the bundle ZIP: each member is compressed as its rows arrive."""
+        sink        = _ChunkSink()
+        compression = zipfile.ZIP_STORED if fmt in cls.PRECOMPRESSED_FORMATS else zipfile.ZIP_DEFLATED
+
+        # Rows written by the finished members + by the current one
+        written = {'done': 0, 'current': 0}
+
+        def progress(rows: int) -> None:
+            written['current'] = rows
+            on_progress(written['done'] + rows)
+
+        # SET TRANSACTION must be the first statement of the transaction;
+        # when already inside one, the outer transaction decides.
+        outermost = not connection.in_atomic_block
+        with transaction.atomic():
+            if outermost:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY')
+
+            manager    = HouseholdSurvey.all_objects if filters.get('include_deleted') else HouseholdSurvey.objects
+            survey_ids = list(
+                cls._base_survey_filter(manager, filters).order_by().values_list('pk', flat=True)
+            )
+
+            with zipfile.ZipFile(sink, 'w', compression=compression) as archive:
+                for entity_type in cls.ENTITY_COLUMNS:
+                    scoped = {**filters, 'survey_ids': survey_ids}
+                    if entity_type not in AnswerColumns.LEVELS:
+                        scoped.pop('answers', None)
+
+                    result = cls.generate_export(
+                        entity_type, scoped, fmt, stream=True,
+                        on_progress=None if on_progress is None else progress,
+                    )
+                    with archive.open(result.filename, 'w', force_zip64=True) as member:
+                        for chunk in result.stream:
+                            member.write(chunk)
+                            if data := sink.drain():
+                                yield data
+                    written['done'] += written['current']
+                    written['current'] = 0
+        yield sink.drain()   # central directory
+
+    # ── Profile sheets ────────────────────────────────────────────────────────
+
+    @classmethod
+    def _check_sheets(cls, filters: dict, fmt: str) -> None:
+        if fmt not in sheets.FORMATS:
+            raise ValueError(f"Unknown sheet format '{fmt}'. Choose from: {', '.join(sheets.FORMATS)}")
+        if not filters.get('purok_ids'):
+            raise ValueError('Profile sheets are generated per purok; purok_ids is required.')
+        if isinstance(filters.get('survey_year'), (list, tuple)):
+            raise ValueError('Profile sheets take a single survey_year, not a range.')
+        if filters.get('since'):
+            raise ValueError('Profile sheets cannot be delta exports.')
+        if fmt == 'pdf' and not WEASYPRINT_AVAILABLE:
+            raise ImportError("weasyprint is required for PDF sheets. Run: pip install weasyprint")
+
+    @classmethod
+    def generate_sheets(
+        cls,
+        filters: dict,
+        fmt: str = 'pdf',
+        stream: bool = False,
+        on_progress=None,
+        workers: int | None = None,
+    ) -> ExportResult:
+        """
+        One profile sheet per household of filters['purok_ids'], in a ZIP.
+
+        Households are loaded SHEET_BATCH at a time with their latest survey
+        (or the one of filters['survey_year']) and prefetched families,
+        persons and programs; rendering — the expensive part, especially to
+        PDF — is spread over a process pool (see sheets.py). Meant for the
+        export-job worker: it starts processes, so do not call it from a
+        request.
+        """
+        cls._check_sheets(filters, fmt)
+        today  = date.today().isoformat()
+        chunks = sheets.iter_zip(
+            sheets.load_sheets(filters['purok_ids'], filters.get('survey_year')),
+            fmt, _ChunkSink(), workers=workers, on_progress=on_progress,
+        )
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type='application/zip',
+            filename=f'profile_sheets_{fmt}_{today}.zip',
+            stream=chunks if stream else None,
+        )
+
+    @staticmethod
+    def _export_pdf(html: str) -> bytes:
+        """Render one HTML document (a profile sheet) to PDF bytes."""
+        if not WEASYPRINT_AVAILABLE:
+            raise ImportError("weasyprint is required for PDF sheets. Run: pip install weasyprint")
+        return weasyprint.HTML(string=html).write_pdf()
+
+    @classmethod
+    def _export_csv(cls, entity_type, columns, rows, today, stream=False) -> ExportResult:
         """
-        Stream rows into an in-memory CSV buffer.
+        CSV export, streamed or joined into one bytes object.
         Uses utf-8-sig BOM so Filipino characters display correctly in Excel.
         """
+        chunks = cls._iter_csv(columns, rows)
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type='text/csv; charset=utf-8-sig',
+            filename=f'{entity_type}_export_{today}.csv',
+            stream=chunks if stream else None,
+        )
+
+    @classmethod
+    def _iter_csv(cls, columns, rows) -> Iterator[bytes]:
+        """
+        Yield the CSV as UTF-8 byte chunks: BOM + header first, then one
+        chunk per CSV_CHUNK_ROWS rows. The buffer is emptied after every
+        chunk, so it never holds more than one chunk.
+        """
         buffer = io.StringIO()
         writer = csv.DictWriter(
             buffer,
@@ -1443,22 +2943,34 @@ class ReportService:
             extrasaction='ignore',
             lineterminator='\r\n',
         )
+
+        def flush() -> bytes:
+            chunk = buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
         writer.writeheader()
-        for row in cls._get_rows(entity_type, filters):
-            writer.writerow(row)
+        yield codecs.BOM_UTF8 + flush()   # BOM for Excel
 
-        content = buffer.getvalue().encode('utf-8-sig')  # BOM for Excel
-        return ExportResult(
-            content=content,
-            content_type='text/csv; charset=utf-8-sig',
-            filename=f'{entity_type}_export_{today}.csv',
-        )
+        for count, row in enumerate(rows, start=1):
+            writer.writerow(row)
+            if count % cls.CSV_CHUNK_ROWS == 0:
+                yield flush()
+        if buffer.tell():
+            yield flush()
 
     @classmethod
-    def _export_excel(cls, entity_type, columns, filters, today) -> ExportResult:
+    def _export_excel(cls, entity_type, columns, rows, today, stream=False, labels=None) -> ExportResult:
         """
         Build an .xlsx workbook with one styled sheet.
         Requires openpyxl (pip install openpyxl).
+
+        Uses a write_only workbook: rows are serialized as they arrive
+        instead of being held as cell objects, and the finished file goes
+        to a temporary file rather than a BytesIO. write_only sheets need
+        column widths before the first row, so widths are estimated from
+        the header plus the first EXCEL_WIDTH_SAMPLE_ROWS rows.
         """
         if not OPENPYXL_AVAILABLE:
             raise ImportError(
@@ -1466,9 +2978,22 @@ class ReportService:
                 "Run: pip install openpyxl"
             )
 
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = entity_type.title()
+        labels  = labels or {}
+        sample  = list(islice(rows, cls.EXCEL_WIDTH_SAMPLE_ROWS))
+        headers = [
+            labels.get(col_name) or col_name.replace('_', ' ').title()
+            for col_name in columns
+        ]
+
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(title=entity_type.title())
+
+        # Auto-size columns from the sample (capped at 60 chars)
+        for col_idx, (col_name, header) in enumerate(zip(columns, headers), start=1):
+            max_len = max(
+                [len(header)] + [len(str(row.get(col_name) or '')) for row in sample]
+            )
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 4, 60)
 
         # Header row styling
         header_font   = Font(bold=True, color='FFFFFF')
@@ -1476,41 +3001,184 @@ class ReportService:
         header_align  = Alignment(horizontal='center', vertical='center', wrap_text=True)
         ws.row_dimensions[1].height = 20
 
-        for col_idx, col_name in enumerate(columns, start=1):
-            cell             = ws.cell(row=1, column=col_idx, value=col_name.replace('_', ' ').title())
-            cell.font        = header_font
-            cell.fill        = header_fill
-            cell.alignment   = header_align
-
-        # Data rows
-        for row_idx, row in enumerate(cls._get_rows(entity_type, filters), start=2):
-            for col_idx, col_name in enumerate(columns, start=1):
-                ws.cell(row=row_idx, column=col_idx, value=row.get(col_name))
-
-        # Auto-size columns (capped at 60 chars)
-        for col_cells in ws.columns:
-            col_letter = col_cells[0].column_letter
-            max_len = max(
-                (len(str(cell.value or '')) for cell in col_cells),
-                default=10,
-            )
-            ws.column_dimensions[col_letter].width = min(max_len + 4, 60)
-
-        buffer = io.BytesIO()
-        wb.save(buffer)
+        header_cells = []
+        for header in headers:
+            cell           = WriteOnlyCell(ws, value=header)
+            cell.font      = header_font
+            cell.fill      = header_fill
+            cell.alignment = header_align
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Data rows — the sample first, then the rest of the generator
+        for row in chain(sample, rows):
+            ws.append([row.get(col_name) for col_name in columns])
+
+        tmp = tempfile.TemporaryFile()
+        try:
+            wb.save(tmp)
+        except Exception:
+            tmp.close()
+            raise
+        chunks = cls._iter_file(tmp)
         return ExportResult(
-            content=buffer.getvalue(),
+            content=None if stream else b''.join(chunks),
             content_type=(
                 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             ),
             filename=f'{entity_type}_export_{today}.xlsx',
+            stream=chunks if stream else None,
         )
 
+    # ── Parquet / Arrow ───────────────────────────────────────────────────────
+
+    @classmethod
+    def _arrow_kinds(cls, entity_type: str, columns) -> list[str]:
+        """
+        ARROW_TYPES kind per column. Only the entity's fixed columns are
+        typed; flattened answer columns are free-form text.
+        """
+        fixed = set(cls.ENTITY_COLUMNS[entity_type]) | set(cls.DELTA_COLUMNS)
+        return [
+            cls.ARROW_TYPES.get(col_name, 'string') if col_name in fixed else 'string'
+            for col_name in columns
+        ]
+
+    @staticmethod
+    def _arrow_schema(columns, kinds):
+        types = {
+            'string':    pa.string(),
+            'category':  pa.dictionary(pa.int32(), pa.string()),
+            'int16':     pa.int16(),
+            'int32':     pa.int32(),
+            'float':     pa.float64(),
+            'bool':      pa.bool_(),
+            'date':      pa.date32(),
+            'timestamp': pa.timestamp('us', tz='UTC'),
+            'decimal':   pa.decimal128(12, 2),
+        }
+        return pa.schema([
+            pa.field(col_name, types[kind]) for col_name, kind in zip(columns, kinds)
+        ])
+
+    @staticmethod
+    def _arrow_value(kind: str, value):
+        """
+        Undo the CSV-oriented formatting of the row builders: '' means
+        missing, dates arrive as ISO strings and amounts as str(Decimal).
+        """
+        if value is None or (value == '' and kind not in ('string', 'category')):
+            return None
+        if kind == 'date':
+            return date.fromisoformat(value) if isinstance(value, str) else value
+        if kind == 'timestamp':
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+        if kind == 'decimal':
+            return Decimal(value)
+        if kind == 'float':
+            return float(value)
+        if kind in ('string', 'category') and not isinstance(value, str):
+            return str(value)
+        return value
+
+    @classmethod
+    def _iter_batches(cls, schema, kinds, rows) -> Iterator:
+        """Group rows into RecordBatches of ARROW_BATCH_ROWS, typed per schema."""
+        while batch := list(islice(rows, cls.ARROW_BATCH_ROWS)):
+            arrays = []
+            for field, kind in zip(schema, kinds):
+                values = [cls._arrow_value(kind, row.get(field.name)) for row in batch]
+                if kind == 'category':
+                    arrays.append(pa.array(values, pa.string()).dictionary_encode())
+                else:
+                    arrays.append(pa.array(values, field.type))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def _require_pyarrow(label: str) -> None:
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                f"pyarrow is required for {label} export. "
+                "Run: pip install pyarrow"
+            )
+
+    @classmethod
+    def _export_parquet(cls, entity_type, columns, rows, today, stream=False) -> ExportResult:
+        """
+        Parquet file, one row group per record batch, zstd-compressed.
+        Choice columns keep their dictionary type, so pandas reads them
+        back as `category`.
+        """
+        cls._require_pyarrow('Parquet')
+
+        kinds  = cls._arrow_kinds(entity_type, columns)
+        schema = cls._arrow_schema(columns, kinds)
+        tmp = tempfile.TemporaryFile()
+        try:
+            with pq.ParquetWriter(tmp, schema, compression='zstd') as writer:
+                for batch in cls._iter_batches(schema, kinds, rows):
+                    writer.write_batch(batch)
+        except Exception:
+            tmp.close()
+            raise
+        chunks = cls._iter_file(tmp)
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type='application/vnd.apache.parquet',
+            filename=f'{entity_type}_export_{today}.parquet',
+            stream=chunks if stream else None,
+        )
+
+    @classmethod
+    def _export_arrow(cls, entity_type, columns, rows, today, stream=False) -> ExportResult:
+        """
+        Arrow IPC stream (pyarrow.ipc.open_stream / pandas via
+        pa.ipc.open_stream(f).read_pandas()). Sent one record batch per
+        chunk; each batch carries its own choice-field dictionaries.
+        """
+        cls._require_pyarrow('Arrow')
+
+        kinds  = cls._arrow_kinds(entity_type, columns)
+        chunks = cls._iter_arrow(cls._arrow_schema(columns, kinds), kinds, rows)
+        return ExportResult(
+            content=None if stream else b''.join(chunks),
+            content_type='application/vnd.apache.arrow.stream',
+            filename=f'{entity_type}_export_{today}.arrows',
+            stream=chunks if stream else None,
+        )
+
+    @classmethod
+    def _iter_arrow(cls, schema, kinds, rows) -> Iterator[bytes]:
+        """Yield the IPC stream: schema message first, then one chunk per batch."""
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            yield sink.drain()
+            for batch in cls._iter_batches(schema, kinds, rows):
+                writer.write_batch(batch)
+                yield sink.drain()
+        yield sink.drain()   # end-of-stream marker
+
+    @staticmethod
+    def _iter_file(fh, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield a finished temporary file from the start, closing (deleting) it at the end."""
+        try:
+            fh.seek(0)
+            while chunk := fh.read(chunk_size):
+                yield chunk
+        finally:
+            fh.close()
+
     # ── Row builders ──────────────────────────────────────────────────────────
 
     @classmethod
-    def _get_rows(cls, entity_type: str, filters: dict) -> Iterator[dict]:
-        """Route to the correct row builder based on entity_type."""
+    def _get_rows(cls, entity_type: str, filters: dict, on_progress=None, answers=None) -> Iterator[dict]:
+        """
+        Route to the correct row builder based on entity_type.
+
+        on_progress(rows_so_far) is called every PROGRESS_EVERY rows and
+        once at the end (export jobs use it to report progress).
+        answers (AnswerColumns) adds the flattened JSON answers to each row.
+        """
         builders = {
             'household': cls._household_rows,
             'survey':    cls._survey_rows,
@@ -1518,11 +3186,158 @@ class ReportService:
             'person':    cls._person_rows,
             'program':   cls._program_rows,
         }
-        yield from builders[entity_type](filters)
+        if answers is None:
+            rows = builders[entity_type](filters)
+        else:
+            rows = builders[entity_type](filters, answers)
+        if on_progress is None:
+            yield from rows
+            return
+
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            yield row
+            if count % cls.PROGRESS_EVERY == 0:
+                on_progress(count)
+        on_progress(count)
+
+    @classmethod
+    def count_rows(cls, entity_type: str, filters: dict) -> int:
+        """Number of rows an export of entity_type will contain (one COUNT query per entity)."""
+        if entity_type == cls.BUNDLE:
+            return sum(cls.count_rows(entity, filters) for entity in cls.ENTITY_COLUMNS)
+        if entity_type == cls.SHEETS:
+            return Household.objects.filter(purok_id__in=filters['purok_ids']).count()
+        querysets = {
+            'household': cls._household_queryset,
+            'survey':    cls._survey_queryset,
+            'family':    cls._family_queryset,
+            'person':    cls._person_queryset,
+            'program':   cls._program_queryset,
+        }
+        return querysets[entity_type](cls.pin_watermark(filters)).count()
+
+    # ── Delta exports ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def pin_watermark(filters: dict) -> dict:
+        """
+        Fix the upper end of a delta window (filters['until']) to now,
+        unless already set, so the row count, the rows, and the returned
+        watermark all describe the same window.
+        """
+        if not filters.get('since') or filters.get('until'):
+            return filters
+        return {**filters, 'until': timezone.now().isoformat()}
+
+    @classmethod
+    def _delta_window(cls, entity_type: str, filters: dict) -> tuple[datetime, datetime] | None:
+        """
+        (since, until) of a delta export, or None for a full export.
+
+        Raises:
+            ValueError: unparsable `since`, or an entity type without deltas
+        """
+        if not filters.get('since'):
+            return None
+        if entity_type not in cls.DELTA_TARGETS:
+            raise ValueError(
+                f"Delta exports are available for: {', '.join(cls.DELTA_TARGETS)}, "
+                f"not '{entity_type}'."
+            )
+        bounds = []
+        for key in ('since', 'until'):
+            value = filters.get(key)
+            if key == 'until' and not value:
+                bounds.append(timezone.now())
+                continue
+            moment = value if isinstance(value, datetime) else parse_datetime(str(value))
+            if moment is None:
+                raise ValueError(f"'{key}' must be an ISO 8601 datetime, got '{value}'.")
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment)
+            bounds.append(moment)
+        return bounds[0], bounds[1]
+
+    @classmethod
+    def _changed_since(cls, qs, entity_type: str, filters: dict):
+        """
+        Restrict qs to records touched inside the delta window: their own
+        timestamps or change log, a logged delete/restore of their survey
+        (the cascade is logged on the survey only), or an edit to their
+        household (household_number / purok / address are exported too).
+        """
+        window = cls._delta_window(entity_type, filters)
+        if window is None:
+            return qs
+        since, until = window
+        start = since - cls.DELTA_OVERLAP
+
+        def between(field: str) -> Q:
+            return Q(**{f'{field}__gt': start, f'{field}__lte': until})
+
+        def logged(target_type, actions=None):
+            logs = HouseholdChangeLog.objects.filter(between('changed_at'), target_type=target_type)
+            if actions:
+                logs = logs.filter(action__in=actions)
+            return logs.values('target_id')
+
+        path    = cls.DELTA_SURVEY_PATH[entity_type]
+        changed = (
+            between('updated_at') | between('deleted_at')
+            | Q(pk__in=logged(cls.DELTA_TARGETS[entity_type]))
+            | between(f'{path}household__updated_at')
+            | between(f'{path}household__deleted_at')
+        )
+        if path:
+            changed |= Q(**{f'{path}id__in': logged(
+                HouseholdChangeLog.TargetType.SURVEY,
+                [HouseholdChangeLog.Action.DELETED, HouseholdChangeLog.Action.RESTORED],
+            )})
+        return qs.filter(changed)
+
+    @staticmethod
+    def _delta_row(obj, row: dict, since: datetime) -> dict:
+        """Add DELTA_COLUMNS to a row; deleted records become tombstones."""
+        if obj.is_deleted:
+            row = dict.fromkeys(row, '')
+            op  = 'deleted'
+        elif obj.created_at and obj.created_at > since:
+            op = 'created'
+        else:
+            op = 'updated'
+        row.update({
+            'op':         op,
+            'id':         str(obj.pk),
+            'updated_at': obj.updated_at.isoformat() if obj.updated_at else '',
+            'deleted_at': obj.deleted_at.isoformat() if obj.deleted_at else '',
+        })
+        return row
+
+    @staticmethod
+    def _with_deleted(filters: dict) -> bool:
+        """Read soft-deleted rows too: on request, and always for deltas (tombstones)."""
+        return bool(filters.get('include_deleted') or filters.get('since'))
+
+    @classmethod
+    def _survey_scope(cls, filters: dict):
+        """Surveys a family / person / program export is limited to."""
+        # A delta must see children of deleted surveys to send their tombstones
+        manager = HouseholdSurvey.all_objects if filters.get('since') else HouseholdSurvey.objects
+        return cls._base_survey_filter(manager, filters)
 
     @classmethod
     def _base_survey_filter(cls, qs, filters: dict):
-        """Apply common survey-level filters."""
+        """
+        Apply common survey-level filters. Always returns a QuerySet — a
+        bare manager passed in would reach `__in=` lookups unevaluable.
+        """
+        qs = qs.all()
+        survey_ids = filters.get('survey_ids')
+        if survey_ids is not None:
+            # Bundle exports: the filters were already resolved to ids
+            return qs.filter(pk__in=survey_ids)
+
         year = filters.get('survey_year')
         if isinstance(year, int):
             qs = qs.filter(survey_year=year)
@@ -1539,105 +3354,182 @@ class ReportService:
 
         return qs
 
+    # Rows are projected with values_list(named=True) — tuples instead of
+    # model instances — so these mirror the __str__ / full_name properties
+    # the row builders used to call.
+
+    @staticmethod
+    def _purok_label(number, name) -> str:
+        label = f'Purok {number}'
+        return f'{label} - {name}' if name else label
+
+    @staticmethod
+    def _user_name(first_name, last_name, email) -> str:
+        if email is None:   # no user linked
+            return ''
+        return f'{first_name} {last_name}'.strip() or email
+
+    @staticmethod
+    def _person_name(first_name, middle_name, last_name, suffix) -> str:
+        name = ' '.join(filter(None, [first_name, middle_name, last_name]))
+        return f'{name} {suffix}'.strip() if suffix else name
+
+    # Columns read by the delta (since) rows — see _delta_row()
+    _DELTA_FIELDS = ('is_deleted', 'created_at', 'updated_at', 'deleted_at')
+
     @classmethod
-    def _household_rows(cls, filters: dict) -> Iterator[dict]:
+    def _household_queryset(cls, filters: dict):
+        # survey_count / latest_survey_year are maintained columns (HouseholdService)
         manager = Household.all_objects if filters.get('include_deleted') else Household.objects
-        qs = manager.select_related('purok').annotate(
-            total_surveys=Count('surveys', distinct=True),
-        ).order_by('purok__number', 'household_number')
+        qs      = manager.order_by('purok__number', 'household_number')
 
         if filters.get('purok_ids'):
             qs = qs.filter(purok_id__in=filters['purok_ids'])
+        return qs
 
-        for h in qs.iterator(chunk_size=200):
-            latest = h.surveys.order_by('-survey_year').values('survey_year').first()
+    @classmethod
+    def _household_rows(cls, filters: dict) -> Iterator[dict]:
+        qs = cls._household_queryset(filters).values_list(
+            'household_number', 'purok__number', 'purok__name', 'address', 'status',
+            'latitude', 'longitude', 'survey_count', 'latest_survey_year', 'created_at',
+            named=True,
+        )
+
+        for h in qs.iterator(chunk_size=2000):
             yield {
                 'household_number':   h.household_number,
-                'purok':              str(h.purok),
+                'purok':              cls._purok_label(h.purok__number, h.purok__name),
                 'address':            h.address,
                 'status':             h.status,
                 'latitude':           h.latitude,
                 'longitude':          h.longitude,
-                'total_surveys':      h.total_surveys,
-                'latest_survey_year': latest['survey_year'] if latest else '',
+                'total_surveys':      h.survey_count,
+                'latest_survey_year': h.latest_survey_year or '',
                 'created_at':         h.created_at.date().isoformat() if h.created_at else '',
             }
 
     @classmethod
-    def _survey_rows(cls, filters: dict) -> Iterator[dict]:
-        manager = HouseholdSurvey.all_objects if filters.get('include_deleted') else HouseholdSurvey.objects
-        qs = (
-            manager
-            .select_related('household__purok', 'form_schema', 'surveyed_by', 'verified_by')
-            .annotate(
-                family_count=Count('families', distinct=True),
-                person_count=Count('families__persons', distinct=True),
-            )
-        )
-        qs = cls._base_survey_filter(qs, filters)
+    def _survey_queryset(cls, filters: dict):
+        # family_count / person_count are maintained columns (HouseholdService)
+        manager = HouseholdSurvey.all_objects if cls._with_deleted(filters) else HouseholdSurvey.objects
+        qs = cls._base_survey_filter(manager.all(), filters)
+        return cls._changed_since(qs, 'survey', filters)
 
-        for s in qs.iterator(chunk_size=200):
-            yield {
-                'household_number': s.household.household_number,
-                'purok':            str(s.household.purok),
+    @classmethod
+    def _survey_rows(cls, filters: dict, answers: AnswerColumns | None = None) -> Iterator[dict]:
+        window = cls._delta_window('survey', filters)
+        fields = [
+            'pk', 'household__household_number', 'household__purok__number', 'household__purok__name',
+            'survey_year', 'status', 'surveyed_at', 'verified_at',
+            'surveyed_by__first_name', 'surveyed_by__last_name', 'surveyed_by__email',
+            'verified_by__first_name', 'verified_by__last_name', 'verified_by__email',
+            'family_count', 'person_count', 'form_schema_id', 'form_schema__name',
+            *cls._DELTA_FIELDS,
+        ]
+        if answers is not None:
+            fields.append('data')
+        qs = cls._survey_queryset(filters).values_list(*fields, named=True)
+
+        for s in qs.iterator(chunk_size=2000):
+            row = {
+                'household_number': s.household__household_number,
+                'purok':            cls._purok_label(s.household__purok__number, s.household__purok__name),
                 'survey_year':      s.survey_year,
                 'status':           s.status,
-                'surveyed_by':      s.surveyed_by.full_name if s.surveyed_by else '',
+                'surveyed_by':      cls._user_name(
+                                        s.surveyed_by__first_name, s.surveyed_by__last_name,
+                                        s.surveyed_by__email),
                 'surveyed_at':      str(s.surveyed_at or ''),
-                'verified_by':      s.verified_by.full_name if s.verified_by else '',
+                'verified_by':      cls._user_name(
+                                        s.verified_by__first_name, s.verified_by__last_name,
+                                        s.verified_by__email),
                 'verified_at':      s.verified_at.date().isoformat() if s.verified_at else '',
                 'family_count':     s.family_count,
                 'person_count':     s.person_count,
-                'form_schema':      s.form_schema.name,
+                'form_schema':      s.form_schema__name,
                 'created_at':       s.created_at.date().isoformat() if s.created_at else '',
             }
+            if answers is not None:
+                row.update(answers.row(s.form_schema_id, s.survey_year, s.data))
+            if window is not None:
+                row = cls._delta_row(s, row, window[0])
+            yield row
 
     @classmethod
-    def _family_rows(cls, filters: dict) -> Iterator[dict]:
-        manager = Family.all_objects if filters.get('include_deleted') else Family.objects
-        qs = (
-            manager
-            .select_related('household_survey__household__purok')
-            .annotate(
-                person_count=Count('persons', distinct=True),
-                programs_count=Count('programs_availed', distinct=True),
-            )
-        )
-        survey_qs = cls._base_survey_filter(
-            HouseholdSurvey.objects, filters
+    def _family_queryset(cls, filters: dict):
+        manager = Family.all_objects if cls._with_deleted(filters) else Family.objects
+        qs = manager.annotate(
+            person_count=_child_count(Person, 'family'),
+            programs_count=_child_count(ProgramAvailed, 'family'),
         )
-        qs = qs.filter(household_survey__in=survey_qs)
+        qs = qs.filter(household_survey__in=cls._survey_scope(filters))
+        return cls._changed_since(qs, 'family', filters)
 
-        for f in qs.iterator(chunk_size=200):
-            yield {
-                'household_number':      f.household_survey.household.household_number,
-                'purok':                 str(f.household_survey.household.purok),
-                'survey_year':           f.household_survey.survey_year,
+    @classmethod
+    def _family_rows(cls, filters: dict, answers: AnswerColumns | None = None) -> Iterator[dict]:
+        window = cls._delta_window('family', filters)
+        fields = [
+            'pk', 'household_survey__household__household_number',
+            'household_survey__household__purok__number', 'household_survey__household__purok__name',
+            'household_survey__survey_year', 'household_survey__form_schema_id',
+            'family_number', 'monthly_income_bracket', 'person_count', 'programs_count',
+            *cls._DELTA_FIELDS,
+        ]
+        if answers is not None:
+            fields.append('data')
+        qs = cls._family_queryset(filters).values_list(*fields, named=True)
+
+        for f in qs.iterator(chunk_size=2000):
+            row = {
+                'household_number':      f.household_survey__household__household_number,
+                'purok':                 cls._purok_label(
+                                             f.household_survey__household__purok__number,
+                                             f.household_survey__household__purok__name),
+                'survey_year':           f.household_survey__survey_year,
                 'family_number':         f.family_number,
                 'monthly_income_bracket': f.monthly_income_bracket,
                 'person_count':          f.person_count,
                 'programs_count':        f.programs_count,
             }
+            if answers is not None:
+                row.update(answers.row(
+                    f.household_survey__form_schema_id, f.household_survey__survey_year, f.data,
+                ))
+            if window is not None:
+                row = cls._delta_row(f, row, window[0])
+            yield row
 
     @classmethod
-    def _person_rows(cls, filters: dict) -> Iterator[dict]:
-        manager = Person.all_objects if filters.get('include_deleted') else Person.objects
-        qs = (
-            manager
-            .select_related(
-                'family__household_survey__household__purok',
-            )
-        )
-        survey_qs = cls._base_survey_filter(HouseholdSurvey.objects, filters)
-        qs = qs.filter(family__household_survey__in=survey_qs)
+    def _person_queryset(cls, filters: dict):
+        manager = Person.all_objects if cls._with_deleted(filters) else Person.objects
+        qs = manager.filter(family__household_survey__in=cls._survey_scope(filters))
+        return cls._changed_since(qs, 'person', filters)
 
-        for p in qs.iterator(chunk_size=200):
-            survey = p.family.household_survey
-            yield {
-                'household_number':      survey.household.household_number,
-                'purok':                 str(survey.household.purok),
-                'survey_year':           survey.survey_year,
-                'family_number':         p.family.family_number,
+    @classmethod
+    def _person_rows(cls, filters: dict, answers: AnswerColumns | None = None) -> Iterator[dict]:
+        window = cls._delta_window('person', filters)
+        survey = 'family__household_survey__'
+        fields = [
+            'pk', f'{survey}household__household_number',
+            f'{survey}household__purok__number', f'{survey}household__purok__name',
+            f'{survey}survey_year', f'{survey}form_schema_id', 'family__family_number',
+            'last_name', 'first_name', 'middle_name', 'suffix', 'role', 'gender',
+            'date_of_birth', 'age_at_survey', 'civil_status', 'educational_attainment',
+            'is_registered_voter', 'sectors',
+            *cls._DELTA_FIELDS,
+        ]
+        if answers is not None:
+            fields.append('data')
+        qs = cls._person_queryset(filters).values_list(*fields, named=True)
+
+        for p in qs.iterator(chunk_size=2000):
+            row = {
+                'household_number':      p.family__household_survey__household__household_number,
+                'purok':                 cls._purok_label(
+                                             p.family__household_survey__household__purok__number,
+                                             p.family__household_survey__household__purok__name),
+                'survey_year':           p.family__household_survey__survey_year,
+                'family_number':         p.family__family_number,
                 'last_name':             p.last_name,
                 'first_name':            p.first_name,
                 'middle_name':           p.middle_name,
@@ -1652,28 +3544,48 @@ class ReportService:
                 # Pipe-delimited for clean CSV — avoids brackets/quotes
                 'sectors':               '|'.join(p.sectors or []),
             }
+            if answers is not None:
+                row.update(answers.row(
+                    p.family__household_survey__form_schema_id,
+                    p.family__household_survey__survey_year, p.data,
+                ))
+            if window is not None:
+                row = cls._delta_row(p, row, window[0])
+            yield row
+
+    @classmethod
+    def _program_queryset(cls, filters: dict):
+        manager = ProgramAvailed.all_objects if cls._with_deleted(filters) else ProgramAvailed.objects
+        qs = manager.filter(family__household_survey__in=cls._survey_scope(filters))
+        return cls._changed_since(qs, 'program', filters)
 
     @classmethod
     def _program_rows(cls, filters: dict) -> Iterator[dict]:
-        manager = ProgramAvailed.all_objects if filters.get('include_deleted') else ProgramAvailed.objects
-        qs = (
-            manager
-            .select_related(
-                'family__household_survey__household__purok',
-                'beneficiary',
-            )
+        window = cls._delta_window('program', filters)
+        survey = 'family__household_survey__'
+        qs = cls._program_queryset(filters).values_list(
+            'pk', f'{survey}household__household_number',
+            f'{survey}household__purok__number', f'{survey}household__purok__name',
+            f'{survey}survey_year', 'family__family_number',
+            'beneficiary__first_name', 'beneficiary__middle_name',
+            'beneficiary__last_name', 'beneficiary__suffix',
+            'program_type', 'program_name', 'date_availed', 'amount',
+            'reference_no', 'description',
+            *cls._DELTA_FIELDS,
+            named=True,
         )
-        survey_qs = cls._base_survey_filter(HouseholdSurvey.objects, filters)
-        qs = qs.filter(family__household_survey__in=survey_qs)
 
-        for prog in qs.iterator(chunk_size=200):
-            survey = prog.family.household_survey
-            yield {
-                'household_number': survey.household.household_number,
-                'purok':            str(survey.household.purok),
-                'survey_year':      survey.survey_year,
-                'family_number':    prog.family.family_number,
-                'beneficiary_name': prog.beneficiary.full_name if prog.beneficiary else '',
+        for prog in qs.iterator(chunk_size=2000):
+            row = {
+                'household_number': prog.family__household_survey__household__household_number,
+                'purok':            cls._purok_label(
+                                        prog.family__household_survey__household__purok__number,
+                                        prog.family__household_survey__household__purok__name),
+                'survey_year':      prog.family__household_survey__survey_year,
+                'family_number':    prog.family__family_number,
+                'beneficiary_name': cls._person_name(
+                                        prog.beneficiary__first_name, prog.beneficiary__middle_name,
+                                        prog.beneficiary__last_name, prog.beneficiary__suffix),
                 'program_type':     prog.program_type,
                 'program_name':     prog.program_name,
                 'date_availed':     str(prog.date_availed or ''),
@@ -1681,3 +3593,234 @@ class ReportService:
                 'reference_no':     prog.reference_no,
                 'description':      prog.description,
             }
+            if window is not None:
+                row = cls._delta_row(prog, row, window[0])
+            yield row
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ExportJobService  (asynchronous exports)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ExportJobService:
+    """
+    Asynchronous report exports: request → worker → stored file → download.
+
+    FLOW:
+        1. POST /reports/jobs/ → request_export() returns a PENDING ExportJob
+           (or the live job an identical request already produced)
+        2. `manage.py run_export_jobs` claims jobs with SKIP LOCKED and runs
+           ReportService.generate_export() in its own process, so long
+           exports never occupy a web worker
+        3. The file is written to MEDIA_ROOT/exports/; progress/total_rows
+           are updated while it is generated (for 'sheets', in households —
+           rendered by a process pool started inside the worker)
+        4. GET /reports/jobs/{id}/download/ serves it until expires_at
+        5. sweep() deletes expired files and fails jobs whose worker died
+    """
+
+    ARTIFACT_TTL = timedelta(hours=24)   # how long a finished file is kept
+    STALE_AFTER  = timedelta(hours=2)    # RUNNING longer than this = dead worker
+    RETENTION    = timedelta(days=30)    # FAILED/EXPIRED job rows kept for audit
+
+    FORMATS = ('csv', 'excel', 'parquet', 'arrow')
+
+    @staticmethod
+    def data_version() -> str:
+        """Counters of every table an export reads, e.g. '12.840.31'."""
+        versions = dict(DataVersion.objects.values_list('key', 'version'))
+        return '.'.join(
+            str(versions.get(key, 0))
+            for key in (DataVersion.Key.HOUSEHOLD, DataVersion.Key.NORMALIZED, DataVersion.Key.PROGRAM)
+        )
+
+    @staticmethod
+    def dedupe_key(entity_type: str, fmt: str, filters: dict, data_version: str) -> str:
+        payload = json.dumps(
+            {'entity': entity_type, 'fmt': fmt, 'filters': filters, 'version': data_version},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def request_export(
+        cls,
+        entity_type: str,
+        fmt: str,
+        filters: dict,
+        requested_by,
+    ) -> tuple[ExportJob, bool]:
+        """
+        Queue an export, or return the live job for an identical request.
+
+        Returns:
+            (job, created)
+
+        Raises:
+            ValueError:  unknown entity_type or format
+            ImportError: PDF sheets requested without weasyprint installed
+        """
+        bundle = entity_type == ReportService.BUNDLE
+        if entity_type == ReportService.SHEETS:
+            ReportService._check_sheets(filters, fmt)
+        elif entity_type not in ReportService.ENTITY_COLUMNS and not bundle:
+            raise ValueError(
+                f"Unknown entity_type '{entity_type}'. "
+                f"Choose from: {', '.join(ReportService.ENTITY_COLUMNS)}, "
+                f"{ReportService.BUNDLE}, {ReportService.SHEETS}"
+            )
+        elif fmt not in cls.FORMATS:
+            raise ValueError(f"Unknown format '{fmt}'. Choose from: {', '.join(cls.FORMATS)}")
+        if filters.get('answers'):
+            AnswerColumns.validate('survey' if bundle else entity_type, filters['answers'])
+        if bundle and filters.get('since'):
+            raise ValueError('Delta exports are per entity type; they cannot be bundled.')
+
+        filters = dict(filters)
+        if filters.get('purok_ids'):
+            # Purok scope is a set — [2, 1] and [1, 2] are the same export
+            filters['purok_ids'] = sorted(set(filters['purok_ids']))
+
+        version = cls.data_version()
+        key     = cls.dedupe_key(entity_type, fmt, filters, version)
+
+        existing = ExportJob.objects.filter(dedupe_key=key, status__in=ExportJob.LIVE_STATUSES).first()
+        if existing is not None:
+            if existing.status != ExportJob.Status.DONE or existing.expires_at > timezone.now():
+                return existing, False
+            # Expired but not swept yet — retire it so the key is free again
+            cls._expire(existing)
+
+        try:
+            with transaction.atomic():
+                job = ExportJob.objects.create(
+                    requested_by=requested_by,
+                    entity_type=entity_type,
+                    fmt=fmt,
+                    filters=filters,
+                    data_version=version,
+                    dedupe_key=key,
+                )
+        except IntegrityError:
+            # Lost a race with an identical request (double-click)
+            return ExportJob.objects.get(dedupe_key=key, status__in=ExportJob.LIVE_STATUSES), False
+        return job, True
+
+    # ── Worker side ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def claim_next() -> ExportJob | None:
+        """Atomically take the oldest PENDING job; None when the queue is empty."""
+        with transaction.atomic():
+            job = (
+                ExportJob.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=ExportJob.Status.PENDING)
+                .order_by('created_at')
+                .first()
+            )
+            if job is None:
+                return None
+            job.status     = ExportJob.Status.RUNNING
+            job.started_at = timezone.now()
+            job.save(update_fields=['status', 'started_at'])
+        return job
+
+    @classmethod
+    def run(cls, job: ExportJob) -> ExportJob:
+        """
+        Generate the file for a claimed job and store it under MEDIA_ROOT.
+
+        on_progress only records the row count; it is written to the job
+        between chunks, and only outside a transaction — a bundle streams
+        inside a READ ONLY snapshot, where the UPDATE would be rejected
+        (and be invisible to pollers until commit anyway). Bundles therefore
+        report progress when the stream ends.
+        """
+        progress = ExportJob.objects.filter(pk=job.pk)
+        rows     = {'seen': 0, 'saved': 0}
+
+        def flush() -> None:
+            if rows['seen'] != rows['saved']:
+                progress.update(progress=rows['seen'])
+                rows['saved'] = rows['seen']
+
+        try:
+            filters = ReportService.pin_watermark(job.filters)
+            job.total_rows = ReportService.count_rows(job.entity_type, filters)
+            progress.update(total_rows=job.total_rows)
+
+            result = ReportService.generate_export(
+                entity_type=job.entity_type,
+                filters=filters,
+                fmt=job.fmt,
+                stream=True,
+                on_progress=lambda count: rows.__setitem__('seen', count),
+            )
+            with tempfile.TemporaryFile() as tmp:
+                for chunk in result.stream:
+                    tmp.write(chunk)
+                    if not connection.in_atomic_block:
+                        flush()
+                flush()
+                tmp.seek(0)
+                job.file.save(result.filename, File(tmp), save=False)
+
+            finished = timezone.now()
+            job.refresh_from_db(fields=['progress'])
+            job.status       = ExportJob.Status.DONE
+            job.filename     = result.filename
+            job.content_type = result.content_type
+            job.finished_at  = finished
+            job.expires_at   = finished + cls.ARTIFACT_TTL
+            job.watermark    = result.watermark
+            job.save(update_fields=[
+                'status', 'file', 'filename', 'content_type', 'finished_at', 'expires_at',
+                'watermark',
+            ])
+        except Exception as exc:
+            logger.exception('[ExportJobService] Export job %s failed', job.pk)
+            job.status      = ExportJob.Status.FAILED
+            job.error       = str(exc)[:2000]
+            job.finished_at = timezone.now()
+            job.save(update_fields=['status', 'error', 'finished_at'])
+        return job
+
+    # ── Expiry ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _expire(job: ExportJob) -> None:
+        if job.file:
+            job.file.delete(save=False)
+        job.status = ExportJob.Status.EXPIRED
+        job.save(update_fields=['file', 'status'])
+
+    @classmethod
+    def sweep(cls) -> dict:
+        """
+        Delete expired artifacts, fail jobs abandoned by a dead worker, and
+        purge old FAILED/EXPIRED rows.
+
+        Returns:
+            {'expired': 3, 'stale': 0, 'purged': 12}
+        """
+        now = timezone.now()
+
+        expired = 0
+        for job in ExportJob.objects.filter(status=ExportJob.Status.DONE, expires_at__lte=now):
+            cls._expire(job)
+            expired += 1
+
+        stale = ExportJob.objects.filter(
+            status=ExportJob.Status.RUNNING, started_at__lte=now - cls.STALE_AFTER,
+        ).update(
+            status=ExportJob.Status.FAILED,
+            error='The export worker stopped before the file was finished.',
+            finished_at=now,
+        )
+
+        purged, _ = ExportJob.objects.filter(
+            status__in=[ExportJob.Status.FAILED, ExportJob.Status.EXPIRED],
+            created_at__lte=now - cls.RETENTION,
+        ).delete()
+
+        return {'expired': expired, 'stale': stale, 'purged': purged}
@@ -0,0 +1,252 @@
+"""
+Profiling App — Household Profile Sheets
+══════════════════════════════════════════════════════════════════════════════
+
+Printable one-page profiles — household, its latest (or chosen year's)
+survey, families, persons, and programs — for every household of a purok,
+generated as one ZIP before each survey season.
+
+PIPELINE
+────────
+  load_sheets()   parent process, SHEET_BATCH households at a time:
+                  1 query for the households, then 1 survey query with
+                  3 prefetches (families, persons, programs) per batch.
+                  Each household becomes a plain dict — no model instances
+                  cross the process boundary.
+  render_sheet()  worker processes (ProcessPoolExecutor, spawn): Django
+                  template → HTML, optionally → PDF via
+                  ReportService._export_pdf() (weasyprint).
+  iter_zip()      parent: a bounded window of sheets is kept in flight;
+                  results are written, in household order, into a
+                  streamed ZIP as they complete.
+
+Workers use the 'spawn' start method and never touch the database, so the
+parent's open connection is not shared with forked children. A spawned
+worker imports this module to unpickle render_sheet() before its
+initializer has run django.setup() — hence models are imported inside
+load_sheets() only.
+"""
+
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator
+
+import django
+from django.conf import settings
+from django.db.models import Prefetch
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+FORMATS = ('html', 'pdf')
+
+# Households loaded (and prefetched) per round of queries
+SHEET_BATCH = 200
+
+# Sheets kept in flight per worker, and how often progress is reported
+IN_FLIGHT      = 4
+PROGRESS_EVERY = 25
+
+TEMPLATE = 'profiling/profile_sheet.html'
+
+
+def worker_count() -> int:
+    """settings.PROFILING_SHEET_WORKERS, else one per CPU (max 8)."""
+    configured = getattr(settings, 'PROFILING_SHEET_WORKERS', None)
+    return max(1, configured or min(8, os.cpu_count() or 1))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Loading (parent process)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _answers(data: dict, labels: dict) -> list[tuple[str, str]]:
+    """(label, value) pairs of a JSON answer dict, in form order."""
+    data  = data or {}
+    pairs = []
+    for field_id, label in labels.items():
+        value = data.get(field_id)
+        if value is None or value == '':
+            continue
+        if isinstance(value, list):
+            value = ', '.join(str(v) for v in value)
+        pairs.append((label, str(value)))
+    return pairs
+
+
+def _field_labels(schema, level: str, cache: dict) -> dict:
+    """{field_id: label} of one FormSchema level, computed once per schema."""
+    key = (schema.pk, level)
+    if key not in cache:
+        cache[key] = {
+            field['id']: field.get('label', field['id'])
+            for field in schema.get_fields_for_level(level)
+            if field.get('id')
+        }
+    return cache[key]
+
+
+def _survey_sheet(survey, labels: dict) -> dict:
+    schema = survey.form_schema
+    return {
+        'year':         survey.survey_year,
+        'status':       survey.get_status_display(),
+        'surveyed_by':  survey.surveyed_by.full_name if survey.surveyed_by else '',
+        'surveyed_at':  survey.surveyed_at,
+        'verified_by':  survey.verified_by.full_name if survey.verified_by else '',
+        'verified_at':  survey.verified_at,
+        'form_schema':  schema.name,
+        'answers':      _answers(survey.data, _field_labels(schema, 'household', labels)),
+        'families': [
+            {
+                'number':   family.family_number,
+                'income':   family.get_monthly_income_bracket_display(),
+                'answers':  _answers(family.data, _field_labels(schema, 'family', labels)),
+                'persons': [
+                    {
+                        'name':          person.full_name,
+                        'role':          person.get_role_display(),
+                        'gender':        person.get_gender_display(),
+                        'date_of_birth': person.date_of_birth,
+                        'age':           person.age_at_survey,
+                        'civil_status':  person.get_civil_status_display(),
+                        'education':     person.get_educational_attainment_display(),
+                        'voter':         person.is_registered_voter,
+                        'sectors':       ', '.join(person.sectors or []),
+                        'answers':       _answers(person.data, _field_labels(schema, 'person', labels)),
+                    }
+                    for person in family.persons.all()
+                ],
+                'programs': [
+                    {
+                        'type':         program.get_program_type_display(),
+                        'name':         program.program_name,
+                        'beneficiary':  program.beneficiary.full_name if program.beneficiary else '',
+                        'date_availed': program.date_availed,
+                        'amount':       program.amount,
+                    }
+                    for program in family.programs_availed.all()
+                ],
+            }
+            for family in survey.families.all()
+        ],
+    }
+
+
+def load_sheets(purok_ids, survey_year: int | None = None) -> Iterator[dict]:
+    """
+    Yield one sheet dict per household of the puroks, ordered by purok and
+    household number. The survey is the one of survey_year, or the
+    household's latest; households without one get a blank sheet.
+    """
+    from .models import Family, Household, HouseholdSurvey, Person, ProgramAvailed
+
+    households = list(
+        Household.objects
+        .filter(purok_id__in=purok_ids)
+        .select_related('purok')
+        .order_by('purok__number', 'household_number')
+    )
+    labels = {}
+    it     = iter(households)
+    while batch := list(islice(it, SHEET_BATCH)):
+        surveys = (
+            HouseholdSurvey.objects
+            .filter(household__in=batch)
+            .select_related('form_schema', 'surveyed_by', 'verified_by')
+            .prefetch_related(Prefetch(
+                'families',
+                queryset=Family.objects.order_by('family_number').prefetch_related(
+                    Prefetch('persons', queryset=Person.objects.all()),
+                    Prefetch('programs_availed', queryset=ProgramAvailed.objects.select_related('beneficiary')),
+                ),
+            ))
+        )
+        if survey_year is not None:
+            surveys = surveys.filter(survey_year=survey_year)
+        else:
+            # DISTINCT ON (household): the first row per household = latest year
+            surveys = surveys.order_by('household_id', '-survey_year').distinct('household_id')
+        by_household = {survey.household_id: survey for survey in surveys}
+
+        for household in batch:
+            survey = by_household.get(household.pk)
+            yield {
+                'household': {
+                    'number':    household.household_number,
+                    'purok':     str(household.purok),
+                    'address':   household.address,
+                    'status':    household.get_status_display(),
+                    'latitude':  household.latitude,
+                    'longitude': household.longitude,
+                },
+                'survey': _survey_sheet(survey, labels) if survey else None,
+            }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Rendering (worker processes)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _init_worker() -> None:
+    """Spawned workers start from a bare interpreter: load settings + apps."""
+    django.setup()
+
+
+def render_sheet(sheet: dict, fmt: str) -> tuple[str, bytes]:
+    """(file name, content) of one sheet. Runs in a worker — no DB access."""
+    household = sheet['household']
+    html = render_to_string(TEMPLATE, {
+        'household':    household,
+        'survey':       sheet['survey'],
+        'generated_at': timezone.now(),
+    })
+    name = get_valid_filename(f'{household["number"]}.{fmt}')
+    if fmt == 'pdf':
+        from .services import ReportService
+        return name, ReportService._export_pdf(html)
+    return name, html.encode('utf-8')
+
+
+def iter_zip(sheets: Iterator[dict], fmt: str, sink, workers: int | None = None,
+             on_progress=None) -> Iterator[bytes]:
+    """
+    Render sheets in a process pool and stream them into a ZIP written to
+    `sink` (a drainable file object, see services._ChunkSink).
+
+    At most workers × IN_FLIGHT sheets are submitted ahead of the one being
+    written, so neither the loaded dicts nor the rendered files pile up in
+    the parent; results are taken in submission order, which keeps the ZIP
+    in household order. on_progress(sheets_done) is called after every
+    PROGRESS_EVERY sheets.
+    """
+    workers     = workers or worker_count()
+    compression = zipfile.ZIP_STORED if fmt == 'pdf' else zipfile.ZIP_DEFLATED
+    context     = multiprocessing.get_context('spawn')
+    pending     = deque()
+    done        = 0
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker) as pool, \
+            zipfile.ZipFile(sink, 'w', compression=compression) as archive:
+        sheets = iter(sheets)
+        while True:
+            while len(pending) < workers * IN_FLIGHT:
+                sheet = next(sheets, None)
+                if sheet is None:
+                    break
+                pending.append(pool.submit(render_sheet, sheet, fmt))
+            if not pending:
+                break
+            name, content = pending.popleft().result()
+            archive.writestr(name, content)
+            done += 1
+            if on_progress is not None and done % PROGRESS_EVERY == 0:
+                on_progress(done)
+            if data := sink.drain():
+                yield data
+    if on_progress is not None:
+        on_progress(done)
+    yield sink.drain()
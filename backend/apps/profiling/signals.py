@@ -19,7 +19,9 @@ HOW IT WORKS
    b. Reads the data JSON field
    c. Maps each field_id → canonical_name  (via FormSchema.get_canonical_map)
    d. Maps each raw_value → canonical_value (via FieldMapping.get_canonical_value)
-   e. Bulk-inserts new NormalizedData rows
+   e. Translates names/values to ConceptName/ConceptValue ids (inserting
+      any strings not seen before)
+   f. Bulk-inserts new NormalizedData rows
 
 WHAT HAPPENS ON FAILURE
 ────────────────────────
@@ -31,6 +33,21 @@ fully regenerated at any time by running:
     >>> for s in HouseholdSurvey.all_objects.all():
     ...     rebuild_normalized_data_for_survey(s)
 
+DATA VERSIONS
+─────────────
+Every normalization run and every Household / ProgramAvailed save/delete
+bumps the matching DataVersion counter ('normalized' / 'household' /
+'program'). Precomputed artifacts such as the map cluster layers
+(MapTileService) and export jobs compare their stored version against it
+to know when to rebuild.
+
+The normalized bump runs on commit, once per transaction however many
+surveys it normalized (with the per-year counters of every year touched),
+so a reader that sees the new version also sees the complete new rows and
+a batch import updates the counter row once instead of per survey. The
+HouseholdBitmap re-index of the survey's household (bitmaps.refresh_survey)
+happens right away, inside the transaction, with the rows.
+
 SKIPPED FIELDS
 ──────────────
 - Null or empty values are skipped (no row inserted)
@@ -40,12 +57,17 @@ SKIPPED FIELDS
 
 import json
 import logging
+import threading
 
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Family, FieldMapping, HouseholdSurvey, NormalizedData, Person
+from . import bitmaps
+from .models import (
+    ConceptName, ConceptValue, DataVersion, Family, FieldMapping, Household,
+    HouseholdSurvey, NormalizedData, Person, ProgramAvailed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -101,8 +123,12 @@ def _build_rows(
     Returns:
         List of NormalizedData instances (not yet saved)
     """
-    rows = []
-    year = survey.survey_year
+    entries = []
+    year    = survey.survey_year
+
+    # Denormalized scope — lets concept queries skip the survey/household join
+    purok_id  = survey.household.purok_id
+    is_active = not survey.is_deleted
 
     for field_id, raw_value in data.items():
         # Skip empty / null values — no useful information to normalize
@@ -128,17 +154,99 @@ def _build_rows(
             fm.get_canonical_value(year, raw_str)
         )
 
-        rows.append(NormalizedData(
+        entries.append((
+            canonical_name,
+            raw_str[:500],                  # ConceptValue.text max_length=500
+            canonical_str[:500],
+        ))
+
+    if not entries:
+        return []
+
+    # Dictionary-encode: one lookup (plus one insert for unseen strings) per
+    # table for the whole batch rather than per row
+    name_ids  = ConceptName.ids_for({name for name, _, _ in entries}, create=True)
+    value_ids = ConceptValue.ids_for(
+        {text for _, raw, canonical in entries for text in (raw, canonical)}, create=True,
+    )
+
+    return [
+        NormalizedData(
             household_survey=survey,
             survey_year=year,
             level=level,
             source_id=source_id,
-            canonical_name=canonical_name,
-            raw_value=raw_str[:500],        # CharField max_length=500
-            canonical_value=canonical_str[:500],
-        ))
+            concept_id=name_ids[canonical_name],
+            raw_id=value_ids[raw_str],
+            value_id=value_ids[canonical_str],
+            purok_id=purok_id,
+            is_active=is_active,
+        )
+        for canonical_name, raw_str, canonical_str in entries
+    ]
+
+
+def _delete_rows(**lookups) -> list[tuple[int, int]]:
+    """
+    Delete the NormalizedData rows matching `lookups` and return the distinct
+    (concept_id, value_id) pairs they held, for _rows_changed().
+    """
+    rows  = NormalizedData.objects.filter(**lookups)
+    pairs = list(rows.order_by().values_list('concept_id', 'value_id').distinct())
+    rows.delete()
+    return pairs
+
+
+class _NormalizedBump:
+    """on_commit callback: one 'normalized' bump for every year collected."""
 
-    return rows
+    def __init__(self):
+        self.years = set()
+
+    def __call__(self):
+        try:
+            DataVersion.bump(DataVersion.Key.NORMALIZED, *self.years)
+        except Exception:
+            logger.exception(
+                '[DataVersion] Failed to bump normalized version (years=%s)',
+                sorted(self.years)
+            )
+
+
+# The _NormalizedBump registered by this thread's current transaction
+_pending = threading.local()
+
+
+def _queue_normalized_bump(year: int) -> None:
+    """
+    Bump 'normalized' and its counter for `year` when the transaction
+    commits — sharing one callback with every other normalization of the
+    same transaction. Outside a transaction the bump runs immediately.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        DataVersion.bump(DataVersion.Key.NORMALIZED, year)
+        return
+
+    bump = getattr(_pending, 'bump', None)
+    # Gone from the queue = its transaction committed, or rolled back
+    # (savepoint included) and took the callback with it
+    if bump is None or not any(func is bump for _, func, _ in connection.run_on_commit):
+        bump = _pending.bump = _NormalizedBump()
+        transaction.on_commit(bump)
+    bump.years.add(year)
+
+
+def _rows_changed(survey: HouseholdSurvey, old_pairs=()) -> None:
+    """
+    Bring derived indexes up to date after a survey's NormalizedData rows were
+    rewritten: re-index its household in the bitmap index now (for the pairs
+    the deleted rows held and the survey holds now), and queue the
+    'normalized' DataVersion bump for the survey year until commit, so
+    readers never see the new version before the rows and bitmaps behind it.
+    """
+    bitmaps.refresh_survey(survey, old_pairs)
+    _queue_normalized_bump(survey.survey_year)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -156,12 +264,10 @@ def normalize_survey_household_level(survey: HouseholdSurvey) -> int:
         Number of NormalizedData rows inserted.
     """
     # Delete stale rows for household-level data of this survey
-    NormalizedData.objects.filter(
-        household_survey=survey,
-        level='household',
-    ).delete()
+    old_pairs = _delete_rows(household_survey=survey, level='household')
 
     if not survey.data:
+        _rows_changed(survey, old_pairs)
         return 0
 
     canonical_map  = survey.form_schema.get_canonical_map()
@@ -178,6 +284,7 @@ def normalize_survey_household_level(survey: HouseholdSurvey) -> int:
 
     if rows:
         NormalizedData.objects.bulk_create(rows)
+    _rows_changed(survey, old_pairs)
 
     return len(rows)
 
@@ -194,13 +301,10 @@ def normalize_family_level(family: Family) -> int:
     """
     survey = family.household_survey
 
-    NormalizedData.objects.filter(
-        household_survey=survey,
-        level='family',
-        source_id=family.id,
-    ).delete()
+    old_pairs = _delete_rows(household_survey=survey, level='family', source_id=family.id)
 
     if not family.data:
+        _rows_changed(survey, old_pairs)
         return 0
 
     canonical_map  = survey.form_schema.get_canonical_map()
@@ -217,6 +321,7 @@ def normalize_family_level(family: Family) -> int:
 
     if rows:
         NormalizedData.objects.bulk_create(rows)
+    _rows_changed(survey, old_pairs)
 
     return len(rows)
 
@@ -233,13 +338,10 @@ def normalize_person_level(person: Person) -> int:
     """
     survey = person.family.household_survey
 
-    NormalizedData.objects.filter(
-        household_survey=survey,
-        level='person',
-        source_id=person.id,
-    ).delete()
+    old_pairs = _delete_rows(household_survey=survey, level='person', source_id=person.id)
 
     if not person.data:
+        _rows_changed(survey, old_pairs)
         return 0
 
     canonical_map  = survey.form_schema.get_canonical_map()
@@ -256,6 +358,7 @@ def normalize_person_level(person: Person) -> int:
 
     if rows:
         NormalizedData.objects.bulk_create(rows)
+    _rows_changed(survey, old_pairs)
 
     return len(rows)
 
@@ -279,27 +382,31 @@ def rebuild_normalized_data_for_survey(survey: HouseholdSurvey) -> dict:
         result = rebuild_normalized_data_for_survey(survey)
         # {'household': 8, 'families': 12, 'persons': 34}
 
+    Runs in one transaction, so the 'normalized' DataVersion is bumped
+    once for the whole survey rather than once per family and person.
+
     Returns:
         Dict with counts of rows inserted per level.
     """
     # Use select_related/prefetch to avoid N+1 queries
     survey = (
         HouseholdSurvey.all_objects
-        .select_related('form_schema')
+        .select_related('form_schema', 'household')
         .prefetch_related(
             'families__persons',
         )
         .get(pk=survey.pk)
     )
 
-    household_count = normalize_survey_household_level(survey)
-    family_count    = 0
-    person_count    = 0
+    with transaction.atomic():
+        household_count = normalize_survey_household_level(survey)
+        family_count    = 0
+        person_count    = 0
 
-    for family in survey.families.all():
-        family_count += normalize_family_level(family)
-        for person in family.persons.all():
-            person_count += normalize_person_level(person)
+        for family in survey.families.all():
+            family_count += normalize_family_level(family)
+            for person in family.persons.all():
+                person_count += normalize_person_level(person)
 
     return {
         'household': household_count,
@@ -331,7 +438,7 @@ def on_household_survey_save(sender, instance, **kwargs):
     def run():
         try:
             survey = HouseholdSurvey.all_objects.select_related(
-                'form_schema'
+                'form_schema', 'household'
             ).get(pk=survey_id)
             normalize_survey_household_level(survey)
         except HouseholdSurvey.DoesNotExist:
@@ -356,7 +463,7 @@ def on_family_save(sender, instance, **kwargs):
     def run():
         try:
             family = Family.all_objects.select_related(
-                'household_survey__form_schema'
+                'household_survey__form_schema', 'household_survey__household'
             ).get(pk=family_id)
             normalize_family_level(family)
         except Family.DoesNotExist:
@@ -380,7 +487,8 @@ def on_person_save(sender, instance, **kwargs):
     def run():
         try:
             person = Person.all_objects.select_related(
-                'family__household_survey__form_schema'
+                'family__household_survey__form_schema',
+                'family__household_survey__household',
             ).get(pk=person_id)
             normalize_person_level(person)
         except Person.DoesNotExist:
@@ -392,3 +500,41 @@ def on_person_save(sender, instance, **kwargs):
             )
 
     transaction.on_commit(run)
+
+
+@receiver(post_save, sender=Household)
+@receiver(post_delete, sender=Household)
+def on_household_change(sender, instance, **kwargs):
+    """
+    After a Household is created, edited, moved, or deleted, bump the
+    'household' DataVersion so precomputed map clusters get rebuilt.
+    """
+    def run():
+        try:
+            DataVersion.bump(DataVersion.Key.HOUSEHOLD)
+        except Exception:
+            logger.exception(
+                '[DataVersion] Failed to bump household version (pk=%s)',
+                instance.pk
+            )
+
+    transaction.on_commit(run)
+
+
+@receiver(post_save, sender=ProgramAvailed)
+@receiver(post_delete, sender=ProgramAvailed)
+def on_program_change(sender, instance, **kwargs):
+    """
+    Programs are not normalized, so they get their own DataVersion
+    ('program') — export deduplication keys include it.
+    """
+    def run():
+        try:
+            DataVersion.bump(DataVersion.Key.PROGRAM)
+        except Exception:
+            logger.exception(
+                '[DataVersion] Failed to bump program version (pk=%s)',
+                instance.pk
+            )
+
+    transaction.on_commit(run)
@@ -0,0 +1,226 @@
+"""
+Profiling App — Spatial Helpers
+══════════════════════════════════════════════════════════════════════════════
+
+Pure-Python geometry used by the household map endpoints. No PostGIS.
+
+GEOHASH INDEX
+─────────────
+Household.geohash stores the base-32 geohash of (latitude, longitude) at
+GEOHASH_PRECISION characters (~5 m cells). Nearby points share a prefix, so
+a bounding box can be covered by a handful of short prefixes and answered
+with `geohash LIKE 'w5qf%' OR ...` — a plain B-tree range scan when the
+index uses varchar_pattern_ops.
+
+  bbox  → cover_bbox()  → list of prefixes → index range scans
+                        → exact lat/lng refinement in SQL
+  radius → bbox of the circle, then haversine refinement in Python
+  nearest → radius search, doubling the radius until N candidates are found
+
+The helpers here never touch the database; SpatialService (services.py)
+turns them into querysets.
+"""
+
+import math
+
+GEOHASH_PRECISION = 9
+
+# Maximum number of prefixes cover_bbox() may return. More prefixes = tighter
+# cover but a longer OR-chain; 32 keeps the SQL small and the index scans few.
+MAX_COVER_CELLS = 32
+
+EARTH_RADIUS_M = 6_371_008.8
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_DECODE = {ch: i for i, ch in enumerate(_BASE32)}
+
+
+def encode_geohash(latitude, longitude, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Encode a coordinate pair into a geohash string.
+
+    Accepts Decimal, float, or str values (Household stores DecimalField).
+
+    Example:
+        encode_geohash(14.5995, 120.9842) → 'wdw4f8k7p'
+    """
+    lat, lng = float(latitude), float(longitude)
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True   # geohash interleaves bits starting with longitude
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_lo = mid
+            else:
+                bits <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def decode_bounds(geohash: str) -> tuple[float, float, float, float]:
+    """
+    Return (min_lat, min_lng, max_lat, max_lng) of the cell a geohash names.
+    """
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    even = True
+
+    for ch in geohash:
+        value = _DECODE[ch]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if even:
+                mid = (lng_lo + lng_hi) / 2
+                if bit:
+                    lng_lo = mid
+                else:
+                    lng_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if bit:
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            even = not even
+
+    return lat_lo, lng_lo, lat_hi, lng_hi
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(lat_degrees, lng_degrees) spanned by one geohash cell at a precision."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def cover_bbox(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    max_cells: int = MAX_COVER_CELLS,
+) -> list[str]:
+    """
+    Return geohash prefixes whose cells together cover the bounding box.
+
+    Picks the longest precision whose cell grid over the box stays within
+    max_cells, so a barangay-sized box resolves to a few 5–6 character
+    prefixes. Returns [] for a box larger than one precision-1 cell grid
+    allows — callers should then fall back to the lat/lng range filter alone.
+    """
+    best: list[str] = []
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        d_lat, d_lng = cell_size(precision)
+        rows = math.floor(max_lat / d_lat) - math.floor(min_lat / d_lat) + 1
+        cols = math.floor(max_lng / d_lng) - math.floor(min_lng / d_lng) + 1
+        if rows * cols > max_cells:
+            break
+
+        cells = set()
+        lat = min_lat
+        for _ in range(rows):
+            lng = min_lng
+            for _ in range(cols):
+                cells.add(encode_geohash(
+                    min(lat, max_lat), min(lng, max_lng), precision,
+                ))
+                lng += d_lng
+            lat += d_lat
+        # Make sure the far corners are always included (float stepping)
+        cells.add(encode_geohash(max_lat, max_lng, precision))
+        cells.add(encode_geohash(min_lat, max_lng, precision))
+        cells.add(encode_geohash(max_lat, min_lng, precision))
+        best = sorted(cells)
+
+    return best
+
+
+def radius_bbox(lat: float, lng: float, radius_m: float) -> tuple[float, float, float, float]:
+    """
+    Bounding box (min_lat, min_lng, max_lat, max_lng) that encloses a circle.
+    Used to pre-filter candidates before the exact haversine check.
+    """
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-12)
+    d_lng = math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat))
+    return (
+        max(lat - d_lat, -90.0),
+        max(lng - d_lng, -180.0),
+        min(lat + d_lat, 90.0),
+        min(lng + d_lng, 180.0),
+    )
+
+
+def haversine_m(lat1, lng1, lat2, lng2) -> float:
+    """Great-circle distance in metres between two coordinate pairs."""
+    p1, p2 = math.radians(float(lat1)), math.radians(float(lat2))
+    d_phi = p2 - p1
+    d_lambda = math.radians(float(lng2) - float(lng1))
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(p1) * math.cos(p2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Web-mercator tiles (map clustering)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Each map tile is split into 2**CLUSTER_CELL_BITS × 2**CLUSTER_CELL_BITS
+# cluster cells (8 × 8 = 64 cells per 256 px tile → one cluster per 32 px).
+CLUSTER_CELL_BITS = 3
+
+# Beyond this zoom individual pins (/households/map/) are cheaper than clusters
+MAX_CLUSTER_ZOOM = 17
+
+# Web-mercator cannot represent the poles; clamp like every slippy-map client
+_MERCATOR_MAX_LAT = 85.05112878
+
+
+def tile_position(latitude, longitude, zoom: int) -> tuple[float, float]:
+    """
+    Fractional slippy-map tile coordinates (x, y) of a point at a zoom level.
+    floor() of each value is the standard z/x/y tile index.
+    """
+    lat = max(min(float(latitude), _MERCATOR_MAX_LAT), -_MERCATOR_MAX_LAT)
+    n = 1 << zoom
+    x = (float(longitude) + 180.0) / 360.0 * n
+    lat_rad = math.radians(lat)
+    y = (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n
+    return min(max(x, 0.0), n - 1e-9), min(max(y, 0.0), n - 1e-9)
+
+
+def cluster_cell(latitude, longitude, zoom: int) -> tuple[int, int]:
+    """
+    Integer cluster cell (cell_x, cell_y) of a point at a zoom level.
+
+    Cells are tiles of zoom + CLUSTER_CELL_BITS, so tile (x, y) at `zoom`
+    owns cells x*8 … x*8+7 and y*8 … y*8+7.
+    """
+    x, y = tile_position(latitude, longitude, zoom + CLUSTER_CELL_BITS)
+    return int(x), int(y)
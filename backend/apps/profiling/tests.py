@@ -0,0 +1,356 @@
+"""
+Profiling App — Tests
+══════════════════════════════════════════════════════════════════════════════
+
+FILTER QUERY SHAPE
+──────────────────
+filters.py answers "rows whose parent matches" with EXISTS semi-joins and
+the denormalized purok / survey_year columns. These tests pin that down:
+each rewritten filter must run as one query with no DISTINCT and without
+joining the survey → household → purok chain in the outer query.
+
+Querysets are built with .order_by() so the models' default orderings
+(which do join the chain, for display) don't mask the filter's own SQL.
+Assertions are on the generated SQL, never on EXPLAIN: the planner may
+run an EXISTS as a semi-join, a hashed subplan, or an aggregate + join.
+
+EXPORT JOBS
+───────────
+The worker path (ExportJobService.run) for a single entity and for a
+bundle. Bundles stream inside a READ ONLY snapshot, so these run as
+TransactionTestCase — inside TestCase's wrapping transaction the snapshot
+is never opened and a write from the progress callback would go unnoticed.
+
+Run with:
+    python manage.py test apps.profiling
+"""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+from decimal import Decimal
+from unittest import mock
+
+from django.test import (
+    RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings,
+)
+from rest_framework.test import APIClient
+
+from apps.accounts.models import StaffProfile, StaffPurokPermission, User
+from apps.residents.models import Purok
+
+from .filters import (
+    FamilyFilter, HouseholdFilter, HouseholdSurveyFilter,
+    PersonFilter, ProgramAvailedFilter,
+)
+from .models import (
+    DataVersion, ExportJob, Family, FormSchema, Household, HouseholdSurvey, Person, ProgramAvailed,
+)
+from .services import ExportJobService, HouseholdService, ReportService, SnapshotService
+from .signals import rebuild_normalized_data_for_survey
+from .spatial import encode_geohash
+from .views import _accepts_gzip
+
+CHAIN_TABLES = ('profiling_householdsurvey', 'profiling_household', 'residents_purok')
+
+
+class FilterQueryShapeTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.purok_3 = Purok.objects.create(number=3, name='Purok 3')
+        cls.purok_4 = Purok.objects.create(number=4, name='Purok 4')
+        schema_2024 = FormSchema.objects.create(year=2024, name='Survey 2024', schema={})
+        schema_2025 = FormSchema.objects.create(year=2025, name='Survey 2025', schema={})
+
+        # Surveyed in 2024 and 2025 — latest is 2025, 2024 needs the EXISTS probe
+        cls.hh_a = Household.objects.create(household_number='PRK3-001', purok=cls.purok_3)
+        survey_a = HouseholdSurvey.objects.create(
+            household=cls.hh_a, form_schema=schema_2024, survey_year=2024)
+        HouseholdSurvey.objects.create(
+            household=cls.hh_a, form_schema=schema_2025, survey_year=2025)
+        Household.all_objects.filter(pk=cls.hh_a.pk).update(
+            latest_survey_year=2025, survey_count=2)
+        cls.survey_a = survey_a
+
+        # Never surveyed
+        cls.hh_b = Household.objects.create(household_number='PRK4-001', purok=cls.purok_4)
+
+    def filtered(self, filterset_class, params, queryset):
+        filterset = filterset_class(params, queryset=queryset.order_by())
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return filterset.qs
+
+    def assertSemiJoin(self, qs, exists=True):
+        """One query, no DISTINCT, no join in the outer query (EXISTS optional)."""
+        sql = str(qs.query)
+        outer = sql.split('EXISTS(')[0]
+        self.assertNotIn('DISTINCT', sql)
+        self.assertNotIn('JOIN', outer)
+        if exists:
+            self.assertIn('EXISTS(', sql)
+        else:
+            self.assertNotIn('EXISTS(', sql)
+
+        with self.assertNumQueries(1):
+            return list(qs)
+
+    def assertSingleTable(self, qs):
+        """Denormalized filters: no join and no subquery at all."""
+        self.assertSemiJoin(qs, exists=False)
+        sql = str(qs.query)
+        for table in CHAIN_TABLES:
+            self.assertNotIn(f'"{table}"', sql)
+
+    # ── HouseholdFilter ───────────────────────────────────────────────────────
+
+    def test_household_surveyed_year(self):
+        qs = self.filtered(HouseholdFilter, {'surveyed_year': 2024}, Household.objects.all())
+        self.assertEqual(self.assertSemiJoin(qs), [self.hh_a])
+
+    def test_household_has_surveys(self):
+        qs = self.filtered(HouseholdFilter, {'has_surveys': 'false'}, Household.objects.all())
+        self.assertEqual(self.assertSemiJoin(qs, exists=False), [self.hh_b])
+
+    # ── HouseholdSurveyFilter ─────────────────────────────────────────────────
+
+    def test_survey_purok_number(self):
+        qs = self.filtered(HouseholdSurveyFilter, {'purok': 3, 'year': 2024},
+                           HouseholdSurvey.objects.all())
+        self.assertEqual(self.assertSemiJoin(qs), [self.survey_a])
+
+    def test_survey_purok_id(self):
+        qs = self.filtered(HouseholdSurveyFilter, {'purok_id': self.purok_4.pk},
+                           HouseholdSurvey.objects.all())
+        self.assertEqual(self.assertSemiJoin(qs), [])
+
+    def test_survey_purok_ids(self):
+        qs = self.filtered(HouseholdSurveyFilter,
+                           {'purok_ids': f'{self.purok_3.pk},{self.purok_4.pk}'},
+                           HouseholdSurvey.objects.all())
+        self.assertEqual(len(self.assertSemiJoin(qs)), 2)
+
+    def test_survey_household_number(self):
+        qs = self.filtered(HouseholdSurveyFilter, {'household_number': 'prk4'},
+                           HouseholdSurvey.objects.all())
+        self.assertEqual(self.assertSemiJoin(qs), [])
+
+    # ── Family / Person / ProgramAvailed ──────────────────────────────────────
+
+    def test_family_scope(self):
+        qs = self.filtered(FamilyFilter,
+                           {'survey_year': 2024, 'purok_ids': str(self.purok_3.pk)},
+                           Family.objects.all())
+        self.assertSingleTable(qs)
+
+    def test_person_scope(self):
+        qs = self.filtered(PersonFilter,
+                           {'survey_year': 2024, 'purok_id': self.purok_3.pk},
+                           Person.objects.all())
+        self.assertSingleTable(qs)
+
+    def test_person_household_number(self):
+        qs = self.filtered(PersonFilter, {'household_number': 'PRK3'}, Person.objects.all())
+        self.assertSemiJoin(qs)
+        # The chain is only walked inside the EXISTS, keyed on the family
+        self.assertIn('U0."id" = ("profiling_person"."family_id")', str(qs.query))
+
+    def test_program_scope(self):
+        qs = self.filtered(ProgramAvailedFilter,
+                           {'survey_year': 2024, 'purok_ids': str(self.purok_3.pk)},
+                           ProgramAvailed.objects.all())
+        self.assertSingleTable(qs)
+
+
+class HouseholdUpdateTests(TestCase):
+
+    def test_update_keeps_survey_summary_and_geohash(self):
+        purok     = Purok.objects.create(number=5, name='Purok 5')
+        household = Household.objects.create(household_number='PRK5-001', purok=purok)
+        # A survey is recorded after the instance was loaded
+        Household.all_objects.filter(pk=household.pk).update(
+            latest_survey_year=2025, survey_count=1)
+
+        HouseholdService.update_household(
+            household, {'latitude': Decimal('14.599500'), 'longitude': Decimal('120.984200')}, updated_by=None)
+
+        household.refresh_from_db()
+        self.assertEqual((household.latest_survey_year, household.survey_count), (2025, 1))
+        self.assertEqual(household.geohash, encode_geohash(household.latitude, household.longitude))
+        self.assertNotEqual(household.geohash, '')
+
+
+class SurveySnapshotTests(TestCase):
+
+    def test_rebuilt_after_purok_rename(self):
+        purok     = Purok.objects.create(number=6, name='Old name')
+        schema    = FormSchema.objects.create(year=2025, name='Survey 2025', schema={})
+        household = Household.objects.create(household_number='PRK6-001', purok=purok)
+        survey    = HouseholdSurvey.objects.create(
+            household=household, form_schema=schema, survey_year=2025,
+            status=HouseholdSurvey.SurveyStatus.VERIFIED,
+        )
+        first = json.loads(gzip.decompress(SnapshotService.content(survey)))
+
+        # Renamed through the residents API — nothing invalidates the snapshot
+        Purok.objects.filter(pk=purok.pk).update(name='New name')
+        second = json.loads(gzip.decompress(SnapshotService.content(survey)))
+
+        self.assertNotEqual(first['purok'], second['purok'])
+        self.assertIn('New name', second['purok'])
+
+
+class NormalizedVersionBumpTests(TestCase):
+
+    def test_one_bump_per_transaction(self):
+        purok     = Purok.objects.create(number=8, name='Purok 8')
+        schema    = FormSchema.objects.create(year=2025, name='Survey 2025', schema={})
+        household = Household.objects.create(household_number='PRK8-001', purok=purok)
+        survey    = HouseholdSurvey.objects.create(
+            household=household, form_schema=schema, survey_year=2025)
+        family    = Family.objects.create(household_survey=survey, family_number=1)
+        Person.objects.create(family=family, first_name='Ana', last_name='Cruz')
+        Person.objects.create(family=family, first_name='Ben', last_name='Cruz')
+
+        with mock.patch('apps.profiling.signals.DataVersion.bump') as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                rebuild_normalized_data_for_survey(survey)
+
+        bump.assert_called_once_with(DataVersion.Key.NORMALIZED, 2025)
+
+
+class AcceptEncodingTests(SimpleTestCase):
+
+    def accepts(self, header: str) -> bool:
+        return _accepts_gzip(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header))
+
+    def test_gzip_accepted(self):
+        for header in ('gzip', 'br, gzip;q=0.5', 'GZIP', '*', 'deflate, *;q=0.1', '*;q=0, gzip'):
+            self.assertTrue(self.accepts(header), header)
+
+    def test_gzip_refused(self):
+        for header in ('', 'identity', 'x-gzip', 'gzip;q=0', 'gzip; q=0.000', 'gzip;q=bad', '*;q=0'):
+            self.assertFalse(self.accepts(header), header)
+
+
+class ChildExportScopeTests(TestCase):
+    """Family / person / program exports with no survey-level filter at all."""
+
+    @classmethod
+    def setUpTestData(cls):
+        purok     = Purok.objects.create(number=7, name='Purok 7')
+        schema    = FormSchema.objects.create(year=2025, name='Survey 2025', schema={})
+        household = Household.objects.create(household_number='PRK7-001', purok=purok)
+        survey    = HouseholdSurvey.objects.create(
+            household=household, form_schema=schema, survey_year=2025)
+        family    = Family.objects.create(household_survey=survey, family_number=1)
+        person    = Person.objects.create(family=family, first_name='Ana', last_name='Cruz')
+        ProgramAvailed.objects.create(
+            family=family, beneficiary=person,
+            program_type=ProgramAvailed.ProgramType.FINANCIAL,
+        )
+
+    def rows(self, entity_type: str, filters: dict) -> list:
+        result = ReportService.generate_export(entity_type, filters, 'csv')
+        return list(csv.reader(io.StringIO(result.content.decode('utf-8-sig'))))[1:]
+
+    def test_unfiltered(self):
+        for entity_type in ('family', 'person', 'program'):
+            with self.subTest(entity_type):
+                self.assertEqual(len(self.rows(entity_type, {})), 1)
+
+    def test_delta_unfiltered(self):
+        for entity_type in ('family', 'person', 'program'):
+            with self.subTest(entity_type):
+                rows = self.rows(entity_type, {'since': '2000-01-01T00:00:00+00:00'})
+                self.assertEqual(len(rows), 1)
+
+    def test_count_rows_unfiltered(self):
+        self.assertEqual(ReportService.count_rows(ReportService.BUNDLE, {}),
+                         sum(ReportService.count_rows(entity, {})
+                             for entity in ReportService.ENTITY_COLUMNS))
+        self.assertEqual(ReportService.count_rows('person', {}), 1)
+
+
+class ExportJobAccessTests(TestCase):
+    """A job is visible to whoever could have requested it, and no one else."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.purok_1 = Purok.objects.create(number=1, name='Purok 1')
+        cls.purok_2 = Purok.objects.create(number=2, name='Purok 2')
+        cls.staff_1 = cls.make_staff('one@example.com', cls.purok_1)
+        cls.staff_2 = cls.make_staff('two@example.com', cls.purok_2)
+
+    @staticmethod
+    def make_staff(email: str, purok: Purok) -> User:
+        user = User.objects.create_user(email=email, password='x', role=User.Role.STAFF)
+        StaffProfile.objects.create(user=user, perm_generate_reports=True)
+        StaffPurokPermission.objects.create(user=user, purok=purok, can_export=True)
+        return user
+
+    def request_job(self, user: User, **params) -> dict:
+        client = APIClient()
+        client.force_authenticate(user)
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        response = client.post(f'/api/v1/profiling/reports/jobs/?{query}')
+        self.assertIn(response.status_code, (200, 202), response.content)
+        return response.json()
+
+    def job_status(self, user: User, job_id) -> int:
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get(f'/api/v1/profiling/reports/jobs/{job_id}/').status_code
+
+    def test_staff_job_scoped_to_export_puroks(self):
+        job = self.request_job(self.staff_1, entity_type='survey')
+        self.assertEqual(ExportJob.objects.get(pk=job['id']).filters['purok_ids'], [self.purok_1.pk])
+
+    def test_other_purok_staff_cannot_read_job(self):
+        job = self.request_job(self.staff_1, entity_type='survey')
+        self.assertEqual(self.job_status(self.staff_1, job['id']), 200)
+        self.assertEqual(self.job_status(self.staff_2, job['id']), 404)
+
+    def test_staff_cannot_request_other_puroks(self):
+        client = APIClient()
+        client.force_authenticate(self.staff_1)
+        response = client.post(
+            f'/api/v1/profiling/reports/jobs/?entity_type=survey&purok_ids={self.purok_2.pk}')
+        self.assertEqual(response.status_code, 403)
+
+
+class ExportJobRunTests(TransactionTestCase):
+
+    def setUp(self):
+        purok  = Purok.objects.create(number=1, name='Purok 1')
+        schema = FormSchema.objects.create(year=2025, name='Survey 2025', schema={})
+        for n in range(3):
+            household = Household.objects.create(household_number=f'PRK1-{n:03}', purok=purok)
+            HouseholdSurvey.objects.create(household=household, form_schema=schema, survey_year=2025)
+
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def run_job(self, entity_type: str, fmt: str = 'csv') -> ExportJob:
+        ExportJobService.request_export(entity_type, fmt, {}, requested_by=None)
+        job = ExportJobService.claim_next()
+        # Report progress on every row, so callbacks fire mid-stream
+        with mock.patch.object(ReportService, 'PROGRESS_EVERY', 1):
+            return ExportJobService.run(job)
+
+    def test_entity_job(self):
+        job = self.run_job('survey')
+        self.assertEqual(job.status, ExportJob.Status.DONE, job.error)
+        self.assertEqual(job.progress, 3)
+
+    def test_bundle_job(self):
+        job = self.run_job(ReportService.BUNDLE)
+        self.assertEqual(job.status, ExportJob.Status.DONE, job.error)
+        self.assertEqual(job.progress, job.total_rows)
+        self.assertGreater(job.progress, 0)
+        self.assertTrue(job.file.name.endswith('.zip'))
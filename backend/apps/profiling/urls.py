@@ -37,17 +37,22 @@ router.register(r'reports', ReportViewSet, basename='report')
 # households/{id}/latest-survey/          GET
 # households/{id}/compare/                GET  ?year_a=2024&year_b=2025
 # households/{id}/change-log/             GET
+# households/map/                         GET  ?bbox= | ?lat&lng&radius= | ?lat&lng&nearest=
+# households/tiles/{z}/{x}/{y}/           GET  clustered tile, ?concept=&year= overlay
 #
 # surveys/                                GET, POST  (nested create)
+# surveys/facets/                         GET  filter sidebar counts
 # surveys/{id}/                           GET, PATCH, DELETE
 # surveys/{id}/submit/                    POST
 # surveys/{id}/verify/                    POST
 # surveys/{id}/request-revision/          POST
+# surveys/{id}/restore/                   POST
 #
 # families/                               GET
 # families/{id}/                          GET, PATCH
 #
 # persons/                                GET  ?q=name&year=2024&sectors=PWD
+# persons/facets/                         GET  filter sidebar counts
 # persons/{id}/                           GET, PATCH
 #
 # programs/                               GET, POST
@@ -62,8 +67,13 @@ router.register(r'reports', ReportViewSet, basename='report')
 # query/filter-by-concept/                GET
 # query/get-trend/                        GET
 # query/demographics/                     GET
+# query/count/                            GET  ?year=2025&match=concept:value (repeatable)
+# query/target/                           POST {year, where: and/or/not expression}
 #
 # reports/export/                         GET  (download)
+# reports/jobs/                           POST (queue async export)
+# reports/jobs/{id}/                      GET  (status / progress)
+# reports/jobs/{id}/download/             GET  (finished file)
 # reports/rebuild-normalized/             POST (admin only)
 
 urlpatterns = [
@@ -10,17 +10,22 @@ COMPLETE URL MAP (all under /api/v1/profiling/)
   households/{id}/latest-survey/           GET most recent survey
   households/{id}/compare/                 GET diff (?year_a=2024&year_b=2025)
   households/{id}/change-log/             GET audit trail
+  households/map/                          GET pins (?bbox= | ?lat&lng&radius= | ?lat&lng&nearest=)
+  households/tiles/{z}/{x}/{y}/            GET clustered tile (?concept=water_source&year=2025)
 
   surveys/                                 GET list (filterable), POST create (nested)
+  surveys/facets/                          GET filter sidebar counts (status, purok, year)
   surveys/{id}/                            GET detail, PATCH update data
   surveys/{id}/submit/                     POST DRAFT|REVISION → SUBMITTED
   surveys/{id}/verify/                     POST SUBMITTED → VERIFIED  (ADMIN+)
   surveys/{id}/request-revision/           POST SUBMITTED → REVISION  (ADMIN+)
+  surveys/{id}/restore/                    POST undo soft delete       (ADMIN+)
 
   families/                                GET list, filter by household_survey
   families/{id}/                           GET detail, PATCH update
 
   persons/                                 GET list (filterable + searchable)
+  persons/facets/                          GET filter sidebar counts (gender, sector, purok, year...)
   persons/{id}/                            GET detail, PATCH update
 
   programs/                                GET list, POST create, PATCH, DELETE
@@ -37,8 +42,13 @@ COMPLETE URL MAP (all under /api/v1/profiling/)
   query/demographics/                      GET demographic summary
   query/concepts/                          GET list available FieldMapping concepts
   query/concept-values/                    GET unique values for one concept+year
+  query/count/                             GET households matching several concept=value pairs
+  query/target/                            POST households matching an AND/OR/NOT expression
 
-  reports/export/                          GET download (CSV/Excel)
+  reports/export/                          GET download (CSV / Arrow streamed; Excel, Parquet)
+  reports/jobs/                            POST queue an async export (same params as export/)
+  reports/jobs/{id}/                       GET job status + progress
+  reports/jobs/{id}/download/              GET finished file (until it expires)
   reports/rebuild-normalized/             POST trigger NormalizedData rebuild (ADMIN+)
 
 PERMISSION MODEL (Phase 3)
@@ -53,16 +63,40 @@ FILTER BACKENDS
   DjangoFilterBackend — filterset_class handles field-specific filters
   SearchFilter        — ?search= searches common text fields
   OrderingFilter      — ?ordering= sorts by allowed fields
+
+SPARSE FIELDSETS
+────────────────
+  ?fields=id,status,families.family_number   list / detail GETs of households,
+  ?expand=families                           surveys, families, persons,
+                                             programs, schemas and mappings
+  See SparseFieldsetMixin (serializers) and QueryProfileMixin below.
+
+CONDITIONAL GET
+───────────────
+  households/{id}/, surveys/{id}/, schemas/, mappings/ (list + detail) send a
+  strong ETag and answer If-None-Match with 304 (ConditionalGetMixin).
+  VERIFIED surveys and inactive schemas are cacheable for a day.
+  A VERIFIED survey's body is its stored SurveySnapshot (gzip passed through).
 """
 
+import gzip
+import hashlib
+import json
 import logging
-
-from django.db.models import Count, Prefetch
-from django.http import HttpResponse
+import math
+
+from django.db.models import Count, Max, Prefetch, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
 from apps.common.permissions import (
@@ -79,17 +113,19 @@ from .filters import (
     FamilyFilter,
     HouseholdFilter,
     HouseholdSurveyFilter,
+    NullsLastOrderingFilter,
     PersonFilter,
     ProgramAvailedFilter,
 )
 from .models import (
-    Family, FieldMapping, FormSchema, Household,
-    HouseholdChangeLog, HouseholdSurvey, NormalizedData, Person,
+    ExportJob, Family, FieldMapping, FormSchema, Household,
+    HouseholdChangeLog, HouseholdSurvey, Person,
     ProgramAvailed,
 )
 from .pagination import ProfilingPagination
 from .serializers import (
     CreateSurveySerializer,
+    ExportJobSerializer,
     FamilySerializer,
     FamilyUpdateSerializer,
     FieldMappingSerializer,
@@ -98,26 +134,35 @@ from .serializers import (
     HouseholdSerializer,
     HouseholdSurveyLightSerializer,
     HouseholdSurveySerializer,
+    HouseholdSurveyStatusSerializer,
     HouseholdWriteSerializer,
     NormalizedDataSerializer,
     PersonSerializer,
     PersonUpdateSerializer,
     ProgramAvailedSerializer,
     ProgramAvailedWriteSerializer,
+    SparseFieldsetMixin,
     SurveyDataUpdateSerializer,
 )
 from .services import (
+    ExportJobService,
     HouseholdService,
     InvalidStatusTransitionError,
+    MapTileService,
     NormalizationService,
     QueryService,
     ReportService,
+    SnapshotService,
+    SpatialService,
     SurveyAlreadyExistsError,
     SurveyImmutableError,
 )
+from .spatial import MAX_CLUSTER_ZOOM
 
 logger = logging.getLogger(__name__)
 
+_UUID_RE = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Mixin: purok-scoped queryset for Staff
@@ -169,32 +214,344 @@ class PurokScopedMixin:
         return raw.lower() in ('true', '1', 'yes')
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Mixin: per-action queryset profiles
+# ─────────────────────────────────────────────────────────────────────────────
+
+class QueryProfileMixin:
+    """
+    Shapes get_queryset() per action from `query_profiles`:
+
+        query_profiles = {
+            'default': {'select': (...), 'prefetch': (...)},
+            'list':    {'select': (...), 'only': (...)},
+        }
+
+    Each profile declares exactly what the action's serializer (and any
+    service call it makes on the object) reads — select_related paths,
+    prefetches, and the only() / defer() column lists. Actions without an
+    entry use 'default'. A prefetch entry may be a callable returning a
+    Prefetch (or a tuple of them), so every request gets fresh ones.
+
+    Keep profiles and serializers in step: a column left out of only() is
+    fetched with one extra query per row the first time it is read.
+
+    For `sparse_actions` whose serializer is a SparseFieldsetMixin, the
+    profile is narrowed to the requested fieldset: prefetches the
+    representation does not read are dropped (so an expandable relation is
+    only prefetched when expanded), and under ?fields= the plain columns it
+    does not read are deferred — at every prefetched level.
+    """
+    query_profiles = {}
+    sparse_actions = ('list', 'retrieve')
+
+    def apply_query_profile(self, qs):
+        profiles = self.query_profiles
+        profile  = profiles.get(self.action, profiles.get('default', {}))
+        sparse   = self._sparse_serializer()
+        if profile.get('select'):
+            qs = qs.select_related(*profile['select'])
+        lookups = []
+        for lookup in profile.get('prefetch', ()):
+            lookup = lookup() if callable(lookup) else lookup
+            lookups.extend(lookup if isinstance(lookup, tuple) else (lookup,))
+        if sparse is not None:
+            lookups = _sparse_prefetches(lookups, sparse)
+        if lookups:
+            qs = qs.prefetch_related(*lookups)
+        if profile.get('only'):
+            qs = qs.only(*profile['only'])
+        if profile.get('defer'):
+            qs = qs.defer(*profile['defer'])
+        if sparse is not None:
+            qs = _sparse_defer(qs, sparse)
+        return qs
+
+    def _sparse_serializer(self):
+        if self.action not in self.sparse_actions:
+            return None
+        serializer = self.get_serializer()
+        return serializer if isinstance(serializer, SparseFieldsetMixin) else None
+
+
+def _sparse_defer(qs, serializer):
+    """Under ?fields=, defer the plain (non-key) columns `serializer` does not read."""
+    if not serializer.is_sparse:
+        return qs
+    reads  = serializer.read_attributes()
+    unread = [
+        field.name for field in qs.model._meta.concrete_fields
+        if not (field.primary_key or field.is_relation or field.name in reads)
+    ]
+    return qs.defer(*unread) if unread else qs
+
+
+def _sparse_prefetches(lookups: list, serializer) -> list:
+    """
+    The lookups whose relation `serializer` reads. A kept Prefetch's queryset
+    is narrowed the same way for the nested serializer of that relation.
+    """
+    reads = serializer.read_attributes()
+    kept  = []
+    for lookup in lookups:
+        path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        name = path.split(LOOKUP_SEP)[0]
+        if name not in reads:
+            continue
+        nested = serializer.fields.get(name)
+        nested = getattr(nested, 'child', nested)
+        if (isinstance(lookup, Prefetch) and lookup.queryset is not None
+                and isinstance(nested, SparseFieldsetMixin)):
+            inner = _sparse_prefetches(list(lookup.queryset._prefetch_related_lookups), nested)
+            lookup.queryset = _sparse_defer(
+                lookup.queryset.prefetch_related(None).prefetch_related(*inner), nested,
+            )
+        kept.append(lookup)
+    return kept
+
+
+def _user_columns(relation: str) -> tuple:
+    """Columns behind User.full_name, for only() through a user FK."""
+    return (relation, f'{relation}__first_name', f'{relation}__last_name', f'{relation}__email')
+
+
+def _family_members() -> tuple:
+    """Prefetches FamilySerializer nests: persons, and programs with their beneficiary."""
+    return (
+        Prefetch('persons', queryset=Person.objects.all()),
+        Prefetch('programs_availed', queryset=ProgramAvailed.objects.select_related('beneficiary')),
+    )
+
+
+def _survey_tree() -> Prefetch:
+    """families → persons / programs: everything HouseholdSurveySerializer nests."""
+    return Prefetch('families', queryset=Family.objects.prefetch_related(*_family_members()))
+
+
+# Relations HouseholdSurveySerializer reads besides the families tree
+_SURVEY_HEADER = ('household__purok', 'form_schema', 'surveyed_by', 'verified_by')
+
+# Columns of HouseholdSurveyStatusSerializer (header without data / families)
+_SURVEY_HEADER_COLUMNS = (
+    'id', 'household', 'household__household_number',
+    'household__purok', 'household__purok__number', 'household__purok__name',
+    'form_schema', 'form_schema__year', 'form_schema__version',
+    'form_schema__name', 'form_schema__is_active',
+    'survey_year', *_user_columns('surveyed_by'), 'surveyed_at', 'status',
+    *_user_columns('verified_by'), 'verified_at', 'notes',
+    'family_count', 'person_count',
+    'is_deleted', 'deleted_at', 'created_at', 'updated_at',
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Mixin: conditional GET (ETag / If-None-Match)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Cache-Control for records that no longer change (VERIFIED surveys,
+# superseded schemas) vs. everything else (always revalidate via ETag)
+CACHE_LONG       = 'private, max-age=86400'
+CACHE_REVALIDATE = 'private, no-cache'
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETags with If-None-Match → 304 on retrieve (and on list when
+    `etag_list` is set).
+
+    retrieve: one indexed lookup loads only the `etag_fields` columns
+    (dotted paths join their relation) of the purok-scoped object, and the
+    object permission check runs on that row. A matching If-None-Match is
+    answered with 304 right there — before the action's joins, prefetches
+    or serializer are touched.
+
+    list: one COUNT / MAX(updated_at) aggregate over the filtered queryset.
+
+    The tag hashes those values with the query string and the negotiated
+    format, so ?fields= / ?expand= variants get distinct tags. Child rows
+    that have no column on the parent bump its updated_at
+    (HouseholdService.touch_survey). cache_control(obj) picks the
+    Cache-Control header; retrieve_modified() builds the 200 response.
+    """
+    etag_fields = ('updated_at',)
+    etag_list   = False
+
+    def cache_control(self, obj) -> str:
+        return CACHE_REVALIDATE
+
+    def retrieve(self, request, *args, **kwargs):
+        obj  = self._etag_object()
+        etag = self._etag([self._etag_value(obj, path) for path in self.etag_fields])
+        if self._not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = self.retrieve_modified(request, obj, *args, **kwargs)
+        response['ETag']          = etag
+        response['Cache-Control'] = self.cache_control(obj)
+        return response
+
+    def retrieve_modified(self, request, obj, *args, **kwargs):
+        """The full response; `obj` is the etag row (etag_fields only)."""
+        return super().retrieve(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if not self.etag_list:
+            return super().list(request, *args, **kwargs)
+        stamp = self.filter_queryset(self.get_queryset()).aggregate(
+            rows=Count('pk'), changed=Max('updated_at'),
+        )
+        etag = self._etag([stamp['rows'], stamp['changed']])
+        if self._not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+        response['ETag']          = etag
+        response['Cache-Control'] = CACHE_REVALIDATE
+        return response
+
+    def _etag_object(self):
+        """get_object() on an only(etag_fields) copy of the scoped queryset."""
+        relations = {
+            path.rsplit(LOOKUP_SEP, 1)[0] for path in self.etag_fields if LOOKUP_SEP in path
+        }
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .select_related(None).prefetch_related(None).defer(None).order_by()
+            .select_related(*relations)
+            .only(*self.etag_fields, *relations)
+        )
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        obj = get_object_or_404(queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    @staticmethod
+    def _etag_value(obj, path: str):
+        *hops, name = path.split(LOOKUP_SEP)
+        for hop in hops:
+            obj = getattr(obj, hop)
+            if obj is None:
+                return None
+        return getattr(obj, obj._meta.get_field(name).attname)
+
+    def _etag(self, values: list) -> str:
+        payload = json.dumps(
+            [type(self).__name__, self.action, self.request.GET.urlencode(),
+             self.request.accepted_renderer.format, values],
+            default=str,
+        )
+        return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+    @staticmethod
+    def _not_modified(request, etag: str) -> bool:
+        header = request.headers.get('If-None-Match')
+        if not header:
+            return False
+        tags = {tag.removeprefix('W/') for tag in parse_etags(header)}
+        return '*' in tags or etag in tags
+
+
+def _snapshot_servable(request) -> bool:
+    """A stored SurveySnapshot is the plain JSON body: no sparse fieldset, JSON renderer."""
+    params = request.query_params
+    return (
+        'fields' not in params and 'expand' not in params
+        and request.accepted_renderer.format == 'json'
+    )
+
+
+def _accepts_gzip(request) -> bool:
+    """
+    Accept-Encoding lists the `gzip` coding (or `*`) with a non-zero q-value.
+    `gzip;q=0` is a refusal; `x-gzip` and other codings don't count.
+    """
+    qualities = {}
+    for item in request.headers.get('Accept-Encoding', '').split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    quality = qualities.get('gzip', qualities.get('*', 0.0))
+    return 0 < quality <= 1
+
+
+def _snapshot_response(request, content: bytes) -> HttpResponse:
+    """Send a gzip snapshot as-is when the client accepts gzip, else inflated."""
+    if _accepts_gzip(request):
+        response = HttpResponse(content, content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(gzip.decompress(content), content_type='application/json')
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # HouseholdViewSet
 # ─────────────────────────────────────────────────────────────────────────────
 
-class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
+class HouseholdViewSet(ConditionalGetMixin, QueryProfileMixin, PurokScopedMixin,
+                       viewsets.ModelViewSet):
     """
     CRUD for Household records.
 
-    Filters:  ?purok=3&status=ACTIVE&surveyed_year=2024
+    Filters:  ?purok=3&status=ACTIVE&surveyed_year=2024&has_surveys=true
     Search:   ?search=household_number_or_address
     Order:    ?ordering=household_number | purok__number | created_at
+              | -latest_survey_year (recently surveyed first) | survey_count
     Admin:    ?include_deleted=true  (ADMIN+ only)
     """
     http_method_names  = ['get', 'post', 'patch', 'delete', 'head', 'options']
     pagination_class   = ProfilingPagination
     filterset_class    = HouseholdFilter
-    filter_backends    = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends    = [DjangoFilterBackend, filters.SearchFilter, NullsLastOrderingFilter]
     search_fields      = ['household_number', 'address', 'purok__name']
-    ordering_fields    = ['household_number', 'purok__number', 'status', 'created_at']
+    ordering_fields    = ['household_number', 'purok__number', 'status', 'created_at',
+                          'latest_survey_year', 'survey_count']
     ordering           = ['purok__number', 'household_number']
 
+    # HouseholdSerializer columns. Write actions load whole rows: save()
+    # on an only() instance would write back just the loaded columns.
+    _read = {
+        'select': ('purok',),
+        'only': (
+            'id', 'household_number', 'purok', 'purok__number', 'purok__name',
+            'address', 'latitude', 'longitude', 'status', 'notes',
+            'latest_survey', 'latest_survey_year', 'survey_count',
+            'is_deleted', 'created_at', 'updated_at',
+        ),
+    }
+    # Sub-resource actions only need the household for permission checks
+    _anchor = {'only': ('id', 'household_number', 'purok')}
+    query_profiles = {
+        'default':       {'select': ('purok',)},
+        'list':          _read,
+        'retrieve':      _read,
+        'surveys':       _anchor,
+        'latest_survey': _anchor,
+        'compare':       _anchor,
+        'change_log':    _anchor,
+        'map_points':    {},     # SpatialService projects its own columns
+        'map_tile':      {},
+    }
+
+    # household_number: the resident ownership check tells households apart by it
+    etag_fields = (
+        'household_number', 'updated_at', 'is_deleted', 'purok__number', 'purok__name',
+        'latest_survey', 'latest_survey_year', 'survey_count',
+    )
+
     def get_permissions(self):
         if self.action == 'destroy':
             return [IsAdmin(), NotForcingPasswordChange()]
         if self.action in ('list', 'retrieve', 'surveys', 'latest_survey',
-                           'compare', 'change_log'):
+                           'compare', 'change_log', 'map_points', 'map_tile'):
             return [CanViewSurvey(), NotForcingPasswordChange()]
         return [CanEncodeSurvey(), NotForcingPasswordChange()]
 
@@ -208,7 +565,7 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         purok_ids = self._allowed_purok_ids(perm_flag)
         manager   = Household.all_objects if self._include_deleted() else Household.objects
 
-        qs = manager.select_related('purok').order_by('purok__number', 'household_number')
+        qs = self.apply_query_profile(manager.order_by('purok__number', 'household_number'))
         if purok_ids is not None:
             qs = qs.filter(purok_id__in=purok_ids)
         return qs
@@ -227,7 +584,11 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         serializer.instance = household
 
     def perform_update(self, serializer):
-        serializer.save(updated_by=self.request.user)
+        serializer.instance = HouseholdService.update_household(
+            serializer.instance,
+            serializer.validated_data,
+            updated_by=self.request.user,
+        )
 
     def perform_destroy(self, instance):
         instance.soft_delete(deleted_by_user=self.request.user)
@@ -263,6 +624,132 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         self.check_object_permissions(request, household)
         return Response(HouseholdSerializer(household).data)
 
+    @action(detail=False, methods=['get'], url_path='map')
+    def map_points(self, request):
+        """
+        GET /households/map/
+
+        Compact pin payload for the barangay map. Exactly one mode:
+            ?bbox=min_lng,min_lat,max_lng,max_lat   (Leaflet toBBoxString order)
+            ?lat=14.59&lng=120.98&radius=500         (metres, nearest first)
+            ?lat=14.59&lng=120.98&nearest=10         (N closest households)
+
+        HouseholdFilter params (?purok=3&status=ACTIVE...) and purok scoping
+        apply as on the list endpoint. Households without coordinates are
+        never returned.
+
+        Response:
+            {
+              "count": 2, "truncated": false,
+              "fields": ["id", "household_number", "lat", "lng", "status"],
+              "points": [["uuid", "HH-2024-0001", 14.5995, 120.9842, "ACTIVE"], ...]
+            }
+        """
+        qs = self.filter_queryset(self.get_queryset())
+        params = request.query_params
+
+        def _float(name):
+            try:
+                value = float(params[name])
+            except (KeyError, ValueError):
+                raise ValidationError({name: 'Required number.'})
+            # float() accepts 'nan' / 'inf', which the cell maths cannot floor
+            if not math.isfinite(value):
+                raise ValidationError({name: 'Must be a finite number.'})
+            return value
+
+        def _coord(name, limit):
+            value = _float(name)
+            if not -limit <= value <= limit:
+                raise ValidationError({name: f'Must be between -{limit} and {limit}.'})
+            return value
+
+        bbox = params.get('bbox')
+        if bbox:
+            try:
+                min_lng, min_lat, max_lng, max_lat = (float(v) for v in bbox.split(','))
+            except ValueError:
+                raise ValidationError({'bbox': 'Expected min_lng,min_lat,max_lng,max_lat.'})
+            if not (all(map(math.isfinite, (min_lng, min_lat, max_lng, max_lat)))
+                    and -90 <= min_lat <= 90 and -90 <= max_lat <= 90
+                    and -180 <= min_lng <= 180 and -180 <= max_lng <= 180):
+                raise ValidationError({'bbox': 'Latitudes must be within ±90 and longitudes within ±180.'})
+            if min_lat > max_lat or min_lng > max_lng:
+                raise ValidationError({'bbox': 'Minimum corner must not exceed maximum corner.'})
+            return Response(SpatialService.in_bbox(qs, min_lat, min_lng, max_lat, max_lng))
+
+        if 'radius' in params:
+            radius = _float('radius')
+            if not 0 < radius <= SpatialService.NEAREST_MAX_RADIUS_M:
+                raise ValidationError({
+                    'radius': f'Must be between 0 and {SpatialService.NEAREST_MAX_RADIUS_M} metres.'
+                })
+            return Response(SpatialService.within_radius(qs, _coord('lat', 90), _coord('lng', 180), radius))
+
+        if 'nearest' in params:
+            try:
+                limit = int(params['nearest'])
+            except ValueError:
+                raise ValidationError({'nearest': 'Must be an integer.'})
+            if not 1 <= limit <= 500:
+                raise ValidationError({'nearest': 'Must be between 1 and 500.'})
+            return Response(SpatialService.nearest(qs, _coord('lat', 90), _coord('lng', 180), limit))
+
+        raise ValidationError({'detail': 'Provide bbox, lat/lng/radius, or lat/lng/nearest.'})
+
+    @action(detail=False, methods=['get'], url_path=r'tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)')
+    def map_tile(self, request, z=None, x=None, y=None):
+        """
+        GET /households/tiles/{z}/{x}/{y}/
+
+        Precomputed household clusters for one slippy-map tile — use this
+        when zoomed out, /households/map/ pins when zoomed in.
+            ?concept=water_source&year=2025   (optional household-level overlay;
+                                               year must have surveys)
+
+        Staff only see clusters for their permitted puroks. A zoom/overlay
+        is built on its first request; later data changes are rebuilt by
+        `manage.py rebuild_map_layers`, and until then "stale": true means
+        the tile comes from the previous build.
+
+        Response:
+            {
+              "z": 14, "x": 13720, "y": 7550, "overlay": "water_source@2025",
+              "fields": ["lat", "lng", "count", "values"],
+              "clusters": [[14.5995, 120.9842, 42, {"level_3": 30, "level_2": 12}], ...],
+              "total": 42, "stale": false
+            }
+        """
+        zoom, tile_x, tile_y = int(z), int(x), int(y)
+        if zoom > MAX_CLUSTER_ZOOM:
+            raise ValidationError({'z': f'Maximum cluster zoom is {MAX_CLUSTER_ZOOM}; use households/map/.'})
+        if tile_x >= 1 << zoom or tile_y >= 1 << zoom:
+            raise ValidationError({'detail': f'Tile x/y out of range for zoom {zoom}.'})
+
+        concept = request.query_params.get('concept') or None
+        year    = request.query_params.get('year')
+        if concept:
+            if not year or not year.isdigit():
+                raise ValidationError({'year': 'Required with concept.'})
+            year = int(year)
+            if not FieldMapping.objects.filter(canonical_name=concept).exists():
+                raise ValidationError({'concept': f'Unknown concept "{concept}".'})
+            # Each (concept, year) is a layer to build — only accept real survey years
+            if not HouseholdSurvey.objects.filter(survey_year=year).exists():
+                raise ValidationError({'year': f'No surveys for {year}.'})
+        else:
+            year = None
+
+        tile = MapTileService.get_tile(
+            zoom, tile_x, tile_y,
+            purok_ids=self._allowed_purok_ids('can_view'),
+            concept=concept,
+            year=year,
+        )
+        response = Response(tile)
+        response['Cache-Control'] = 'private, max-age=60'
+        return response
+
     @action(detail=True, methods=['get'])
     def surveys(self, request, pk=None):
         """
@@ -274,7 +761,7 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         qs = (
             HouseholdSurvey.objects
             .filter(household=household)
-            .select_related('form_schema', 'surveyed_by')
+            .select_related('household__purok', 'form_schema', 'surveyed_by')
             .order_by('-survey_year')
         )
 
@@ -295,7 +782,11 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'], url_path='latest-survey')
     def latest_survey(self, request, pk=None):
-        """GET /households/{id}/latest-survey/ — full detail of most recent survey."""
+        """
+        GET /households/{id}/latest-survey/ — full detail of most recent survey.
+        Honors ?fields= / ?expand= like surveys/{id}/, and serves the stored
+        snapshot of a VERIFIED survey the same way.
+        """
         household = self.get_object()
         survey = HouseholdService.get_latest_survey(household)
         if not survey:
@@ -303,7 +794,15 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
                 {'detail': 'No surveys found for this household.'},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        return Response(HouseholdSurveySerializer(survey).data)
+        if _snapshot_servable(request):
+            content = SnapshotService.content(survey)
+            if content is not None:
+                return _snapshot_response(request, content)
+        serializer = HouseholdSurveySerializer(survey, context=self.get_serializer_context())
+        lookups    = _sparse_prefetches([_survey_tree()], serializer)
+        if lookups:
+            prefetch_related_objects([survey], *lookups)
+        return Response(serializer.data)
 
     @action(detail=True, methods=['get'])
     def compare(self, request, pk=None):
@@ -378,7 +877,8 @@ class HouseholdViewSet(PurokScopedMixin, viewsets.ModelViewSet):
 # HouseholdSurveyViewSet
 # ─────────────────────────────────────────────────────────────────────────────
 
-class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
+class HouseholdSurveyViewSet(ConditionalGetMixin, QueryProfileMixin, PurokScopedMixin,
+                             viewsets.ModelViewSet):
     """
     CRUD for HouseholdSurveys + status transition actions.
 
@@ -396,11 +896,64 @@ class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
     ordering_fields   = ['survey_year', 'status', 'household__household_number', 'created_at']
     ordering          = ['-survey_year']
 
+    # Workflow actions change one row and answer with the status serializer
+    _workflow = {'select': _SURVEY_HEADER, 'only': _SURVEY_HEADER_COLUMNS}
+    query_profiles = {
+        # retrieve / partial_update: the full HouseholdSurveySerializer tree
+        'default': {'select': _SURVEY_HEADER, 'prefetch': (_survey_tree,)},
+        'list': {
+            'select':   ('household__purok',),
+            'prefetch': (_survey_tree,),   # only under ?expand=families
+            'only': (
+                'id', 'household', 'household__household_number',
+                'household__purok', 'household__purok__number', 'household__purok__name',
+                'survey_year', 'status', 'surveyed_at', 'family_count', 'person_count',
+                'is_deleted', 'created_at', 'updated_at',
+            ),
+        },
+        'facets':           {},
+        'submit':           _workflow,
+        'verify':           _workflow,
+        'request_revision': _workflow,
+        'restore':          _workflow,
+        'destroy':          {'select': ('household',), 'defer': ('data',)},
+    }
+
+    # Family / person / program edits reach updated_at via touch_survey();
+    # purok and user names are columns here so a rename changes the tag
+    etag_fields = (
+        'updated_at', 'is_deleted', 'status', 'family_count', 'person_count',
+        'household__household_number', 'household__purok',
+        'household__purok__number', 'household__purok__name',
+        'form_schema__updated_at',
+        *_user_columns('surveyed_by'), *_user_columns('verified_by'),
+    )
+
+    def cache_control(self, survey) -> str:
+        if survey.status == HouseholdSurvey.SurveyStatus.VERIFIED and not survey.is_deleted:
+            return CACHE_LONG
+        return CACHE_REVALIDATE
+
+    def retrieve_modified(self, request, survey, *args, **kwargs):
+        # VERIFIED: one-row fetch of the stored snapshot instead of the tree
+        if _snapshot_servable(request):
+            content = SnapshotService.content(survey)
+            if content is not None:
+                return _snapshot_response(request, content)
+        return super().retrieve_modified(request, survey, *args, **kwargs)
+
+    # /surveys/facets/ — facet name → ORM path counted under the current filters
+    facet_fields      = {
+        'status': 'status',
+        'purok':  'household__purok__number',
+        'year':   'survey_year',
+    }
+
     def get_permissions(self):
         if self.action == 'destroy':
             # Hard-delete: SUPER_ADMIN only
             return [CanDeleteSurvey(), NotForcingPasswordChange()]
-        if self.action in ('verify', 'request_revision'):
+        if self.action in ('verify', 'request_revision', 'restore'):
             return [IsAdmin(), NotForcingPasswordChange()]
         if self.action in ('create', 'partial_update', 'submit'):
             return [CanEncodeSurvey(), NotForcingPasswordChange()]
@@ -418,18 +971,12 @@ class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         perm_flag = self._perm_flag_for_action()
         purok_ids = self._allowed_purok_ids(perm_flag)
-        manager   = HouseholdSurvey.all_objects if self._include_deleted() else HouseholdSurvey.objects
+        if self.action == 'restore' or self._include_deleted():
+            manager = HouseholdSurvey.all_objects
+        else:
+            manager = HouseholdSurvey.objects
 
-        qs = (
-            manager
-            .select_related('household__purok', 'form_schema', 'surveyed_by', 'verified_by')
-            .prefetch_related(
-                Prefetch('families', queryset=Family.objects.prefetch_related(
-                    Prefetch('persons', queryset=Person.objects.all()),
-                    'programs_availed',
-                )),
-            )
-        )
+        qs = self.apply_query_profile(manager.all())
         if purok_ids is not None:
             qs = qs.filter(household__purok_id__in=purok_ids)
         return qs
@@ -444,6 +991,22 @@ class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         survey = serializer.save()
         return Response(HouseholdSurveySerializer(survey).data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        GET /surveys/facets/
+
+        Counts for every filter-sidebar option, computed in one GROUPING SETS
+        query over the surveys matching the current filters (?year_min=,
+        ?status=, ?search=, purok scoping...).
+
+        Response:
+            {"total": 120, "facets": {"status": {"VERIFIED": 80, ...},
+                                      "purok": {"1": 40, ...}, "year": {"2024": 60, ...}}}
+        """
+        qs = self.filter_queryset(self.get_queryset())
+        return Response(QueryService.get_facet_counts(qs, self.facet_fields))
+
     def partial_update(self, request, *args, **kwargs):
         """
         PATCH /surveys/{id}/ — update survey data JSON + metadata.
@@ -521,7 +1084,7 @@ class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
                 survey = HouseholdService.request_revision(survey, requested_by=request.user, notes=notes, ip_address=ip)
         except InvalidStatusTransitionError as exc:
             raise ValidationError({'detail': str(exc)})
-        return Response(HouseholdSurveySerializer(survey).data)
+        return Response(HouseholdSurveyStatusSerializer(survey).data)
 
     @action(detail=True, methods=['post'])
     def submit(self, request, pk=None):
@@ -538,12 +1101,23 @@ class HouseholdSurveyViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         """POST /surveys/{id}/request-revision/ — SUBMITTED → REVISION (ADMIN+)"""
         return self._transition_action(request, 'request_revision')
 
+    @action(detail=True, methods=['post'])
+    def restore(self, request, pk=None):
+        """POST /surveys/{id}/restore/ — undo a soft delete (ADMIN+)"""
+        survey = HouseholdService.restore_survey(
+            self.get_object(),
+            restored_by=request.user,
+            ip_address=request.META.get('REMOTE_ADDR'),
+        )
+        return Response(HouseholdSurveyStatusSerializer(survey).data)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # FamilyViewSet
 # ─────────────────────────────────────────────────────────────────────────────
 
-class FamilyViewSet(PurokScopedMixin,
+class FamilyViewSet(QueryProfileMixin,
+                    PurokScopedMixin,
                     viewsets.mixins.ListModelMixin,
                     viewsets.mixins.RetrieveModelMixin,
                     viewsets.mixins.UpdateModelMixin,
@@ -563,6 +1137,14 @@ class FamilyViewSet(PurokScopedMixin,
                           'household_survey__survey_year']
     ordering           = ['household_survey__survey_year', 'family_number']
 
+    # Scope comes from the denormalized purok_id; the survey row is only
+    # needed for the resident ownership check and update_family's log entry.
+    query_profiles = {
+        'default':        {'prefetch': (_family_members,)},
+        'retrieve':       {'select': ('household_survey',), 'prefetch': (_family_members,)},
+        'partial_update': {'select': ('household_survey__household',), 'prefetch': (_family_members,)},
+    }
+
     def get_permissions(self):
         if self.action == 'partial_update':
             return [CanEncodeSurvey(), NotForcingPasswordChange()]
@@ -577,16 +1159,9 @@ class FamilyViewSet(PurokScopedMixin,
         perm_flag = self._perm_flag_for_action()
         purok_ids = self._allowed_purok_ids(perm_flag)
 
-        qs = (
-            Family.objects
-            .select_related('household_survey__household__purok')
-            .prefetch_related(
-                Prefetch('persons', queryset=Person.objects.all()),
-                'programs_availed',
-            )
-        )
+        qs = self.apply_query_profile(Family.objects.all())
         if purok_ids is not None:
-            qs = qs.filter(household_survey__household__purok_id__in=purok_ids)
+            qs = qs.filter(purok_id__in=purok_ids)
         return qs
 
     def partial_update(self, request, *args, **kwargs):
@@ -609,7 +1184,8 @@ class FamilyViewSet(PurokScopedMixin,
 # PersonViewSet
 # ─────────────────────────────────────────────────────────────────────────────
 
-class PersonViewSet(PurokScopedMixin,
+class PersonViewSet(QueryProfileMixin,
+                    PurokScopedMixin,
                     viewsets.mixins.ListModelMixin,
                     viewsets.mixins.RetrieveModelMixin,
                     viewsets.mixins.UpdateModelMixin,
@@ -636,11 +1212,29 @@ class PersonViewSet(PurokScopedMixin,
     search_fields     = ['first_name', 'last_name', 'middle_name']
     ordering_fields   = [
         'last_name', 'first_name', 'gender', 'age_at_survey',
-        'date_of_birth', 'educational_attainment',
+        'date_of_birth', 'educational_attainment', 'survey_year',
         'family__household_survey__survey_year',
     ]
     ordering = ['last_name', 'first_name']
 
+    # /persons/facets/ — facet name → ORM path counted under the current filters
+    facet_fields       = {
+        'gender':                 'gender',
+        'civil_status':           'civil_status',
+        'educational_attainment': 'educational_attainment',
+        'sector':                 'sectors',
+        'purok':                  'purok__number',
+        'year':                   'survey_year',
+    }
+    array_facet_fields = ('sector',)
+
+    # PersonSerializer reads only its own row; partial_update re-fetches
+    # with the survey chain itself.
+    query_profiles = {
+        'default':  {},
+        'retrieve': {'select': ('family__household_survey',)},
+    }
+
     def get_permissions(self):
         if self.action == 'partial_update':
             return [CanEncodeSurvey(), NotForcingPasswordChange()]
@@ -655,16 +1249,31 @@ class PersonViewSet(PurokScopedMixin,
         perm_flag = self._perm_flag_for_action()
         purok_ids = self._allowed_purok_ids(perm_flag)
 
-        qs = (
-            Person.objects
-            .select_related('family__household_survey__household__purok')
-        )
+        qs = self.apply_query_profile(Person.objects.all())
         if purok_ids is not None:
-            qs = qs.filter(
-                family__household_survey__household__purok_id__in=purok_ids
-            )
+            qs = qs.filter(purok_id__in=purok_ids)
         return qs
 
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        GET /persons/facets/
+
+        Counts for every filter-sidebar option (gender, civil status,
+        education, sector, purok, year), computed in one GROUPING SETS
+        query over the persons matching the current filters.
+
+        A person with several sectors counts once under each of them.
+
+        Response:
+            {"total": 340, "facets": {"gender": {"MALE": 170, ...},
+                                      "sector": {"PWD": 12, "SENIOR": 40, ...}, ...}}
+        """
+        qs = self.filter_queryset(self.get_queryset())
+        return Response(QueryService.get_facet_counts(
+            qs, self.facet_fields, array_facets=self.array_facet_fields,
+        ))
+
     def partial_update(self, request, *args, **kwargs):
         # Re-fetch with select_related to avoid N+1 in log_change
         person = (
@@ -690,7 +1299,7 @@ class PersonViewSet(PurokScopedMixin,
 # ProgramAvailedViewSet
 # ─────────────────────────────────────────────────────────────────────────────
 
-class ProgramAvailedViewSet(PurokScopedMixin, viewsets.ModelViewSet):
+class ProgramAvailedViewSet(QueryProfileMixin, PurokScopedMixin, viewsets.ModelViewSet):
     """
     Full CRUD for ProgramAvailed records.
 
@@ -706,6 +1315,12 @@ class ProgramAvailedViewSet(PurokScopedMixin, viewsets.ModelViewSet):
     ordering_fields   = ['date_availed', 'program_type', 'amount']
     ordering          = ['-date_availed']
 
+    # Object-level actions walk family → survey for the ownership check
+    query_profiles = {
+        'default': {'select': ('family__household_survey', 'beneficiary')},
+        'list':    {'select': ('beneficiary',)},
+    }
+
     def get_permissions(self):
         if self.action in ('list', 'retrieve'):
             return [CanViewSurvey(), NotForcingPasswordChange()]
@@ -720,34 +1335,41 @@ class ProgramAvailedViewSet(PurokScopedMixin, viewsets.ModelViewSet):
         perm_flag = self._perm_flag_for_action()
         purok_ids = self._allowed_purok_ids(perm_flag)
 
-        qs = (
-            ProgramAvailed.objects
-            .select_related(
-                'family__household_survey__household__purok',
-                'beneficiary',
-            )
-        )
+        qs = self.apply_query_profile(ProgramAvailed.objects.all())
         if purok_ids is not None:
-            qs = qs.filter(
-                family__household_survey__household__purok_id__in=purok_ids
-            )
+            qs = qs.filter(purok_id__in=purok_ids)
         return qs
 
+    @staticmethod
+    def _scope_from_family(family) -> dict:
+        """Denormalized purok / survey_year for a program of `family`."""
+        return {'purok_id': family.purok_id, 'survey_year': family.survey_year}
+
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user, updated_by=self.request.user)
+        program = serializer.save(
+            created_by=self.request.user,
+            updated_by=self.request.user,
+            **self._scope_from_family(serializer.validated_data['family']),
+        )
+        HouseholdService.touch_survey(program.family.household_survey_id)
 
     def perform_update(self, serializer):
-        serializer.save(updated_by=self.request.user)
+        previous = serializer.instance.family.household_survey_id
+        family   = serializer.validated_data.get('family')
+        scope    = self._scope_from_family(family) if family else {}
+        program  = serializer.save(updated_by=self.request.user, **scope)
+        HouseholdService.touch_survey(previous, program.family.household_survey_id)
 
     def perform_destroy(self, instance):
         instance.soft_delete(deleted_by_user=self.request.user)
+        HouseholdService.touch_survey(instance.family.household_survey_id)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # FormSchema / FieldMapping ViewSets
 # ─────────────────────────────────────────────────────────────────────────────
 
-class FormSchemaViewSet(viewsets.ModelViewSet):
+class FormSchemaViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     GET  /schemas/       — list (staff+)
     POST /schemas/       — create (ADMIN+)
@@ -762,10 +1384,21 @@ class FormSchemaViewSet(viewsets.ModelViewSet):
     ordering_fields  = ['year', 'version', 'created_at']
     ordering         = ['-year', '-version']
     filterset_fields = ['year', 'is_active']
+    etag_fields      = ('updated_at', 'is_active')
+    etag_list        = True
+
+    def cache_control(self, schema) -> str:
+        # Inactive versions are kept only to read historical surveys
+        return CACHE_REVALIDATE if schema.is_active else CACHE_LONG
 
     def get_queryset(self):
         return FormSchema.objects.all()
 
+    def perform_update(self, serializer):
+        schema = serializer.save()
+        # Survey snapshots embed form_schema_info
+        SnapshotService.invalidate(survey__form_schema=schema)
+
     def get_serializer_class(self):
         return FormSchemaSerializer
 
@@ -778,7 +1411,7 @@ class FormSchemaViewSet(viewsets.ModelViewSet):
         serializer.save(created_by=self.request.user)
 
 
-class FieldMappingViewSet(viewsets.ModelViewSet):
+class FieldMappingViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     GET  /mappings/       — list (staff+)
     POST /mappings/       — create (ADMIN+)
@@ -793,6 +1426,7 @@ class FieldMappingViewSet(viewsets.ModelViewSet):
     ordering_fields  = ['canonical_name', 'level']
     ordering         = ['level', 'canonical_name']
     filterset_fields = ['level', 'data_type']
+    etag_list        = True
 
     def get_queryset(self):
         return FieldMapping.objects.all()
@@ -819,6 +1453,11 @@ class QueryViewSet(viewsets.ViewSet):
     GET /query/demographics/       — demographic summary for a year
     GET /query/concepts/           — list all available FieldMapping concepts
     GET /query/concept-values/     — unique values for one concept in a given year
+    GET /query/count/              — households matching several concept=value pairs
+    POST /query/target/            — households matching an AND/OR/NOT concept expression
+
+    get-trend, concept-values and count are served from the in-process
+    columnar engine (analytics.py) when numpy is installed.
     """
     permission_classes = [CanViewSurvey, NotForcingPasswordChange]
 
@@ -1035,30 +1674,114 @@ class QueryViewSet(viewsets.ViewSet):
         if not canonical_name:
             raise ValidationError({'canonical_name': 'Required.'})
 
-        qs = NormalizedData.objects.filter(canonical_name=canonical_name)
+        year = None
         if year_raw:
             try:
-                qs = qs.filter(survey_year=int(year_raw))
+                year = int(year_raw)
             except ValueError:
                 raise ValidationError({'year': 'Must be an integer.'})
 
-        purok_ids = self._purok_ids_from_request()
-        if purok_ids:
-            qs = qs.filter(
-                household_survey__household__purok_id__in=purok_ids
-            )
-
-        values = (
-            qs.values('canonical_value')
-            .annotate(count=Count('household_survey', distinct=True))
-            .order_by('-count')
+        values = QueryService.get_concept_values(
+            canonical_name=canonical_name,
+            year=year,
+            purok_ids=self._purok_ids_from_request(),
         )
         return Response({
             'canonical_name': canonical_name,
-            'year':           int(year_raw) if year_raw else None,
-            'values':         list(values),
+            'year':           year,
+            'values':         values,
         })
 
+    @action(detail=False, methods=['get'])
+    def count(self, request):
+        """
+        GET /query/count/
+            ?year=2025
+            &match=water_source:level_1
+            &match=toilet_facility:none
+            &purok_ids=1  (optional)
+
+        Number of households whose survey for `year` matches EVERY
+        canonical_name:canonical_value pair.
+
+        Response:
+            {"year": 2025, "match": {"water_source": "level_1", ...}, "count": 37}
+        """
+        year_raw = request.query_params.get('year')
+        matches  = request.query_params.getlist('match')
+
+        if not year_raw or not matches:
+            raise ValidationError({'detail': 'year and at least one match are required.'})
+        try:
+            year = int(year_raw)
+        except ValueError:
+            raise ValidationError({'year': 'Must be an integer.'})
+
+        conditions = []
+        for match in matches:
+            name, sep, value = match.partition(':')
+            if not sep or not name or not value:
+                raise ValidationError({'match': 'Use canonical_name:canonical_value.'})
+            conditions.append((name, value))
+
+        return Response({
+            'year':  year,
+            'match': dict(conditions),
+            'count': QueryService.count_matching(
+                conditions, year=year, purok_ids=self._purok_ids_from_request(),
+            ),
+        })
+
+    @action(detail=False, methods=['post'])
+    def target(self, request):
+        """
+        POST /query/target/
+            {
+              "year": 2025,
+              "where": {"and": [
+                {"concept": "water_source", "value": "level_1"},
+                {"not": {"concept": "electricity_source", "value": "grid"}}
+              ]},
+              "purok_ids": [1, 2],      (optional)
+              "count_only": false       (optional)
+            }
+
+        Households matching a boolean combination of concept predicates,
+        evaluated on the household bitmap index. Grammar: and / or (lists),
+        not (one expression), {"concept", "value"} leaves.
+
+        Response: paginated households, or {"year": 2025, "count": 37}
+        when count_only is true.
+        """
+        year      = request.data.get('year')
+        where     = request.data.get('where')
+        purok_ids = request.data.get('purok_ids') or None
+
+        if not isinstance(year, int) or isinstance(year, bool):
+            raise ValidationError({'year': 'Required integer.'})
+        if not where:
+            raise ValidationError({'where': 'Required.'})
+        if purok_ids is not None and not (
+            isinstance(purok_ids, list) and all(isinstance(p, int) for p in purok_ids)
+        ):
+            raise ValidationError({'purok_ids': 'Must be a list of integers.'})
+
+        try:
+            if request.data.get('count_only'):
+                return Response({
+                    'year':  year,
+                    'count': QueryService.count_target(where, year, purok_ids),
+                })
+            qs = QueryService.target_households(where, year, purok_ids)
+        except ValueError as exc:
+            raise ValidationError({'where': str(exc)})
+
+        paginator = ProfilingPagination()
+        page = paginator.paginate_queryset(qs, request)
+        if page is not None:
+            return paginator.get_paginated_response(HouseholdSerializer(page, many=True).data)
+        return Response(HouseholdSerializer(qs, many=True).data)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # ReportViewSet  (downloads)
@@ -1069,13 +1792,31 @@ class ReportViewSet(viewsets.ViewSet):
     Generates downloadable export files.
 
     GET /reports/export/
-        ?entity_type=person|survey|household|family|program
-        &format=csv|excel
+        ?entity_type=person|survey|household|family|program|bundle (ZIP of all five)
+        &format=csv|excel|parquet|arrow
         &survey_year=2024              (single year)
         &year_start=2022&year_end=2024 (year range)
-        &purok_ids=1&purok_ids=2       (location filter)
+        &purok_ids=1&purok_ids=2       (location filter; staff: within their
+                                        can_export puroks, all of them if omitted)
         &status=VERIFIED               (survey status filter)
         &include_deleted=true          (ADMIN+ only)
+        &answers=fields|canonical      (survey/family/person: add the form
+                                        answers as columns, per schema field
+                                        or per canonical name across years)
+        &since=2024-06-01T00:00:00Z    (survey/family/person/program: delta of
+                                        records changed since then, tombstones
+                                        included; the X-Export-Watermark
+                                        response header is the next `since`)
+        &compress=gzip|zstd            (csv/arrow: compressed while streaming,
+                                        e.g. .csv.gz; zstd needs `zstandard`)
+
+    POST /reports/jobs/?<same params as export>
+        Queues the export for `manage.py run_export_jobs`; poll
+        GET /reports/jobs/{id}/ and fetch GET /reports/jobs/{id}/download/.
+
+    POST /reports/jobs/?entity_type=sheets&format=html|pdf&purok_ids=3
+        Jobs only: a ZIP of printable profile sheets, one per household of
+        the puroks (latest survey, or &survey_year=). pdf needs `weasyprint`.
 
     POST /reports/rebuild-normalized/
         Body: {"year": 2024}           (optional; omit to rebuild ALL)
@@ -1102,6 +1843,15 @@ class ReportViewSet(viewsets.ViewSet):
                 'Ask your administrator to enable perm_generate_reports.'
             )
 
+    def _export_purok_ids(self) -> list | None:
+        """Puroks the user may export (StaffPurokPermission.can_export). None = all (ADMIN+)."""
+        user = self.request.user
+        if user.role in ('SUPER_ADMIN', 'ADMIN'):
+            return None
+        return list(
+            user.purok_permissions.filter(can_export=True).values_list('purok_id', flat=True)
+        )
+
     def _build_filters(self, request) -> dict:
         filters_dict = {}
 
@@ -1118,10 +1868,31 @@ class ReportViewSet(viewsets.ViewSet):
         if purok_ids:
             filters_dict['purok_ids'] = [int(p) for p in purok_ids]
 
+        # Staff export their can_export puroks only — all of them by default
+        allowed = self._export_purok_ids()
+        if allowed is not None:
+            requested = set(filters_dict.get('purok_ids') or allowed)
+            if not requested <= set(allowed):
+                raise PermissionDenied('You do not have export permission for the requested puroks.')
+            filters_dict['purok_ids'] = sorted(requested)
+
         survey_status = request.query_params.get('status')
         if survey_status:
             filters_dict['status'] = survey_status
 
+        answers = request.query_params.get('answers')
+        if answers:
+            filters_dict['answers'] = answers
+
+        since = request.query_params.get('since')
+        if since:
+            moment = parse_datetime(since)
+            if moment is None:
+                raise ValidationError({'since': 'Must be an ISO 8601 datetime, e.g. 2024-06-01T00:00:00Z.'})
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment)
+            filters_dict['since'] = moment.isoformat()
+
         include_deleted = request.query_params.get('include_deleted', 'false').lower() == 'true'
         if include_deleted and request.user.role not in ('SUPER_ADMIN', 'ADMIN'):
             raise PermissionDenied('Only admins can export deleted records.')
@@ -1136,12 +1907,19 @@ class ReportViewSet(viewsets.ViewSet):
 
         entity_type = request.query_params.get('entity_type', 'survey')
         fmt         = request.query_params.get('format', 'csv').lower()
+        compression = request.query_params.get('compress', '').lower() or None
+
+        if entity_type == ReportService.SHEETS:
+            # Rendering runs in a process pool — never inside a web worker
+            raise ValidationError({'detail': 'Profile sheets are generated as export jobs: POST /reports/jobs/.'})
 
         try:
             result = ReportService.generate_export(
                 entity_type=entity_type,
                 filters=self._build_filters(request),
                 fmt=fmt,
+                stream=True,
+                compression=compression,
             )
         except ValueError as exc:
             raise ValidationError({'detail': str(exc)})
@@ -1150,8 +1928,95 @@ class ReportViewSet(viewsets.ViewSet):
         except ImportError as exc:
             return Response({'detail': str(exc)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-        response = HttpResponse(result.content, content_type=result.content_type)
+        if result.stream is not None:
+            response = StreamingHttpResponse(result.stream, content_type=result.content_type)
+        else:
+            response = HttpResponse(result.content, content_type=result.content_type)
         response['Content-Disposition'] = f'attachment; filename="{result.filename}"'
+        if result.watermark:
+            response['X-Export-Watermark'] = result.watermark
+        return response
+
+    # ── Asynchronous export jobs ─────────────────────────────────────────────
+
+    def _get_job(self, job_id) -> ExportJob:
+        """
+        Jobs are shared between users who request the same export (dedupe),
+        so a job is readable by whoever could have requested it: ADMIN+, its
+        requester, and staff with can_export on every purok in its stored
+        purok_ids (_build_filters always scopes staff jobs). Anyone else gets
+        404, as if the id did not exist. Jobs that include deleted records
+        stay ADMIN+ only.
+        """
+        try:
+            job = ExportJob.objects.get(pk=job_id)
+        except ExportJob.DoesNotExist:
+            raise NotFound('Export job not found.')
+        allowed = self._export_purok_ids()
+        if allowed is not None and job.requested_by_id != self.request.user.pk:
+            scope = job.filters.get('purok_ids')
+            if not scope or not set(scope) <= set(allowed):
+                raise NotFound('Export job not found.')
+        if job.filters.get('include_deleted') and self.request.user.role not in ('SUPER_ADMIN', 'ADMIN'):
+            raise PermissionDenied('Only admins can access exports of deleted records.')
+        return job
+
+    @action(detail=False, methods=['post'], url_path='jobs')
+    def create_job(self, request):
+        """
+        POST /reports/jobs/?entity_type=person&format=excel&survey_year=2024
+            Same query parameters as /reports/export/.
+
+        Queues the export and returns the job (202). An identical request
+        (same entity, format, filters, purok scope and data version) returns
+        the existing job instead (200).
+        """
+        self._check_export_permission()
+
+        try:
+            job, created = ExportJobService.request_export(
+                entity_type=request.query_params.get('entity_type', 'survey'),
+                fmt=request.query_params.get('format', 'csv').lower(),
+                filters=self._build_filters(request),
+                requested_by=request.user,
+            )
+        except ValueError as exc:
+            raise ValidationError({'detail': str(exc)})
+        except ImportError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return Response(
+            ExportJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=['get'], url_path=r'jobs/(?P<job_id>' + _UUID_RE + ')')
+    def job_status(self, request, job_id=None):
+        """GET /reports/jobs/{id}/ — status, progress, and expiry of an export job."""
+        self._check_export_permission()
+        return Response(ExportJobSerializer(self._get_job(job_id)).data)
+
+    @action(detail=False, methods=['get'], url_path=r'jobs/(?P<job_id>' + _UUID_RE + ')/download')
+    def job_download(self, request, job_id=None):
+        """GET /reports/jobs/{id}/download/ — the finished file."""
+        self._check_export_permission()
+        job = self._get_job(job_id)
+
+        if job.status == ExportJob.Status.EXPIRED:
+            return Response({'detail': 'This export has expired. Request it again.'},
+                            status=status.HTTP_410_GONE)
+        if job.status != ExportJob.Status.DONE:
+            return Response({'detail': f'Export is {job.status.lower()}, not ready for download.'},
+                            status=status.HTTP_409_CONFLICT)
+
+        response = FileResponse(
+            job.file.open('rb'),
+            as_attachment=True,
+            filename=job.filename,
+            content_type=job.content_type,
+        )
+        if job.watermark:
+            response['X-Export-Watermark'] = job.watermark.isoformat()
         return response
 
     @action(detail=False, methods=['post'], url_path='rebuild-normalized')
@@ -126,3 +126,11 @@ SIMPLE_JWT = {
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
 }
+
+# Serve dashboard aggregates (trend / concept-values / count) from in-memory
+# NumPy arrays instead of SQL. Only takes effect when numpy is installed.
+PROFILING_ANALYTICS_ENGINE = True
+
+# Processes rendering household profile sheets inside run_export_jobs.
+# None = one per CPU, at most 8.
+PROFILING_SHEET_WORKERS = None